@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test: run `main.app` against local fake upstreams (see
+benchmarks/fake_upstreams.py) and drive the A2A endpoint at a fixed
+concurrency. Reports throughput, end-to-end and per-node latency
+percentiles, and upstream call counts.
+
+    uv run python benchmarks/e2e_load.py --requests 500 --concurrency 32 --unique-trips 20
+    uv run python benchmarks/e2e_load.py --env ROUTE_PIPELINE=true --env FORECAST_SCHEDULER=true
+
+Settings for the app are passed with --env (and otherwise taken from the
+environment); upstream latency and error rates with the --google-*,
+--weather-* and --llm-* options. Per-node and per-call percentiles are
+interpolated from the app's /metrics histogram buckets, so they are
+approximate; end-to-end percentiles are exact. --json writes the report
+for comparing runs in CI.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+from fake_upstreams import add_upstream_args, upstream_argv
+from prometheus_client.parser import text_string_to_metric_families
+
+HERE = Path(__file__).resolve().parent
+
+CITY_PAIRS = [
+    ("Atlanta", "Nashville"), ("Chicago", "St. Louis"), ("Denver", "Salt Lake City"),
+    ("Dallas", "Houston"), ("Seattle", "Portland"), ("Boston", "New York"),
+    ("Phoenix", "Las Vegas"), ("Miami", "Orlando"), ("Austin", "San Antonio"),
+    ("Charlotte", "Raleigh"), ("Kansas City", "Omaha"), ("Memphis", "Little Rock"),
+    ("Detroit", "Cleveland"), ("Pittsburgh", "Philadelphia"), ("Albuquerque", "El Paso"),
+    ("Boise", "Spokane"), ("Tulsa", "Wichita"), ("Louisville", "Cincinnati"),
+    ("Richmond", "Baltimore"), ("Sacramento", "Reno"), ("Birmingham", "Jackson"),
+    ("Minneapolis", "Milwaukee"), ("Indianapolis", "Columbus"), ("Tampa", "Jacksonville"),
+    ("San Diego", "Los Angeles"), ("Portland", "Boise"), ("Des Moines", "Madison"),
+    ("Oklahoma City", "Amarillo"), ("Savannah", "Charleston"), ("Buffalo", "Albany"),
+]
+
+# Isolated, in-memory state so runs do not warm each other's caches
+APP_DEFAULTS = {
+    "CACHE_BACKEND": "memory",
+    "TASK_STORE": "memory",
+    "CHECKPOINTER": "memory",
+    "MOCK_WEATHER": "false",
+}
+
+NODE_HISTOGRAM = "weather_agent_node_duration_seconds"
+EXTERNAL_HISTOGRAM = "weather_agent_external_call_duration_seconds"
+
+
+def start(argv: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, *argv], env=env)
+
+
+async def wait_ready(client: httpx.AsyncClient, url: str, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{url} exited with code {proc.returncode}")
+        try:
+            if (await client.get(url)).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError(f"{url} did not become ready in {timeout}s")
+
+
+def histograms(
+    text: str, name: str, labels: Sequence[str]
+) -> Dict[Tuple[str, ...], Dict[float, float]]:
+    """Cumulative bucket counts of a histogram per value of `labels`."""
+    out: Dict[Tuple[str, ...], Dict[float, float]] = defaultdict(dict)
+    for family in text_string_to_metric_families(text):
+        if family.name != name:
+            continue
+        for sample in family.samples:
+            if sample.name.endswith("_bucket"):
+                key = tuple(sample.labels[label] for label in labels)
+                out[key][float(sample.labels["le"])] = sample.value
+    return out
+
+
+def bucket_quantile(q: float, buckets: Dict[float, float]) -> Optional[float]:
+    """Interpolate a quantile from cumulative buckets, like PromQL's histogram_quantile."""
+    bounds = sorted(buckets)
+    total = buckets[bounds[-1]] if bounds else 0
+    if not total:
+        return None
+    rank = q * total
+    lower, below = 0.0, 0.0
+    for bound in bounds:
+        count = buckets[bound]
+        if count >= rank:
+            if bound == float("inf"):
+                return lower
+            return lower + (bound - lower) * (rank - below) / max(count - below, 1e-9)
+        lower, below = bound, count
+    return lower
+
+
+def latency_table(
+    before: str, after: str, name: str, labels: Sequence[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Per label value: calls and p50/p95/p99 (ms) over the run."""
+    start_counts = histograms(before, name, labels)
+    table = {}
+    for key, buckets in histograms(after, name, labels).items():
+        base = start_counts.get(key, {})
+        delta = {le: count - base.get(le, 0.0) for le, count in buckets.items()}
+        calls = delta.get(float("inf"), 0.0)
+        if not calls:
+            continue
+        row: Dict[str, Any] = {"calls": int(calls)}
+        for q in (0.5, 0.95, 0.99):
+            value = bucket_quantile(q, delta)
+            row[f"p{int(q * 100)}_ms"] = None if value is None else round(value * 1e3, 1)
+        table[".".join(key)] = row
+    return table
+
+
+async def send(client: httpx.AsyncClient, url: str, text: str) -> str:
+    """One A2A message/send; returns the final task state (or the error kind)."""
+    payload = {
+        "jsonrpc": "2.0",
+        "id": str(uuid.uuid4()),
+        "method": "message/send",
+        "params": {
+            "message": {
+                "role": "user",
+                "parts": [{"kind": "text", "text": text}],
+                "messageId": str(uuid.uuid4()),
+            }
+        },
+    }
+    try:
+        resp = await client.post(url, json=payload)
+    except httpx.HTTPError as e:
+        return type(e).__name__
+    body = resp.json()
+    if "error" in body:
+        return "jsonrpc_error"
+    return body.get("result", {}).get("status", {}).get("state", "unknown")
+
+
+async def drive(
+    client: httpx.AsyncClient, url: str, texts: List[str], concurrency: int
+) -> Tuple[np.ndarray, Counter, float]:
+    """Send every message with `concurrency` workers; returns latencies (ms), outcomes and wall time."""
+    latencies = np.empty(len(texts))
+    outcomes: Counter = Counter()
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(texts):
+        queue.put_nowait(item)
+
+    async def worker() -> None:
+        while True:
+            try:
+                i, text = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            began = time.perf_counter()
+            outcomes[await send(client, url, text)] += 1
+            latencies[i] = (time.perf_counter() - began) * 1e3
+
+    began = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, outcomes, time.perf_counter() - began
+
+
+def print_table(title: str, table: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{title}")
+    print(f"  {'':<34}{'calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in sorted(table.items()):
+        cells = [row.get(k) for k in ("p50_ms", "p95_ms", "p99_ms")]
+        print(f"  {name:<34}{row['calls']:>8}" + "".join(f"{'-' if c is None else c:>10}" for c in cells))
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    fake_url = f"http://127.0.0.1:{args.fake_port}"
+    app_url = f"http://127.0.0.1:{args.app_port}"
+
+    env = {**os.environ}
+    for key, value in APP_DEFAULTS.items():
+        env.setdefault(key, value)
+    env.update(
+        GOOGLE_MAPS_API_KEY="AIzaFakeBenchmarkKey",
+        OPENWEATHER_API_KEY="fake",
+        OPENAI_API_KEY="fake",
+        GOOGLE_MAPS_BASE_URL=fake_url,
+        OPENWEATHER_BASE_URL=fake_url,
+        OPENAI_BASE_URL=f"{fake_url}/v1",
+    )
+    env.update(dict(kv.split("=", 1) for kv in args.env))
+
+    fakes = start([str(HERE / "fake_upstreams.py"), "--port", str(args.fake_port), *upstream_argv(args)], env)
+    app = start(
+        ["-m", "uvicorn", "weather_travel_agent.main:app", "--port", str(args.app_port), "--log-level", "warning"],
+        env,
+    )
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+            await wait_ready(client, f"{fake_url}/_stats", fakes)
+            await wait_ready(client, f"{app_url}/health", app)
+
+            pairs = CITY_PAIRS[: max(1, min(args.unique_trips, len(CITY_PAIRS)))]
+            texts = [f"from {o} to {d}" for o, d in pairs]
+            if args.warmup:
+                await drive(client, f"{app_url}/a2a/", texts[: args.warmup], args.concurrency)
+
+            await client.post(f"{fake_url}/_stats/reset")
+            before = (await client.get(f"{app_url}/metrics")).text
+            load = [texts[i % len(texts)] for i in range(args.requests)]
+            latencies, outcomes, wall = await drive(client, f"{app_url}/a2a/", load, args.concurrency)
+            after = (await client.get(f"{app_url}/metrics")).text
+            upstream = (await client.get(f"{fake_url}/_stats")).json()
+    finally:
+        for proc in (app, fakes):
+            proc.terminate()
+        for proc in (app, fakes):
+            proc.wait(timeout=10)
+
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "unique_trips": len(pairs),
+        "outcomes": dict(outcomes),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(args.requests / wall, 2),
+        "latency_ms": {
+            f"p{q}": round(float(np.percentile(latencies, q)), 1) for q in (50, 95, 99)
+        },
+        "nodes": latency_table(before, after, NODE_HISTOGRAM, ["node"]),
+        "external_calls": latency_table(before, after, EXTERNAL_HISTOGRAM, ["service", "operation"]),
+        "upstream": upstream,
+        "env": dict(kv.split("=", 1) for kv in args.env),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--unique-trips", type=int, default=10, help="Distinct city pairs cycled through")
+    parser.add_argument("--warmup", type=int, default=0, help="Distinct trips sent before measuring")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument("--app-port", type=int, default=8765)
+    parser.add_argument("--fake-port", type=int, default=9100)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="App setting (repeatable)")
+    parser.add_argument("--json", type=Path, help="Also write the report to this file")
+    add_upstream_args(parser)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    print(
+        f"{report['requests']} requests, concurrency {report['concurrency']}, "
+        f"{report['unique_trips']} distinct trips: {report['throughput_rps']} req/s"
+    )
+    print(f"outcomes: {report['outcomes']}")
+    lat = report["latency_ms"]
+    print(f"end-to-end latency: p50 {lat['p50']} ms, p95 {lat['p95']} ms, p99 {lat['p99']} ms")
+    print_table("per node", report["nodes"])
+    print_table("per external call", report["external_calls"])
+    print("\nupstream calls (errors injected):")
+    for endpoint, count in sorted(report["upstream"]["calls"].items()):
+        print(f"  {endpoint:<34}{count:>8} ({report['upstream']['errors'].get(endpoint, 0)})")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
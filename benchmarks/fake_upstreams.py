@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for Google Directions/Geocoding, OpenWeather One Call and an
+OpenAI-compatible chat endpoint, each with injected latency and error rate.
+Used by benchmarks/e2e_load.py; can also be run on its own:
+
+    uv run python benchmarks/fake_upstreams.py --port 9100 --google-latency-ms 80
+
+Responses are deterministic per input. Counters of calls and injected errors
+per endpoint are served on GET /_stats (and cleared by POST /_stats/reset).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from googlemaps.convert import encode_polyline
+
+
+@dataclass
+class Upstream:
+    """Injected behaviour of one fake service."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+
+@dataclass
+class LLMShape:
+    """Streaming shape of the fake chat completions."""
+
+    tokens: int = 60
+    token_ms: float = 5.0
+
+
+SUMMARY_WORDS = (
+    "Expect mostly clear skies along the route with a few clouds near the "
+    "midpoint and mild temperatures, so plan a comfortable stop for lunch."
+).split()
+SKIES = [("Clear", "clear sky"), ("Clouds", "scattered clouds"), ("Rain", "light rain")]
+TRIP = re.compile(r"(?:from\s+)?(.+?)\s+(?:to|->)\s+(.+?)[.?!]*$", re.IGNORECASE)
+
+
+def place_coords(name: str) -> Tuple[float, float]:
+    """Stable pseudo coordinates for a place name, within the continental US."""
+    digest = hashlib.md5(name.strip().lower().encode()).digest()
+    lat = 30.0 + digest[0] / 255 * 15.0
+    lon = -120.0 + digest[1] / 255 * 45.0
+    return lat, lon
+
+
+def miles(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 3958.8 * 2 * math.asin(math.sqrt(h))
+
+
+def route_points(origin: str, destination: str, step_deg: float = 0.02) -> List[Tuple[float, float]]:
+    """A gently winding line between the two places, one vertex every `step_deg`."""
+    a, b = place_coords(origin), place_coords(destination)
+    n = max(2, int(math.dist(a, b) / step_deg))
+    points = []
+    for i in range(n + 1):
+        t = i / n
+        wiggle = 0.15 * math.sin(t * math.pi * 6)
+        points.append((a[0] + (b[0] - a[0]) * t + wiggle, a[1] + (b[1] - a[1]) * t))
+    return points
+
+
+def directions_response(origin: str, destination: str) -> Dict[str, Any]:
+    points = route_points(origin, destination)
+    distance = miles(points[0], points[-1]) * 1.2
+    seconds = int(distance / 60 * 3600)
+    return {
+        "status": "OK",
+        "routes": [
+            {
+                "summary": "I-00",
+                "overview_polyline": {"points": encode_polyline(points)},
+                "legs": [
+                    {
+                        "start_address": origin,
+                        "end_address": destination,
+                        "distance": {"text": f"{distance:.0f} mi", "value": int(distance * 1609)},
+                        "duration": {
+                            "text": f"{seconds // 3600} hours {seconds % 3600 // 60} mins",
+                            "value": seconds,
+                        },
+                        "steps": [],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def reverse_geocode_response(lat: float, lon: float, county_deg: float = 0.4) -> Dict[str, Any]:
+    """One county per `county_deg` cell, so nearby points share a stop."""
+    county = f"County {int(lat // county_deg)}-{int(-lon // county_deg)}"
+    state = f"S{int(lat // 5)}{int(-lon // 5)}"
+    return {
+        "status": "OK",
+        "results": [
+            {
+                "address_components": [
+                    {"long_name": county, "short_name": county, "types": ["administrative_area_level_2", "political"]},
+                    {"long_name": state, "short_name": state, "types": ["administrative_area_level_1", "political"]},
+                    {"long_name": "United States", "short_name": "US", "types": ["country", "political"]},
+                ]
+            }
+        ],
+    }
+
+
+def onecall_response(lat: float, lon: float) -> Dict[str, Any]:
+    r = random.Random(f"{lat:.3f},{lon:.3f}")
+    daily = []
+    for _ in range(7):
+        high = r.uniform(55, 95)
+        main, description = r.choice(SKIES)
+        daily.append(
+            {
+                "temp": {"min": round(high - r.uniform(8, 18), 1), "max": round(high, 1)},
+                "weather": [{"main": main, "description": description}],
+            }
+        )
+    return {"lat": lat, "lon": lon, "daily": daily}
+
+
+def extract_trip(messages: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    text = next(
+        (m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), ""
+    )
+    match = TRIP.search(text.strip()) if isinstance(text, str) else None
+    if not match:
+        return {"origin": None, "destination": None}
+    return {"origin": match.group(1).strip(), "destination": match.group(2).strip()}
+
+
+def completion(model: str, message: Dict[str, Any], finish_reason: str) -> Dict[str, Any]:
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+    }
+
+
+def chunk(model: str, delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+    body = {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(body)}\n\n"
+
+
+def create_app(
+    google: Upstream, weather: Upstream, llm: Upstream, shape: LLMShape, seed: int = 7
+) -> FastAPI:
+    app = FastAPI(title="Fake upstreams")
+    calls: Counter = Counter()
+    errors: Counter = Counter()
+    rng = random.Random(seed)
+
+    async def serve(endpoint: str, upstream: Upstream) -> Optional[JSONResponse]:
+        """Wait the injected latency; return an error response if one is injected."""
+        calls[endpoint] += 1
+        delay = upstream.latency_ms + rng.uniform(-upstream.jitter_ms, upstream.jitter_ms)
+        await asyncio.sleep(max(0.0, delay) / 1000)
+        if rng.random() < upstream.error_rate:
+            errors[endpoint] += 1
+            return JSONResponse({"error": {"message": "injected failure"}}, status_code=503)
+        return None
+
+    @app.get("/_stats")
+    async def stats():
+        return {"calls": dict(calls), "errors": dict(errors)}
+
+    @app.post("/_stats/reset")
+    async def reset():
+        calls.clear()
+        errors.clear()
+        return {"ok": True}
+
+    @app.get("/maps/api/directions/json")
+    async def directions(origin: str, destination: str):
+        return await serve("google.directions", google) or directions_response(origin, destination)
+
+    @app.get("/maps/api/geocode/json")
+    async def geocode(latlng: str):
+        lat, lon = (float(v) for v in latlng.split(","))
+        return await serve("google.reverse_geocode", google) or reverse_geocode_response(lat, lon)
+
+    @app.get("/data/3.0/onecall")
+    async def onecall(lat: float, lon: float):
+        return await serve("openweather.onecall", weather) or onecall_response(lat, lon)
+
+    @app.post("/v1/chat/completions")
+    async def chat(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+        endpoint = "openai.stream" if body.get("stream") else "openai.chat"
+        failed = await serve(endpoint, llm)
+        if failed is not None:
+            return failed
+
+        if body.get("tools"):
+            args = extract_trip(body.get("messages", []))
+            if not args["origin"] or not args["destination"]:
+                message = {"role": "assistant", "content": "Where are you starting from and headed to?"}
+                return completion(model, message, "stop")
+            call = {
+                "id": "call_fake",
+                "type": "function",
+                "function": {"name": "extract_places", "arguments": json.dumps(args)},
+            }
+            return completion(model, {"role": "assistant", "content": "", "tool_calls": [call]}, "tool_calls")
+
+        words = [SUMMARY_WORDS[i % len(SUMMARY_WORDS)] for i in range(shape.tokens)]
+        if not body.get("stream"):
+            return completion(model, {"role": "assistant", "content": " ".join(words)}, "stop")
+
+        async def events():
+            yield chunk(model, {"role": "assistant", "content": ""})
+            for i, word in enumerate(words):
+                await asyncio.sleep(shape.token_ms / 1000)
+                yield chunk(model, {"content": word if i == 0 else f" {word}"})
+            yield chunk(model, {}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def add_upstream_args(parser: argparse.ArgumentParser) -> None:
+    """Latency and error options, shared with the load driver."""
+    for name, latency in (("google", 80.0), ("weather", 120.0), ("llm", 400.0)):
+        parser.add_argument(f"--{name}-latency-ms", type=float, default=latency)
+        parser.add_argument(f"--{name}-jitter-ms", type=float, default=latency / 4)
+        parser.add_argument(f"--{name}-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-tokens", type=int, default=60, help="Tokens per streamed summary")
+    parser.add_argument("--llm-token-ms", type=float, default=5.0, help="Delay between streamed tokens")
+
+
+def upstream_argv(args: argparse.Namespace) -> List[str]:
+    """The upstream options of `args` as command line arguments for this script."""
+    argv = []
+    for name in ("google", "weather", "llm"):
+        for field in ("latency_ms", "jitter_ms", "error_rate"):
+            argv += [f"--{name}-{field.replace('_', '-')}", str(getattr(args, f"{name}_{field}"))]
+    return argv + ["--llm-tokens", str(args.llm_tokens), "--llm-token-ms", str(args.llm_token_ms)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    add_upstream_args(parser)
+    args = parser.parse_args()
+
+    def upstream(name: str) -> Upstream:
+        return Upstream(
+            getattr(args, f"{name}_latency_ms"),
+            getattr(args, f"{name}_jitter_ms"),
+            getattr(args, f"{name}_error_rate"),
+        )
+
+    app = create_app(
+        upstream("google"),
+        upstream("weather"),
+        upstream("llm"),
+        LLMShape(args.llm_tokens, args.llm_token_ms),
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare GatherTripNode latency on the rule-based fast path against the LLM
+path, using a fake LLM with a fixed injected latency.
+
+    uv run python benchmarks/gather_trip.py --llm-latency-ms 600 --requests 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+import numpy as np
+
+os.environ.setdefault("GATHER_CACHE_ENABLED", "false")
+
+from weather_travel_agent.agent.nodes.gather_trip import GatherTripNode  # noqa: E402
+
+SIMPLE = [
+    "Chicago to Nashville",
+    "from Atlanta, GA to Nashville, TN",
+    "I'd like to drive from St. Louis to Kansas City",
+    "Denver -> Salt Lake City",
+]
+FREE_FORM = [
+    "What's the weather looking like if I head down to Nashville from Chicago?",
+    "Thinking about Atlanta, maybe leaving from Birmingham",
+]
+
+
+class FakeLLM:
+    """Stands in for the tool-bound chat model with a fixed response time."""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(self.latency_s)
+        resp = MagicMock()
+        resp.tool_calls = [
+            {"name": "extract_places", "args": {"origin": "Chicago", "destination": "Nashville"}}
+        ]
+        resp.content = ""
+        return resp
+
+
+async def timings_ms(
+    node: GatherTripNode, messages: List[str], requests: int
+) -> np.ndarray:
+    out = np.empty(requests)
+    for i in range(requests):
+        start = time.perf_counter()
+        await node({"user_input": messages[i % len(messages)]})
+        out[i] = (time.perf_counter() - start) * 1e3
+    return out
+
+
+async def run(llm_latency_ms: float, requests: int) -> None:
+    node = GatherTripNode(llm=FakeLLM(llm_latency_ms / 1e3))
+    if node.parser is None:
+        raise SystemExit("GATHER_RULES_ENABLED is off; nothing to compare")
+
+    paths = {"rule": SIMPLE, "llm": FREE_FORM}
+    print(f"{'path':>6} {'requests':>9} {'p50 ms':>10} {'p95 ms':>10}")
+    for path, messages in paths.items():
+        assert (await node({"user_input": messages[0]}))["gather_path"] == path
+        t = await timings_ms(node, messages, requests)
+        p50, p95 = np.percentile(t, [50, 95])
+        print(f"{path:>6} {requests:>9} {p50:>10.3f} {p95:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--llm-latency-ms", type=float, default=600.0)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.llm_latency_ms, args.requests))
+
+
+if __name__ == "__main__":
+    main()
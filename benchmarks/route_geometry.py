@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Compare the vectorized route sampler against the original geopy loop on long
+synthetic routes.
+
+    uv run python benchmarks/route_geometry.py --vertices 1000 10000 50000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+import geopy.distance
+import numpy as np
+
+from weather_travel_agent.geo.route import sample_along
+
+
+def synthetic_route(n: int, seed: int = 7) -> List[Tuple[float, float]]:
+    """Random-walk a route roughly from Los Angeles to New York with n vertices."""
+    rng = np.random.default_rng(seed)
+    start, end = np.array([34.05, -118.24]), np.array([40.71, -74.01])
+    t = np.linspace(0.0, 1.0, n)[:, None]
+    jitter = np.cumsum(rng.normal(0.0, 0.01, size=(n, 2)), axis=0)
+    jitter -= t * jitter[-1]  # pin both ends
+    pts = start + (end - start) * t + jitter
+    return [(lat, lon) for lat, lon in pts.tolist()]
+
+
+def geopy_loop(
+    coords: List[Tuple[float, float]], km_interval: int, max_stops: int
+) -> List[Tuple[float, float]]:
+    """The original ExtractCitiesNode.sample_evenly implementation."""
+    cumulative = [0.0]
+    for i in range(1, len(coords)):
+        d = geopy.distance.distance(coords[i - 1], coords[i]).km
+        cumulative.append(cumulative[-1] + d)
+
+    total_dist = cumulative[-1]
+    if total_dist == 0:
+        return [coords[0]]
+
+    num_stops = min(max_stops, max(2, int(total_dist // km_interval) + 1))
+    targets = [i * total_dist / (num_stops - 1) for i in range(num_stops)]
+
+    sampled = []
+    j = 0
+    for t in targets:
+        while j < len(cumulative) and cumulative[j] < t:
+            j += 1
+        sampled.append(coords[min(j, len(coords) - 1)])
+    return sampled
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def max_offset_km(a, b) -> float:
+    """Largest distance between paired samples; the loop snaps to vertices, we interpolate."""
+    return max(geopy.distance.distance(p, q).km for p, q in zip(a, b, strict=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vertices", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--km-interval", type=int, default=5)
+    parser.add_argument("--max-stops", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'vertices':>9} {'impl':>12} {'best ms':>10} {'speedup':>8} {'max offset km':>14}")
+    for n in args.vertices:
+        coords = synthetic_route(n)
+        base_t, base = best_of(
+            lambda c=coords: geopy_loop(c, args.km_interval, args.max_stops), args.repeat
+        )
+        print(f"{n:>9} {'geopy loop':>12} {base_t * 1e3:>10.2f} {'1.0x':>8} {'-':>14}")
+
+        for mode in ("ellipsoidal", "haversine"):
+            t, sampled = best_of(
+                lambda c=coords, m=mode: sample_along(
+                    c, args.km_interval, args.max_stops, mode=m
+                ),
+                args.repeat,
+            )
+            offset = max_offset_km(base, sampled.tolist())
+            print(
+                f"{n:>9} {mode:>12} {t * 1e3:>10.2f} {base_t / t:>7.1f}x {offset:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
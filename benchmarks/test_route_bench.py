@@ -0,0 +1,144 @@
+"""
+pytest-benchmark suite for the per-request CPU path of stop extraction:
+polyline decoding, cumulative distance, sampling and dedupe, on synthetic
+routes from 100 to 500k vertices. Each case also records its tracemalloc
+peak in `extra_info["peak_kib"]` (shown in --benchmark-json output).
+
+    uv run pytest benchmarks/test_route_bench.py --benchmark-group-by=group
+    uv run pytest benchmarks/test_route_bench.py --benchmark-autosave
+    uv run pytest benchmarks/test_route_bench.py --benchmark-compare --benchmark-compare-fail=mean:15%
+
+Baselines that call geopy per segment are only run up to 10k vertices.
+"""
+from __future__ import annotations
+
+import tracemalloc
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+import pytest
+from googlemaps import convert
+from route_geometry import geopy_loop, synthetic_route
+
+from weather_travel_agent.geo.geocoder import Place, first_per_place
+from weather_travel_agent.geo.route import (
+    cumulative_distances,
+    decode_polyline,
+    sample_along,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+SIZES = [100, 1_000, 10_000, 100_000, 500_000]
+SLOW_MAX = 10_000
+KM_INTERVAL = 5
+MAX_STOPS = 30
+
+
+@lru_cache(maxsize=None)
+def route(n: int) -> List[Tuple[float, float]]:
+    # Rounded to the polyline's precision so both decoders see the same input
+    return [(round(lat, 5), round(lon, 5)) for lat, lon in synthetic_route(n)]
+
+
+@lru_cache(maxsize=None)
+def encoded(n: int) -> str:
+    return convert.encode_polyline(route(n))
+
+
+@lru_cache(maxsize=None)
+def places(n: int) -> List[Place]:
+    """One place per ~0.4 degree cell, as counties come back from the geocoder."""
+    return [
+        Place(f"County {int(lat // 0.4)}:{int(lon // 0.4)}", state="ST", country="US")
+        for lat, lon in route(n)
+    ]
+
+
+def run(benchmark, fn: Callable[[], Any]) -> Any:
+    """Benchmark `fn` and record the peak memory of one extra call."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_kib"] = round(peak / 1024, 1)
+    return benchmark(fn)
+
+
+def skip_slow(n: int) -> None:
+    if n > SLOW_MAX:
+        pytest.skip(f"per-segment geopy baseline is only run up to {SLOW_MAX} vertices")
+
+
+def googlemaps_decode(polyline: str) -> List[Tuple[float, float]]:
+    """The original decode path: googlemaps dicts, then a list of tuples."""
+    return [(p["lat"], p["lng"]) for p in convert.decode_polyline(polyline)]
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("impl", ["googlemaps", "numpy"])
+def test_decode(benchmark, n, impl):
+    benchmark.group = f"decode n={n}"
+    polyline = encoded(n)
+    decode = googlemaps_decode if impl == "googlemaps" else decode_polyline
+
+    result = run(benchmark, lambda: decode(polyline))
+
+    assert len(result) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("mode", ["haversine", "ellipsoidal", "geodesic"])
+def test_cumulative_distance(benchmark, n, mode):
+    if mode == "geodesic":
+        skip_slow(n)
+    benchmark.group = f"distance n={n}"
+    pts = np.asarray(route(n))
+
+    result = run(benchmark, lambda: cumulative_distances(pts, mode))
+
+    assert result.shape == (n,)
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("impl", ["geopy_loop", "sample_along"])
+def test_sampling(benchmark, n, impl):
+    if impl == "geopy_loop":
+        skip_slow(n)
+    benchmark.group = f"sample n={n}"
+    coords = route(n)
+    pts = np.asarray(coords)
+
+    if impl == "geopy_loop":
+        result = run(benchmark, lambda: geopy_loop(coords, KM_INTERVAL, MAX_STOPS))
+    else:
+        result = run(benchmark, lambda: sample_along(pts, KM_INTERVAL, MAX_STOPS))
+
+    assert 1 <= len(result) <= MAX_STOPS
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_dedupe(benchmark, n):
+    benchmark.group = f"dedupe n={n}"
+    coords, resolved = route(n), places(n)
+
+    # No cutoff, so every point is visited
+    result = run(benchmark, lambda: first_per_place(coords, resolved, max_stops=n))
+
+    assert 0 < len(result) <= n
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("impl", ["googlemaps+tuples", "numpy"])
+def test_route_points(benchmark, n, impl):
+    """Decode then sample, as ExtractCitiesNode.route_points does per request."""
+    benchmark.group = f"route_points n={n}"
+    polyline = encoded(n)
+    decode = googlemaps_decode if impl == "googlemaps+tuples" else decode_polyline
+
+    result = run(benchmark, lambda: sample_along(decode(polyline), KM_INTERVAL, MAX_STOPS))
+
+    assert 1 <= len(result) <= MAX_STOPS
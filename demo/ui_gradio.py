@@ -135,7 +135,8 @@ async def _call_a2a(message: str, context_id: Optional[str]) -> Tuple[str, Optio
         resp = r.json()
 
     result = resp.get("result", {})
-    parts = result.get("parts", [])
+    # Results come back as a task whose final status message holds the reply
+    parts = result.get("parts") or ((result.get("status") or {}).get("message") or {}).get("parts", [])
     reply_text, data_part = "", None
     for p in parts:
         if p.get("kind") == "text" and not reply_text:
@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Optional
+
+import aiosqlite
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from weather_travel_agent.models.config import settings
+
+# Seconds a worker waits on another worker's write lock before failing
+SQLITE_BUSY_TIMEOUT_S = 30.0
+
+
+async def open_checkpointer() -> Optional[BaseCheckpointSaver]:
+    """
+    Build the checkpointer selected by settings.checkpointer. The sqlite saver
+    is tied to the running event loop, so this runs at app startup.
+    """
+    if settings.checkpointer == "none":
+        return None
+    if settings.checkpointer == "memory":
+        return InMemorySaver()
+
+    path = settings.checkpoint_path
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    # WAL (set up by the saver) lets workers read while another one writes
+    saver = AsyncSqliteSaver(
+        await aiosqlite.connect(path, timeout=SQLITE_BUSY_TIMEOUT_S)
+    )
+    await saver.setup()
+    return saver
+
+
+async def close_checkpointer(checkpointer: Optional[BaseCheckpointSaver]) -> None:
+    if isinstance(checkpointer, AsyncSqliteSaver):
+        await checkpointer.conn.close()
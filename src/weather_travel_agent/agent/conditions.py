@@ -11,3 +11,9 @@ def should_continue_after_gather(state: TripState) -> str:
 # Conditional routing from directions
 def cont_after_directions(state: TripState) -> str:
     return "extract_cities" if not state.get("need") else END
+
+
+# Conditional routing from the hot route index
+def cont_after_hot_route(state: TripState) -> str:
+    # A precomputed summary completes the trip
+    return END if state.get("hot_route") and state.get("reply") else "get_directions"
@@ -0,0 +1,135 @@
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from weather_travel_agent.agent.trips import normalize_text
+from weather_travel_agent.cache.backends import CacheBackend
+from weather_travel_agent.cache.memory import MISSING, TTLCache
+from weather_travel_agent.cache.stats import cache_stats
+
+# (origin, destination, reply) as returned by GatherTripNode.extract_places_from_text
+Extraction = Tuple[Optional[str], Optional[str], Optional[str]]
+
+NAMESPACE = "gather_trip"
+
+
+def embed(text: str, dims: int = 512) -> np.ndarray:
+    """Cheap local embedding: hashed character trigram counts, L2 normalized."""
+    padded = f" {text} "
+    vec = np.zeros(dims, dtype=np.float32)
+    for i in range(len(padded) - 2):
+        vec[zlib.crc32(padded[i : i + 3].encode()) % dims] += 1.0
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+class ExtractionCache:
+    """
+    Cache of LLM trip extractions keyed on the normalized message text.
+
+    With a `semantic_threshold`, a miss falls back to the most similar cached
+    message by trigram embedding. A similar match is only reused when its
+    origin and destination both appear in the new message in that order, so
+    "Chicago to Nashville" never answers "Chicago to Memphis" or "Nashville
+    to Chicago".
+
+    With a shared `backend`, exact-key misses are looked up there (under the
+    `gather_trip` namespace) and new extractions are written back, so every
+    worker process benefits. Semantic matching stays in-process.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1_000,
+        ttl: float = 24 * 3600,
+        semantic_threshold: Optional[float] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.ttl = ttl
+        self.stats = cache_stats(NAMESPACE)
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl, stats=self.stats)
+        self.semantic_threshold = semantic_threshold
+        self.backend = backend
+        self._vectors: Dict[str, np.ndarray] = {}
+        # Keys and stacked vectors, rebuilt when the vectors change
+        self._stacked: Optional[Tuple[List[str], np.ndarray]] = None
+
+    def _matrix(self) -> Tuple[List[str], np.ndarray]:
+        if self._stacked is None:
+            keys = list(self._vectors)
+            self._stacked = (keys, np.stack([self._vectors[k] for k in keys]))
+        return self._stacked
+
+    def _forget(self, key: str) -> None:
+        del self._vectors[key]
+        self._stacked = None
+
+    def _semantic_match(self, key: str) -> Optional[Extraction]:
+        if not self._vectors:
+            return None
+
+        keys, matrix = self._matrix()
+        scores = matrix @ embed(key)
+        # Best match first; peek so lookups don't reorder the LRU
+        for i in np.argsort(-scores):
+            if scores[i] < self.semantic_threshold:
+                return None
+            value = self.memory.peek(keys[i])
+            if value is MISSING:
+                # Expired or evicted since it was embedded
+                self._forget(keys[i])
+                continue
+            return self._reusable(key, value)
+        return None
+
+    @staticmethod
+    def _reusable(key: str, value: Extraction) -> Optional[Extraction]:
+        """`value` if its origin and destination appear in `key`, in that order."""
+        origin, destination, reply = value
+        if not origin or not destination:
+            return None
+        start = key.find(normalize_text(origin))
+        end = key.rfind(normalize_text(destination))
+        if start < 0 or end < 0 or start >= end:
+            return None
+        return origin, destination, reply
+
+    async def get(self, text: str) -> Optional[Extraction]:
+        key = normalize_text(text)
+        value = self.memory.get(key)
+        if value is not MISSING:
+            self.stats.hit("exact")
+            return value
+
+        if self.backend is not None:
+            shared = await self.backend.get(NAMESPACE, key)
+            if shared is not MISSING:
+                self.stats.hit("shared")
+                value = tuple(shared)
+                self._remember(key, value)
+                return value
+
+        if self.semantic_threshold is not None:
+            match = self._semantic_match(key)
+            if match is not None:
+                self.stats.hit("semantic")
+                return match
+
+        self.stats.miss()
+        return None
+
+    async def set(self, text: str, value: Extraction) -> None:
+        key = normalize_text(text)
+        self._remember(key, value)
+        if self.backend is not None:
+            await self.backend.set(NAMESPACE, key, list(value), self.ttl)
+
+    def _remember(self, key: str, value: Extraction) -> None:
+        self.memory.set(key, value)
+        if self.semantic_threshold is not None:
+            self._vectors[key] = embed(key)
+            self._stacked = None
+            if len(self._vectors) > 2 * self.memory.maxsize:
+                for k in [k for k in self._vectors if self.memory.peek(k) is MISSING]:
+                    self._forget(k)
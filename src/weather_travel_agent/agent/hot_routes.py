@@ -0,0 +1,171 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from weather_travel_agent.agent.planner import TripPlanner
+from weather_travel_agent.agent.trips import trip_key
+from weather_travel_agent.cache.stats import register_stats
+
+
+def load_hot_routes(path: str) -> List[Tuple[str, str]]:
+    """Read `[{"origin": ..., "destination": ...}, ...]` from a JSON file."""
+    with Path(path).open(encoding="utf-8") as f:
+        return [(r["origin"], r["destination"]) for r in json.load(f)]
+
+
+@dataclass
+class HotRoute:
+    """Precomputed results for one corridor."""
+
+    origin: str
+    destination: str
+    route: Optional[dict[str, Any]] = None
+    stops: Optional[List[dict[str, Any]]] = None
+    forecasts: Optional[List[dict[str, Any]]] = None
+    reply: Optional[str] = None
+    refreshed_at: Optional[float] = None
+    refreshes: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+    last_duration_s: Optional[float] = None
+
+    def age(self, now: Optional[float] = None) -> Optional[float]:
+        if self.refreshed_at is None:
+            return None
+        return (now or time.time()) - self.refreshed_at
+
+
+@dataclass
+class HotRouteIndex:
+    """In-memory index of hot corridors by normalized trip key."""
+
+    max_age: float
+    routes: Dict[str, HotRoute] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+
+    def __post_init__(self) -> None:
+        register_stats("hot_routes", self)
+
+    def add(self, origin: str, destination: str) -> HotRoute:
+        return self.routes.setdefault(
+            trip_key(origin, destination), HotRoute(origin, destination)
+        )
+
+    def get(self, origin: str, destination: str) -> Optional[HotRoute]:
+        """The corridor's results if it is indexed and fresh enough to serve."""
+        entry = self.routes.get(trip_key(origin, destination))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        age = entry.age()
+        if age is None or age > self.max_age:
+            self.stale += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def as_dict(self) -> Dict[str, Any]:
+        now = time.time()
+        ages = [e.age(now) for e in self.routes.values()]
+        known = [a for a in ages if a is not None]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "routes": len(self.routes),
+            "max_age_s": round(max(known), 1) if known else None,
+            "never_refreshed": len(ages) - len(known),
+            "by_route": {
+                key: {
+                    "age_s": None if e.refreshed_at is None else round(e.age(now), 1),
+                    "refreshes": e.refreshes,
+                    "failures": e.failures,
+                    "last_error": e.last_error,
+                    "last_duration_s": e.last_duration_s,
+                }
+                for key, e in self.routes.items()
+            },
+        }
+
+
+class HotRouteRefresher:
+    """
+    Background scheduler that recomputes every indexed corridor each
+    `interval` seconds by running the regular pipeline stages (directions,
+    stops and forecasts, and optionally the summary) outside of a request.
+    """
+
+    def __init__(
+        self,
+        index: HotRouteIndex,
+        planner: TripPlanner,
+        interval: float,
+        concurrency: int = 2,
+        summarize: bool = False,
+    ):
+        self.index = index
+        self.planner = planner
+        self.interval = interval
+        self.summarize = summarize
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self._task: Optional[asyncio.Task] = None
+
+    async def refresh(self, entry: HotRoute) -> None:
+        """Recompute one corridor, keeping the previous results if it fails."""
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                state = await self.planner.plan(
+                    entry.origin, entry.destination, summarize=self.summarize
+                )
+            except Exception as e:
+                entry.failures += 1
+                entry.last_error = str(e)
+                print(
+                    f"Hot route refresh failed for {entry.origin} -> {entry.destination}: {e}"
+                )
+                return
+            finally:
+                entry.last_duration_s = round(time.perf_counter() - start, 3)
+
+            # Forecasts still pending at the deadline are not worth serving
+            if any(f.get("pending") for f in state.get("forecasts") or []):
+                entry.failures += 1
+                entry.last_error = "forecasts pending"
+                return
+
+            entry.route = state.get("route")
+            entry.stops = state.get("stops")
+            entry.forecasts = state.get("forecasts")
+            entry.reply = state.get("reply")
+            entry.refreshed_at = time.time()
+            entry.refreshes += 1
+            entry.last_error = None
+
+    async def refresh_all(self) -> None:
+        await asyncio.gather(*(self.refresh(e) for e in self.index.routes.values()))
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh_all()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
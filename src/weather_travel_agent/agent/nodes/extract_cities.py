@@ -1,128 +1,138 @@
-from typing import Any, List, Tuple
-import googlemaps
-from googlemaps import convert
-import geopy.distance
+from typing import Any, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from weather_travel_agent.agent.prefetch import WeatherPrefetcher
 from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.cache.backends import get_cache_backend
+from weather_travel_agent.clients.google_maps import create_gmaps_client
+from weather_travel_agent.geo.boundaries import OfflineReverseGeocoder
+from weather_travel_agent.geo.geocode_cache import CachedReverseGeocoder
+from weather_travel_agent.geo.geocoder import (
+    FallbackReverseGeocoder,
+    GoogleReverseGeocoder,
+    ReverseGeocoder,
+    first_per_place,
+    reverse_geocode_all,
+    shutdown_geocoder,
+)
+from weather_travel_agent.geo.route import (
+    DistanceMode,
+    decode_polyline,
+    sample_along,
+    to_tuples,
+)
 from weather_travel_agent.models.config import settings
 
 
 class ExtractCitiesNode:
-
-    def __init__(self, gmaps_client=None):
-        self.gmaps_client = gmaps_client or googlemaps.Client(
-            key=settings.google_maps_api_key
+    def __init__(
+        self,
+        gmaps_client=None,
+        geocoder: Optional[ReverseGeocoder] = None,
+        prefetcher: Optional[WeatherPrefetcher] = None,
+    ):
+        self.geocoder = geocoder or self._default_geocoder(gmaps_client)
+        # Speculative weather for sampled points, claimed by GetWeatherNode
+        self.prefetcher = prefetcher
+
+    async def shutdown(self) -> None:
+        await shutdown_geocoder(self.geocoder)
+
+    def _default_geocoder(self, gmaps_client=None) -> ReverseGeocoder:
+        """Build the geocoder selected by settings.geocoder."""
+        if settings.geocoder == "offline":
+            return OfflineReverseGeocoder(settings.boundaries_path)
+
+        gmaps_client = gmaps_client or create_gmaps_client(
+            pool_size=settings.geocode_concurrency,
+            timeout=settings.geocode_timeout_s,
         )
+        geocoder: ReverseGeocoder = GoogleReverseGeocoder(
+            gmaps_client, max_workers=settings.geocode_concurrency
+        )
+        if settings.geocode_cache_enabled:
+            geocoder = CachedReverseGeocoder(
+                geocoder,
+                precision=settings.geocode_cache_precision,
+                ttl=settings.geocode_cache_ttl_s,
+                maxsize=settings.geocode_cache_size,
+                backend=get_cache_backend() if settings.geocode_cache_shared else None,
+                min_neighbours=settings.geocode_cache_neighbours,
+            )
+
+        if settings.geocoder == "offline_fallback":
+            return FallbackReverseGeocoder(
+                OfflineReverseGeocoder(settings.boundaries_path), geocoder
+            )
+        return geocoder
 
     def sample_evenly(
-        self, coords: List[Tuple[float, float]], km_interval: int, max_stops: int
+        self,
+        coords: Sequence[Tuple[float, float]] | np.ndarray,
+        km_interval: int,
+        max_stops: int,
+        mode: Optional[DistanceMode] = None,
     ) -> List[Tuple[float, float]]:
         """Spread stops evenly across the full route length."""
-        if not coords:
+        if len(coords) == 0:
             return []
 
-        # Compute cumulative distances along the route
-        cumulative = [0.0]
-        for i in range(1, len(coords)):
-            d = geopy.distance.distance(coords[i - 1], coords[i]).km
-            cumulative.append(cumulative[-1] + d)
-
-        total_dist = cumulative[-1]
-        if total_dist == 0:
-            return [coords[0]]
-
-        # Decide number of stops
-        num_stops = min(max_stops, max(2, int(total_dist // km_interval) + 1))
-
-        # Target distances spaced evenly
-        targets = [i * total_dist / (num_stops - 1) for i in range(num_stops)]
-
-        sampled = []
-        j = 0
-        for t in targets:
-            # Find the first point where cumulative distance >= target
-            while j < len(cumulative) and cumulative[j] < t:
-                j += 1
-            sampled.append(coords[min(j, len(coords) - 1)])
+        sampled = sample_along(
+            coords, km_interval, max_stops, mode=mode or settings.distance_mode
+        )
+        return to_tuples(sampled)
+
+    async def resolve_stops(
+        self, coords: List[Tuple[float, float]]
+    ) -> List[dict[str, Any]]:
+        """Reverse geocode sampled points and keep the first point per county."""
+        places = await reverse_geocode_all(
+            self.geocoder,
+            coords,
+            concurrency=settings.geocode_concurrency,
+            timeout=settings.geocode_timeout_s,
+        )
 
-        return sampled
+        return first_per_place(coords, places, settings.max_stops)
 
-    def __call__(self, state: TripState) -> TripState:
-        overview = state["route"].get("overview_polyline", {}).get("points")
+    def route_points(
+        self, route: dict[str, Any]
+    ) -> Optional[List[Tuple[float, float]]]:
+        """Decode the route polyline and sample it evenly, or None without a polyline."""
+        overview = route.get("overview_polyline", {}).get("points")
         if not overview:
-            return {"need": "Route polyline missing; cannot extract stops."}
+            return None
 
-        # Decode polyline
-        pts = convert.decode_polyline(overview)
-        coords = [(p["lat"], p["lng"]) for p in pts]
+        # Decode straight into an array; no per-vertex dicts or tuples
+        coords = decode_polyline(overview)
 
         # Evenly spread across full route
-        coords = self.sample_evenly(
+        return self.sample_evenly(
             coords,
             km_interval=settings.sample_km_interval,
             max_stops=settings.max_stops,
         )
 
-        stops: List[dict[str, Any]] = []
-        seen = set()
-
-        for lat, lon in coords:
-            rev = (
-                self.gmaps_client.reverse_geocode(
-                    (lat, lon),
-                    result_type="administrative_area_level_2|locality|administrative_area_level_3|sublocality",
-                )
-                or []
-            )
-
-            if not rev:
-                continue
-
-            comp = rev[0].get("address_components", [])
-            county = next(
-                (
-                    c
-                    for c in comp
-                    if "administrative_area_level_2" in c.get("types", [])
-                ),
-                None,
-            )
-            locality = next((c for c in comp if "locality" in c.get("types", [])), None)
-            admin1 = next(
-                (
-                    c
-                    for c in comp
-                    if "administrative_area_level_1" in c.get("types", [])
-                ),
-                None,
-            )
-            country = next((c for c in comp if "country" in c.get("types", [])), None)
-
-            primary = county or locality
-            if not primary:
-                continue
-
-            state_short = (admin1 or {}).get("short_name")
-            country_short = (country or {}).get("short_name")
-
-            name_parts = [primary.get("long_name"), state_short, country_short]
-            name = ", ".join([p for p in name_parts if p])
+    async def __call__(self, state: TripState) -> TripState:
+        if state.get("stops"):
+            # Same trip as an earlier turn of the conversation
+            return {"stops": state["stops"]}
 
-            # avoid state only strings slipping through
-            if name in {
-                f"{state_short}, {country_short}",
-                f"{state_short or ''}{', ' if state_short and country_short else ''}{country_short or ''}",
-            }:
-                continue
-
-            dedupe_key = (primary.get("long_name"), state_short)
-            if dedupe_key in seen:
-                continue
+        coords = self.route_points(state["route"])
+        if coords is None:
+            return {"need": "Route polyline missing; cannot extract stops."}
 
-            seen.add(dedupe_key)
-            stops.append({"name": name, "lat": lat, "lon": lon})
+        if self.prefetcher is None:
+            return {"stops": await self.resolve_stops(coords)}
 
-            if len(stops) >= settings.max_stops:
-                break
+        # Weather only needs coordinates, so start it alongside geocoding
+        self.prefetcher.start(coords)
+        stops: List[dict[str, Any]] = []
+        try:
+            stops = await self.resolve_stops(coords)
+        finally:
+            kept = {(s["lat"], s["lon"]) for s in stops}
+            self.prefetcher.discard(c for c in coords if c not in kept)
 
         return {"stops": stops}
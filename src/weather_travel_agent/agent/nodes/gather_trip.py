@@ -5,7 +5,12 @@ from langchain_core.messages.system import SystemMessage
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 
+from weather_travel_agent.agent.extraction_cache import ExtractionCache
+from weather_travel_agent.agent.trip_parser import TripParser, load_gazetteer
+from weather_travel_agent.agent.trips import trip_key
 from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.cache.backends import get_cache_backend
+from weather_travel_agent.clients.llm import ainvoke_with_retry
 from weather_travel_agent.models.config import settings
 
 
@@ -21,17 +26,77 @@ def extract_places(
 class GatherTripNode:
     """Node for gathering trip information from user input."""
 
-    def __init__(self):
-        if not settings.openai_api_key:
-            raise ValueError("Missing OpenAI API key")
+    def __init__(self, llm=None):
+        if llm is None:
+            if not settings.openai_api_key:
+                raise ValueError("Missing OpenAI API key")
+
+            llm = ChatOpenAI(
+                model=settings.openai_model,
+                temperature=0.2,
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url,
+                # Timeouts and retries are handled per call by ainvoke_with_retry
+                max_retries=0,
+            ).bind_tools([extract_places])
+        self.llm = llm
+
+        self.parser = (
+            TripParser(
+                load_gazetteer(settings.gazetteer_path)
+                if settings.gazetteer_path
+                else None
+            )
+            if settings.gather_rules_enabled
+            else None
+        )
+
+        self.cache = (
+            ExtractionCache(
+                maxsize=settings.gather_cache_size,
+                ttl=settings.gather_cache_ttl_s,
+                semantic_threshold=settings.gather_cache_semantic_threshold,
+                backend=get_cache_backend() if settings.gather_cache_shared else None,
+            )
+            if settings.gather_cache_enabled
+            else None
+        )
 
-        self.llm = ChatOpenAI(
-            model=settings.openai_model,
-            temperature=0.2,
-            api_key=settings.openai_api_key,
-        ).bind_tools([extract_places])
+    async def extract_places_from_text(
+        self, text: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Extract origin and destination. Returns (origin, destination, reply).
+        """
+        origin, destination, reply, _ = await self._extract(text)
+        return origin, destination, reply
 
-    def extract_places_from_text(
+    async def _extract(
+        self, text: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
+        """
+        Try the rule parser first, then the cache for messages seen before
+        (or, optionally, very similar ones), then the LLM.
+        Returns (origin, destination, reply, path).
+        """
+        if self.parser is not None:
+            parsed = self.parser.parse(text)
+            if parsed is not None:
+                return parsed[0], parsed[1], None, "rule"
+
+        if self.cache is not None:
+            cached = await self.cache.get(text)
+            if cached is not None:
+                return (*cached, "cache")
+
+        result = await self._extract_with_llm(text)
+
+        # Failed calls come back as all None and are not cached
+        if self.cache is not None and any(result):
+            await self.cache.set(text, result)
+        return (*result, "llm")
+
+    async def _extract_with_llm(
         self, text: str
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
@@ -39,7 +104,8 @@ class GatherTripNode:
         Returns (origin, destination, reply).
         """
         try:
-            resp: AIMessage = self.llm.invoke(
+            resp: AIMessage = await ainvoke_with_retry(
+                self.llm,
                 [
                     SystemMessage(
                         content='''You're a helpful travel assistant that will generate the route for a single leg itenirary and the weather forecast along the way.
@@ -57,7 +123,7 @@ class GatherTripNode:
                         '''
                     ),
                     HumanMessage(content=text),
-                ]
+                ],
             )
 
             # If the model chose to call the tool
@@ -79,24 +145,45 @@ class GatherTripNode:
             print(f"Error calling OpenAI API: {e}")
             return None, None, None
 
-    def __call__(self, state: TripState) -> TripState:
-        """Process the state to extract origin and destination."""
-        origin = state.get("origin")
-        destination = state.get("destination")
+    async def __call__(self, state: TripState) -> TripState:
+        """
+        Extract origin and destination from the latest message. With a
+        checkpointer, places from earlier turns fill in whatever the message
+        leaves out, so a follow-up that names no places keeps the same trip.
+        """
+        prior_origin = state.get("origin")
+        prior_destination = state.get("destination")
 
+        o, d, reply, path = await self._extract(state.get("user_input", ""))
+        origin = o or prior_origin
+        destination = d or prior_destination
+        if not o and not d and origin and destination:
+            path = "state"
+
+        out: TripState = {"gather_path": path}
         if not origin or not destination:
-            o, d, reply = self.extract_places_from_text(state.get("user_input", ""))
-            origin = origin or o
-            destination = destination or d
-
-            out: TripState = {}
-            if not origin or not destination:
-                if reply:
-                    out["need"] = reply
-                else:
-                    out["need"] = (
-                        "Could you please provide both an origin and destination?"
-                    )
-                return out
-
-        return {"origin": origin, "destination": destination}
+            # Keep what we have so the next turn only needs the missing place
+            out.update(
+                {
+                    k: v
+                    for k, v in (("origin", origin), ("destination", destination))
+                    if v
+                }
+            )
+            if reply:
+                out["need"] = reply
+            else:
+                out["need"] = "Could you please provide both an origin and destination?"
+            return out
+
+        out.update({"origin": origin, "destination": destination})
+        if state.get("need"):
+            out["need"] = None
+
+        # A different trip invalidates results stored by earlier turns
+        if state.get("route") and trip_key(origin, destination) != trip_key(
+            prior_origin, prior_destination
+        ):
+            out.update({"route": None, "stops": None, "forecasts": None})
+
+        return out
@@ -1,7 +1,17 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, List
+
 import googlemaps
 
+from weather_travel_agent.agent.trips import trip_key
 from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.cache.backends import get_cache_backend
+from weather_travel_agent.cache.coalescing import CoalescingCache
+from weather_travel_agent.clients.google_maps import create_gmaps_client
 from weather_travel_agent.models.config import settings
+from weather_travel_agent.telemetry import external_call
 
 
 class GetDirectionsNode:
@@ -9,17 +19,76 @@ class GetDirectionsNode:
 
     def __init__(self, gmaps_client=None):
         self.gmaps_client = gmaps_client
+        # The googlemaps client is blocking, so calls run on a bounded pool off the event loop
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.directions_concurrency,
+            thread_name_prefix="directions",
+        )
+        self.cache = (
+            CoalescingCache(
+                "directions",
+                maxsize=settings.directions_cache_size,
+                ttl=settings.directions_cache_ttl_s,
+                backend=get_cache_backend()
+                if settings.directions_cache_shared
+                else None,
+                # No route may be a transient upstream answer, don't pin it for the TTL
+                cacheable=bool,
+            )
+            if settings.directions_cache_enabled
+            else None
+        )
 
-    def __call__(self, state: TripState) -> TripState:
-        """Get driving directions for the route."""
+    async def shutdown(self) -> None:
+        """Stop the worker threads; calls still queued are dropped."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _fetch_directions(
+        self, origin: str, destination: str, mode: str
+    ) -> List[dict[str, Any]]:
         if not self.gmaps_client:
-            self.gmaps_client = googlemaps.Client(key=settings.google_maps_api_key)
+            self.gmaps_client = create_gmaps_client(
+                pool_size=settings.directions_concurrency,
+                timeout=settings.directions_timeout_s,
+            )
+
+        loop = asyncio.get_running_loop()
+        call = loop.run_in_executor(
+            self.executor,
+            partial(self.gmaps_client.directions, origin, destination, mode=mode),
+        )
+        with external_call("google", "directions"):
+            return await asyncio.wait_for(call, settings.directions_timeout_s)
+
+    async def get_directions(
+        self, origin: str, destination: str, mode: str = "driving"
+    ) -> List[dict[str, Any]]:
+        """Directions for the trip, served from cache for previously seen city pairs."""
+        if self.cache is None:
+            return await self._fetch_directions(origin, destination, mode)
+
+        return await self.cache.get_or_fetch(
+            trip_key(origin, destination, mode),
+            lambda: self._fetch_directions(origin, destination, mode),
+        )
+
+    async def __call__(self, state: TripState) -> TripState:
+        """Get driving directions for the route."""
+        if state.get("route"):
+            # Same trip as an earlier turn of the conversation
+            return {"route": state["route"]}
 
         origin, destination = state["origin"], state["destination"]
         try:
-            directions = self.gmaps_client.directions(origin, destination, mode="driving")
-        except googlemaps.exceptions.ApiError as e:
-            return {"need": "I was unable to find the route for the origin and destination, try a different name or locations."}
+            directions = await self.get_directions(origin, destination, mode="driving")
+        except googlemaps.exceptions.ApiError:
+            return {
+                "need": "I was unable to find the route for the origin and destination, try a different name or locations."
+            }
+        except asyncio.TimeoutError:
+            return {
+                "need": "The directions service took too long to respond, please try again."
+            }
 
         if not directions:
             return {"need": "No route found. Try different locations."}
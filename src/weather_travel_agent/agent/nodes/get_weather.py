@@ -1,19 +1,99 @@
 import asyncio
 import random
 import time
-from typing import Any, List
+from typing import Any, Callable, List, Optional
 
 import httpx
 
+from weather_travel_agent.agent.prefetch import WeatherPrefetcher
+from weather_travel_agent.agent.streaming import stream_writer
 from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.cache.backends import get_cache_backend
+from weather_travel_agent.cache.coalescing import CoalescingCache
+from weather_travel_agent.clients.forecast_scheduler import (
+    ForecastScheduler,
+    RateBudget,
+)
+from weather_travel_agent.clients.http import create_async_client, request_with_retry
+from weather_travel_agent.geo.grid import quantize
 from weather_travel_agent.models.config import settings
+from weather_travel_agent.telemetry import external_call
+
+
+def reusable_forecasts(state: TripState) -> Optional[List[dict[str, Any]]]:
+    """Forecasts stored by an earlier turn, if all are in and still fresh."""
+    forecasts = state.get("forecasts")
+    fetched_at = state.get("forecasts_at")
+    if not forecasts or fetched_at is None:
+        return None
+    # Hot routes are refreshed in the background and have their own age limit
+    max_age = (
+        settings.hot_routes_max_age_s
+        if state.get("hot_route")
+        else settings.forecast_cache_ttl_s
+    )
+    if time.time() - fetched_at > max_age:
+        return None
+    if any(f.get("pending") for f in forecasts):
+        return None
+    return forecasts
+
+
+def pending_forecast(stop: dict[str, Any]) -> dict[str, Any]:
+    """Placeholder for a stop whose forecast missed the deadline."""
+    return {**stop, "summary": "pending", "pending": True}
 
 
 class GetWeatherNode:
     """Node for fetching weather data for route stops."""
 
-    def __init__(self):
-        pass
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client
+        self._owns_client = client is None
+        # Caps concurrent OpenWeather calls across all stops and requests
+        self.semaphore = asyncio.Semaphore(settings.weather_concurrency)
+        self.cache = (
+            CoalescingCache(
+                "forecast",
+                maxsize=settings.forecast_cache_size,
+                ttl=settings.forecast_cache_ttl_s,
+                backend=get_cache_backend() if settings.forecast_cache_shared else None,
+            )
+            if settings.forecast_cache_enabled
+            else None
+        )
+        # Merges fetches for the same cell across all trips, within a rate budget
+        self.scheduler = (
+            ForecastScheduler(
+                self._fetch_onecall,
+                window=settings.forecast_batch_window_ms / 1000,
+                grid_deg=settings.forecast_cache_grid_deg,
+                budget=(
+                    RateBudget(
+                        settings.forecast_rate_per_s, settings.forecast_rate_burst
+                    )
+                    if settings.forecast_rate_per_s
+                    else None
+                ),
+            )
+            if settings.forecast_scheduler
+            else None
+        )
+        # Filled by ExtractCitiesNode when WEATHER_PREFETCH is on
+        self.prefetcher = WeatherPrefetcher(self.fetch_weather_one)
+
+    async def startup(self) -> None:
+        """Open the pooled HTTP client."""
+        if self.client is None:
+            self.client = create_async_client()
+
+    async def shutdown(self) -> None:
+        """Close the pooled HTTP client if this node created it."""
+        if self.scheduler is not None:
+            await self.scheduler.close()
+        if self.client is not None and self._owns_client:
+            await self.client.aclose()
+            self.client = None
 
     def _rng(self, lat: float, lon: float) -> random.Random:
         """
@@ -78,23 +158,43 @@ class GetWeatherNode:
             "units": settings.units,
             "exclude": "minutely,alerts",
         }
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            try:
-                r = await client.get(
-                    "https://api.openweathermap.org/data/3.0/onecall", params=params
+        if self.client is None:
+            await self.startup()
+
+        async with self.semaphore:
+            with external_call("openweather", "onecall"):
+                r = await request_with_retry(
+                    self.client,
+                    "GET",
+                    f"{settings.openweather_base_url}/data/3.0/onecall",
+                    params=params,
                 )
                 r.raise_for_status()
-            except Exception:
-                r.raise_for_status()
 
         return r.json()
 
+    async def _cached_onecall(self, lat: float, lon: float) -> dict[str, Any]:
+        """Fetch the forecast for the grid cell around the point, sharing cached and in-flight results."""
+        if self.cache is None and self.scheduler is None:
+            return await self._fetch_onecall(lat, lon)
+
+        q_lat, q_lon = quantize(lat, lon, settings.forecast_cache_grid_deg)
+        fetch = (
+            self.scheduler.submit if self.scheduler is not None else self._fetch_onecall
+        )
+        if self.cache is None:
+            return await fetch(q_lat, q_lon)
+        return await self.cache.get_or_fetch(
+            f"{q_lat},{q_lon},{settings.units}",
+            lambda: fetch(q_lat, q_lon),
+        )
+
     async def fetch_weather_one(self, lat: float, lon: float) -> dict[str, Any]:
         """Fetch weather data for a single location (mock or real), and build a short summary."""
         if settings.mock_weather:
             data = self._mock_onecall_response(lat, lon, settings.units)
         else:
-            data = await self._fetch_onecall(lat, lon)
+            data = await self._cached_onecall(lat, lon)
 
         days = (data.get("daily") or [])[:2]
 
@@ -114,19 +214,77 @@ class GetWeatherNode:
         summary = "; ".join(day_to_str(d) for d in days) if days else "No daily data"
         return {"raw": data, "summary": summary}
 
+    async def forecast_stop(self, stop: dict[str, Any]) -> dict[str, Any]:
+        """The stop with its forecast summary, or the error in place of it."""
+        prefetched = self.prefetcher.take(stop["lat"], stop["lon"])
+        try:
+            if prefetched is not None:
+                data = await prefetched
+            else:
+                data = await self.fetch_weather_one(stop["lat"], stop["lon"])
+        except Exception as e:
+            return {**stop, "summary": f"weather error: {e}"}
+        return {**stop, "summary": data.get("summary", "")}
+
+    async def stream_forecasts(
+        self,
+        stops: List[dict[str, Any]],
+        on_forecast: Optional[Callable[[int, dict[str, Any]], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> List[dict[str, Any]]:
+        """
+        Fetch forecasts for all stops, calling `on_forecast(index, forecast)`
+        as each one completes. Stops still outstanding after `deadline`
+        seconds are reported as pending. Returns forecasts in stop order.
+        """
+        results: List[Optional[dict[str, Any]]] = [None] * len(stops)
+        tasks = {
+            asyncio.ensure_future(self.forecast_stop(s)): i for i, s in enumerate(stops)
+        }
+
+        loop = asyncio.get_running_loop()
+        end = None if deadline is None else loop.time() + deadline
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None if end is None else max(0.0, end - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    i = tasks[task]
+                    forecast = results[i] = task.result()
+                    if on_forecast is not None:
+                        on_forecast(i, forecast)
+        finally:
+            # Stragglers are dropped here; a cached fetch still completes for the next request
+            for task in pending:
+                task.cancel()
+
+        return [
+            r if r is not None else pending_forecast(s)
+            for s, r in zip(stops, results, strict=True)
+        ]
+
     async def __call__(self, state: TripState) -> TripState:
         """Fetch weather data for all stops along the route."""
         stops = state.get("stops", [])
         if not stops:
             return {"need": "No stops available to fetch weather."}
 
-        coros = [self.fetch_weather_one(s["lat"], s["lon"]) for s in stops]
-        gathered = await asyncio.gather(*coros, return_exceptions=True)
+        reused = reusable_forecasts(state)
+        if reused is not None:
+            return {"forecasts": reused}
 
-        results: List[dict[str, Any]] = []
-        for s, g in zip(stops, gathered, strict=False):
-            if isinstance(g, Exception):
-                results.append({**s, "summary": f"weather error: {g}"})
-            else:
-                results.append({**s, "summary": g.get("summary", "")})
-        return {"forecasts": results}
+        writer = stream_writer()
+        results = await self.stream_forecasts(
+            stops,
+            on_forecast=lambda i, f: writer(
+                {"type": "forecast", "index": i, "total": len(stops), "forecast": f}
+            ),
+            deadline=settings.weather_stop_deadline_s,
+        )
+        return {"forecasts": results, "forecasts_at": time.time()}
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from weather_travel_agent.agent.hot_routes import HotRouteIndex, HotRouteRefresher
+from weather_travel_agent.agent.types import TripState
+
+
+class HotRouteNode:
+    """
+    Serve precomputed directions, stops and forecasts for hot corridors.
+
+    Runs right after gather. On a hit the downstream nodes find their
+    results already in the state; when the summary was precomputed too, the
+    graph ends here without any inline work.
+    """
+
+    def __init__(
+        self, index: HotRouteIndex, refresher: Optional[HotRouteRefresher] = None
+    ):
+        self.index = index
+        self.refresher = refresher
+
+    async def startup(self) -> None:
+        if self.refresher is not None:
+            self.refresher.start()
+
+    async def shutdown(self) -> None:
+        if self.refresher is not None:
+            await self.refresher.stop()
+
+    async def __call__(self, state: TripState) -> TripState:
+        entry = self.index.get(state["origin"], state["destination"])
+        if entry is None:
+            return {"hot_route": False}
+
+        out: TripState = {
+            "hot_route": True,
+            "route": entry.route,
+            "stops": entry.stops,
+            "forecasts": entry.forecasts,
+            "forecasts_at": entry.refreshed_at,
+            "reply": None,
+        }
+        # A follow-up question still needs its own answer
+        if entry.reply and state.get("gather_path") != "state":
+            out["reply"] = entry.reply
+        return out
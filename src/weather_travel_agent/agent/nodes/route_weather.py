@@ -0,0 +1,154 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from weather_travel_agent.agent.nodes.extract_cities import ExtractCitiesNode
+from weather_travel_agent.agent.nodes.get_weather import (
+    GetWeatherNode,
+    pending_forecast,
+)
+from weather_travel_agent.agent.streaming import stream_writer
+from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.geo.geocoder import Place, reverse_geocode_each
+from weather_travel_agent.models.config import settings
+
+_UNRESOLVED = object()
+
+
+class RouteWeatherNode:
+    """
+    Pipelined stop extraction and weather lookup.
+
+    Each sampled point goes straight from reverse geocoding into a forecast
+    fetch as soon as its county is known, instead of waiting for every point
+    to resolve first. Stops are still deduped in route order, so the result
+    matches running ExtractCitiesNode then GetWeatherNode.
+    """
+
+    def __init__(self, extract: ExtractCitiesNode, weather: GetWeatherNode):
+        self.extract = extract
+        self.weather = weather
+
+    async def startup(self) -> None:
+        await self.weather.startup()
+
+    async def shutdown(self) -> None:
+        await self.extract.shutdown()
+        await self.weather.shutdown()
+
+    async def resolve_forecasts(
+        self,
+        coords: List[Tuple[float, float]],
+        on_stops: Optional[Callable[[List[dict[str, Any]]], None]] = None,
+        on_forecast: Optional[Callable[[int, dict[str, Any]], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[List[dict[str, Any]], List[dict[str, Any]]]:
+        """
+        Geocode points and fetch forecasts for new counties as they resolve.
+
+        `on_stops(stops)` fires when geocoding is done. `on_forecast(index,
+        forecast)` fires once a stop's forecast is in, but never before
+        `on_stops`, so clients hear about a stop before its weather.
+        Forecasts still outstanding `deadline` seconds after that are
+        reported as pending.
+        Returns (stops, forecasts), both in route order.
+        """
+        places: List[Any] = [_UNRESOLVED] * len(coords)
+        # Earliest resolved point per county, with its in-flight forecast
+        fetches: Dict[Tuple[str, Optional[str]], Tuple[int, asyncio.Task]] = {}
+
+        stops: List[dict[str, Any]] = []
+        confirmed: List[asyncio.Task] = []
+        seen = set()
+        prefix = 0
+        # Forecasts that finish before the stop list is sent wait for it
+        held: List[Tuple[int, asyncio.Task]] = []
+        stops_sent = False
+
+        def stop_at(i: int, place: Place) -> dict[str, Any]:
+            lat, lon = coords[i]
+            return {"name": place.label, "lat": lat, "lon": lon}
+
+        def emit(index: int, task: asyncio.Task) -> None:
+            if not stops_sent:
+                held.append((index, task))
+            elif on_forecast is not None and not task.cancelled():
+                on_forecast(index, task.result())
+
+        try:
+            async for i, place in reverse_geocode_each(
+                self.extract.geocoder,
+                coords,
+                concurrency=settings.geocode_concurrency,
+                timeout=settings.geocode_timeout_s,
+            ):
+                places[i] = place
+                if place is not None:
+                    key = place.dedupe_key
+                    claimed = fetches.get(key)
+                    # A later point of the same county may have started first
+                    if claimed is None or claimed[0] > i:
+                        if claimed is not None:
+                            claimed[1].cancel()
+                        task = asyncio.ensure_future(
+                            self.weather.forecast_stop(stop_at(i, place))
+                        )
+                        fetches[key] = (i, task)
+
+                # Confirm stops once everything before them has resolved
+                while prefix < len(coords) and places[prefix] is not _UNRESOLVED:
+                    place = places[prefix]
+                    if (
+                        place is not None
+                        and place.dedupe_key not in seen
+                        and len(stops) < settings.max_stops
+                    ):
+                        seen.add(place.dedupe_key)
+                        task = fetches[place.dedupe_key][1]
+                        task.add_done_callback(lambda t, k=len(stops): emit(k, t))
+                        stops.append(stop_at(prefix, place))
+                        confirmed.append(task)
+                    prefix += 1
+
+            if on_stops is not None:
+                on_stops(stops)
+            stops_sent = True
+            for index, task in sorted(held, key=lambda item: item[0]):
+                emit(index, task)
+
+            if confirmed:
+                await asyncio.wait(confirmed, timeout=deadline)
+            forecasts = [
+                task.result() if task.done() else pending_forecast(stop)
+                for stop, task in zip(stops, confirmed, strict=True)
+            ]
+        finally:
+            # Stragglers and duplicates are dropped; cached fetches still fill the cache
+            for _, task in fetches.values():
+                if not task.done():
+                    task.cancel()
+
+        return stops, forecasts
+
+    async def __call__(self, state: TripState) -> TripState:
+        if state.get("stops"):
+            # Same trip as an earlier turn: only the forecasts may need a refresh
+            return {"stops": state["stops"], **await self.weather(state)}
+
+        coords = self.extract.route_points(state["route"])
+        if coords is None:
+            return {"need": "Route polyline missing; cannot extract stops."}
+
+        writer = stream_writer()
+        stops, forecasts = await self.resolve_forecasts(
+            coords,
+            on_stops=lambda s: writer({"type": "stops", "stops": s}),
+            on_forecast=lambda i, f: writer(
+                {"type": "forecast", "index": i, "forecast": f}
+            ),
+            deadline=settings.weather_stop_deadline_s,
+        )
+        if not stops:
+            return {"stops": stops, "need": "No stops available to fetch weather."}
+
+        return {"stops": stops, "forecasts": forecasts, "forecasts_at": time.time()}
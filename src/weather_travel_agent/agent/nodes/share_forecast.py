@@ -1,29 +1,50 @@
-from typing import Optional
+import asyncio
+from typing import Callable, List, Optional
 
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 
+from weather_travel_agent.agent.streaming import stream_writer
 from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.clients.llm import astream_with_retry
 from weather_travel_agent.models.config import settings
 
 
 class ShareForecastNode:
     """Node for sharing formatted weather forecasts."""
 
-    def __init__(self):
-        pass
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        # One client (and connection pool) for the life of the app
+        self.llm = llm or self._create_llm()
 
-    def create_response(self, itinerary_text: str) -> Optional[str]:
-        """Send the trip itinerary + forecast to the LLM for natural language response."""
+    def _create_llm(self) -> Optional[ChatOpenAI]:
         if not settings.openai_api_key:
             return None
 
-        llm = ChatOpenAI(
+        return ChatOpenAI(
             model=settings.openai_model,
             temperature=0.3,
             api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+            timeout=settings.summary_timeout_s,
+            # Retries happen before the first token in astream_with_retry
+            max_retries=0,
         )
 
+    async def create_response(
+        self,
+        itinerary_text: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        follow_up: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Send the trip itinerary + forecast to the LLM for natural language
+        response, passing each streamed token to `on_token` as it arrives.
+        A `follow_up` question about the same trip is answered from it.
+        """
+        if self.llm is None:
+            return None
+
         prompt = f'''You are a helpful travel assistant.
         
         Goal:
@@ -41,20 +62,47 @@ class ShareForecastNode:
 
         Respond in a friendly but concise way.'''  # noqa: W293
 
-        try:
-            resp = llm.invoke([HumanMessage(content=prompt)])
+        if follow_up:
+            prompt += f'''
+
+        The user already has this summary and is following up with:
+        """
+        {follow_up}
+        """
 
-            if not resp.content or not resp.content.strip():
-                print("LLM returned empty response")
-                return None
+        Answer their follow-up from the itinerary and forecasts instead.'''
 
-            return resp.content.strip()
+        chunks: List[str] = []
 
+        def collect(text: str) -> None:
+            chunks.append(text)
+            if on_token is not None:
+                on_token(text)
+
+        try:
+            await astream_with_retry(
+                self.llm,
+                [HumanMessage(content=prompt)],
+                on_text=collect,
+                chunk_timeout=settings.summary_chunk_timeout_s,
+                timeout=settings.summary_timeout_s,
+            )
+        except asyncio.TimeoutError:
+            # A cut-off summary is never the reply, the itinerary replaces it
+            print("LLM summary timed out, falling back to itinerary")
+            return None
         except Exception as e:
             print(f"Error calling OpenAI API: {e}")
             return None
 
-    def __call__(self, state: TripState) -> TripState:
+        reply = "".join(chunks).strip()
+        if not reply:
+            print("LLM returned empty response")
+            return None
+
+        return reply
+
+    async def __call__(self, state: TripState) -> TripState:
         """Format and return the weather forecast results."""
         origin, destination = state.get("origin"), state.get("destination")
 
@@ -63,8 +111,16 @@ class ShareForecastNode:
             lines.append(f"  {i}. {f['name']}: {f['summary']}")
         itinerary_text = "\n".join(lines)
 
-        # Send to LLM
-        reply = self.create_response(itinerary_text)
+        # Send to LLM, streaming tokens to the graph's custom stream
+        writer = stream_writer()
+        reply = await self.create_response(
+            itinerary_text,
+            on_token=lambda text: writer({"type": "summary_token", "text": text}),
+            # Places came from an earlier turn, so the message is a follow-up
+            follow_up=state.get("user_input")
+            if state.get("gather_path") == "state"
+            else None,
+        )
 
         if not reply:
             reply = itinerary_text
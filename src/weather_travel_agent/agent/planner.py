@@ -0,0 +1,80 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from weather_travel_agent.agent.trips import trip_key
+from weather_travel_agent.agent.types import TripState
+
+Stage = Callable[[TripState], Awaitable[TripState]]
+
+
+class TripPlanningError(Exception):
+    """A stage could not plan the trip (e.g. no route between the places)."""
+
+
+class TripPlanner:
+    """
+    Plan a trip from a known origin and destination by running the graph's
+    stages directly, without gathering places from a message.
+    """
+
+    def __init__(self, stages: Sequence[Stage], summarize: Optional[Stage] = None):
+        self.stages = list(stages)
+        self.summarize = summarize
+
+    async def plan(
+        self, origin: str, destination: str, summarize: bool = False
+    ) -> TripState:
+        state: TripState = {"origin": origin, "destination": destination}
+        for stage in self.stages:
+            state.update(await stage(state) or {})
+            if state.get("need"):
+                raise TripPlanningError(state["need"])
+
+        if summarize and self.summarize is not None:
+            state.update(await self.summarize(state) or {})
+        return state
+
+
+async def plan_batch(
+    planner: TripPlanner,
+    trips: Sequence[Tuple[str, str]],
+    concurrency: int,
+    summarize: bool = False,
+) -> AsyncIterator[Tuple[List[int], Any]]:
+    """
+    Plan every trip, at most `concurrency` at a time, yielding (indices,
+    state or exception) as each one completes. Trips with the same
+    normalized origin/destination are planned once and reported together.
+    """
+    groups: Dict[str, List[int]] = {}
+    for i, (origin, destination) in enumerate(trips):
+        groups.setdefault(trip_key(origin, destination), []).append(i)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(indices: List[int]) -> Tuple[List[int], Any]:
+        origin, destination = trips[indices[0]]
+        async with semaphore:
+            try:
+                return indices, await planner.plan(origin, destination, summarize)
+            except Exception as e:
+                return indices, e
+
+    tasks = [asyncio.ensure_future(one(indices)) for indices in groups.values()]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # The consumer went away: stop planning the rest
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from weather_travel_agent.cache.stats import prefetch_stats
+
+Point = Tuple[float, float]
+
+
+class WeatherPrefetcher:
+    """
+    Speculative forecast fetches for sampled route points, started before
+    reverse geocoding has decided which points become stops.
+
+    Fetches are keyed by exact coordinates, so a stop built from a sampled
+    point can `take` its forecast later. Points dropped by dedupe are
+    `discard`ed, and anything never claimed within `ttl` seconds expires;
+    both count as waste.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[float, float], Awaitable[Any]],
+        ttl: float = 60.0,
+        name: str = "forecast_prefetch",
+    ):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stats = prefetch_stats(name)
+        self._tasks: Dict[Point, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def start(self, points: Iterable[Point]) -> None:
+        """Start fetching every point that isn't already being prefetched."""
+        loop = asyncio.get_running_loop()
+        for point in points:
+            if point in self._tasks:
+                continue
+            task = asyncio.ensure_future(self.fetch(*point))
+            self._tasks[point] = task
+            self.stats.started += 1
+            loop.call_later(self.ttl, self._expire, point, task)
+
+    def take(self, lat: float, lon: float) -> Optional[asyncio.Task]:
+        """Claim the prefetched forecast for a point, if there is one."""
+        task = self._tasks.pop((lat, lon), None)
+        if task is not None:
+            self.stats.used += 1
+        return task
+
+    def discard(self, points: Iterable[Point]) -> None:
+        """Drop prefetches for points that will not be used."""
+        for point in points:
+            task = self._tasks.pop(point, None)
+            if task is not None:
+                self._waste(task)
+
+    def _expire(self, point: Point, task: asyncio.Task) -> None:
+        if self._tasks.get(point) is task:
+            del self._tasks[point]
+            self._waste(task)
+
+    def _waste(self, task: asyncio.Task) -> None:
+        self.stats.wasted += 1
+        if task.done():
+            self.stats.wasted_completed += 1
+            if not task.cancelled():
+                # Mark errors as retrieved; nobody is waiting for this result
+                task.exception()
+        else:
+            task.cancel()
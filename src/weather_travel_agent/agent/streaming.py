@@ -0,0 +1,20 @@
+from typing import Any, Callable
+
+from langgraph.config import get_stream_writer
+
+StreamWriter = Callable[[Any], None]
+
+
+def _discard(_: Any) -> None:
+    pass
+
+
+def stream_writer() -> StreamWriter:
+    """
+    Writer for the graph's `custom` stream mode, or a no-op when a node is
+    called outside of a graph run (e.g. directly in tests or batch jobs).
+    """
+    try:
+        return get_stream_writer()
+    except (RuntimeError, KeyError):
+        return _discard
@@ -0,0 +1,105 @@
+import re
+from pathlib import Path
+from typing import FrozenSet, Optional, Tuple
+
+from weather_travel_agent.agent.trips import normalize_place, normalize_text
+
+# Leading phrases that carry no place information
+_PREFIX = re.compile(
+    r"^(?:(?:hi|hello|hey)[,!.]?\s+)?"
+    r"(?:(?:i(?:'d| would) like to|i want to|i'm|i am|we're|we are|let's|lets|can you|please)\s+)?"
+    r"(?:(?:go|travel|drive|driving|going|traveling|travelling|plan a trip|plan|head|heading)\s+)?"
+    r"(?:(?:a\s+)?(?:trip|route|directions|drive)\s+)?",
+    re.IGNORECASE,
+)
+_SUFFIX = re.compile(r"(?:[\s,]+(?:please|thanks|thank you))?[\s.!?]*$", re.IGNORECASE)
+
+_FROM_TO = re.compile(
+    r"^from\s+(?P<origin>.+?)\s+to\s+(?P<destination>.+)$", re.IGNORECASE
+)
+_ARROW = re.compile(r"^(?P<origin>.+?)\s*(?:->|→|=>|—>|-+>)\s*(?P<destination>.+)$")
+_X_TO_Y = re.compile(r"^(?P<origin>.+?)\s+to\s+(?P<destination>.+)$", re.IGNORECASE)
+
+# A place is a handful of words made of letters, with optional commas/periods
+_PLACE = re.compile(r"^[^\W\d_][\w .,'-]{0,60}$")
+_MAX_PLACE_WORDS = 6
+
+# Words that signal a sentence rather than a place name, including trailing
+# time, travel-mode and sequencing phrases ("... next week", "... by car",
+# "... then Atlanta") that would otherwise be absorbed into the destination
+_NOT_PLACES = frozenset(
+    """
+    a an and the i me my we you your it what how when where why which who weather
+    forecast tomorrow today tonight weekend want like need go going drive trip
+    route should would could can will is are be to from via through
+    on in at by for with next this that last then after before until leaving
+    leave departing arriving returning avoiding avoid back home there here
+    morning afternoon evening night week month year now soon later early
+    monday tuesday wednesday thursday friday saturday sunday
+    january february march april may june july august september october
+    november december car bus train plane bike am pm
+    """.split()
+)
+
+# Lowercase words allowed inside a capitalized place name ("Newcastle upon Tyne")
+_PARTICLES = frozenset("of de del la le du da upon".split())
+
+Parse = Tuple[str, str]
+
+
+def load_gazetteer(path: str) -> FrozenSet[str]:
+    """Read known place names (one per line) into a normalized set."""
+    with Path(path).open(encoding="utf-8") as f:
+        return frozenset(
+            normalize_place(line)
+            for line in f
+            if line.strip() and not line.startswith("#")
+        )
+
+
+class TripParser:
+    """
+    Deterministic origin/destination parser for the common message shapes:
+    "X to Y", "from X to Y" and "X -> Y", with optional polite prefixes.
+
+    Returns None whenever the message is ambiguous, so the caller can fall
+    back to the LLM. With a gazetteer, both places must be known names;
+    without one, every word of a place must be capitalized.
+    """
+
+    def __init__(self, gazetteer: Optional[FrozenSet[str]] = None):
+        self.gazetteer = gazetteer
+
+    def _is_place(self, text: str) -> bool:
+        if not _PLACE.match(text):
+            return False
+
+        words = normalize_text(text).split()
+        if not words or len(words) > _MAX_PLACE_WORDS:
+            return False
+        if any(w in _NOT_PLACES for w in words):
+            return False
+
+        if self.gazetteer is not None:
+            return normalize_place(text) in self.gazetteer
+        return all(w[0].isupper() or w in _PARTICLES for w in text.split())
+
+    def parse(self, text: str) -> Optional[Parse]:
+        text = " ".join((text or "").split())
+        text = _SUFFIX.sub("", _PREFIX.sub("", text))
+        if not text:
+            return None
+
+        for pattern in (_FROM_TO, _ARROW, _X_TO_Y):
+            match = pattern.match(text)
+            if not match:
+                continue
+
+            origin = match.group("origin").strip(" ,")
+            destination = match.group("destination").strip(" ,")
+            if self._is_place(origin) and self._is_place(destination):
+                return origin, destination
+            # Matched the shape but not clean place names: ambiguous
+            return None
+
+        return None
@@ -0,0 +1,24 @@
+import re
+
+_PUNCT = re.compile(r"[^\w\s,]")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_place(text: str) -> str:
+    """Canonical form of a place name for cache keys: lowercase, single spaces, no stray punctuation."""
+    text = _PUNCT.sub(" ", (text or "").lower())
+    parts = [_SPACE.sub(" ", p).strip() for p in text.split(",")]
+    return ", ".join(p for p in parts if p)
+
+
+def trip_key(origin: str, destination: str, mode: str = "driving") -> str:
+    """Cache key for a normalized (origin, destination, mode) trip."""
+    return f"{normalize_place(origin)}|{normalize_place(destination)}|{mode}"
+
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of a user message: lowercase words separated by single spaces."""
+    return _SPACE.sub(" ", _NON_WORD.sub(" ", (text or "").lower())).strip()
@@ -10,5 +10,8 @@ class TripState(TypedDict, total=False):
     route: dict[str, Any]
     stops: list[dict[str, Any]]
     forecasts: list[dict[str, Any]]
+    forecasts_at: float
     reply: str
     need: Optional[str]
+    gather_path: str
+    hot_route: bool
@@ -0,0 +1,114 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from weather_travel_agent.cache.memory import MISSING, TTLCache
+from weather_travel_agent.cache.sqlite import SQLiteCache
+from weather_travel_agent.models.config import settings
+
+
+def dumps(value: Any) -> str:
+    """Serialize a cache value as JSON; only plain data is ever stored, never pickles."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(raw: str) -> Any:
+    return json.loads(raw)
+
+
+class CacheBackend(ABC):
+    """
+    Shared key/value store for cached external lookups. Keys are namespaced
+    per kind of lookup (e.g. `forecast`, `directions`) and values must be
+    JSON-serializable.
+    """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Any:
+        """Return the cached value, or MISSING if absent or expired."""
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        """Store a value for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, namespace: str, key: str) -> None:
+        """Remove a value if present."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release connections or file handles."""
+
+
+class MemoryBackend(CacheBackend):
+    """Process-local backend; values still round-trip through JSON like the shared ones."""
+
+    def __init__(self, maxsize: int = 10_000):
+        self._cache = TTLCache(maxsize=maxsize, ttl=0)
+
+    async def get(self, namespace: str, key: str) -> Any:
+        raw = self._cache.get((namespace, key))
+        return MISSING if raw is MISSING else loads(raw)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        self._cache.set((namespace, key), dumps(value), ttl=ttl)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        self._cache.delete((namespace, key))
+
+
+class SQLiteBackend(CacheBackend):
+    """Local SQLite file, shared by every worker process on the host."""
+
+    def __init__(self, path: str):
+        self._db = SQLiteCache(path)
+
+    async def get(self, namespace: str, key: str) -> Any:
+        return await asyncio.to_thread(self._db.get, namespace, key)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        # Serialize on the caller's side so bad values fail loudly and early
+        dumps(value)
+        await asyncio.to_thread(self._db.set, namespace, key, value, ttl)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await asyncio.to_thread(self._db.delete, namespace, key)
+
+    async def close(self) -> None:
+        self._db.close()
+
+
+def create_cache_backend(kind: Optional[str] = None) -> CacheBackend:
+    """Create the backend selected by settings.cache_backend (or `kind`)."""
+    kind = kind or settings.cache_backend
+    if kind == "memory":
+        return MemoryBackend(maxsize=settings.cache_memory_size)
+    if kind == "sqlite":
+        return SQLiteBackend(settings.cache_sqlite_path)
+    if kind == "redis":
+        from weather_travel_agent.cache.redis import RedisBackend
+
+        return RedisBackend(
+            settings.cache_redis_url,
+            prefix=settings.cache_key_prefix,
+            pool_size=settings.cache_redis_pool_size,
+        )
+    raise ValueError(f"Unknown cache backend: {kind}")
+
+
+_backend: Optional[CacheBackend] = None
+
+
+def get_cache_backend() -> CacheBackend:
+    """The process-wide cache backend, created on first use."""
+    global _backend
+    if _backend is None:
+        _backend = create_cache_backend()
+    return _backend
+
+
+async def close_cache_backend() -> None:
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
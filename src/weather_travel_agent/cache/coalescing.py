@@ -0,0 +1,65 @@
+from typing import Any, Awaitable, Callable, Optional
+
+from weather_travel_agent.cache.backends import CacheBackend
+from weather_travel_agent.cache.memory import MISSING, TTLCache
+from weather_travel_agent.cache.singleflight import SingleFlight
+from weather_travel_agent.cache.stats import cache_stats
+
+
+class CoalescingCache:
+    """
+    TTL/LRU cache in front of an async fetch, where concurrent misses for the
+    same key share a single in-flight fetch.
+
+    With a shared backend, in-process misses are looked up there (under the
+    cache name as namespace) before fetching, and fetched values are written
+    back. Values must then be JSON-serializable.
+
+    Results for which `cacheable(result)` is false are returned but not
+    stored, so e.g. empty answers are fetched again next time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        backend: Optional[CacheBackend] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stats = cache_stats(name)
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl, stats=self.stats)
+        self.backend = backend
+        self.cacheable = cacheable
+        self.flight = SingleFlight()
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.memory.get(key)
+        if value is not MISSING:
+            self.stats.hit("memory")
+            return value
+
+        if key in self.flight:
+            self.stats.hit("coalesced")
+        else:
+            self.stats.miss()
+
+        async def fetch_and_store() -> Any:
+            if self.backend is not None:
+                shared = await self.backend.get(self.name, key)
+                if shared is not MISSING:
+                    self.stats.tiers["shared"] += 1
+                    self.memory.set(key, shared)
+                    return shared
+
+            result = await fetch()
+            if self.cacheable is not None and not self.cacheable(result):
+                return result
+            self.memory.set(key, result)
+            if self.backend is not None:
+                await self.backend.set(self.name, key, result, self.ttl)
+            return result
+
+        return await self.flight.do(key, fetch_and_store)
@@ -0,0 +1,179 @@
+import asyncio
+from typing import Any, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from weather_travel_agent.cache.backends import CacheBackend, dumps, loads
+from weather_travel_agent.cache.memory import MISSING
+
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server."""
+
+
+def encode_command(*args: Any) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    out = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        out.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(out)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read a single RESP reply."""
+    line = await reader.readuntil(b"\r\n")
+    kind, body = line[:1], line[1:-2]
+
+    if kind == b"+":
+        return body.decode()
+    if kind == b"-":
+        raise RedisError(body.decode())
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        size = int(body)
+        if size < 0:
+            return None
+        return (await reader.readexactly(size + 2))[:-2]
+    if kind == b"*":
+        count = int(body)
+        return None if count < 0 else [await read_reply(reader) for _ in range(count)]
+    raise RedisError(f"Unexpected reply: {line!r}")
+
+
+def parse_url(url: str) -> Tuple[str, int, Optional[str], int]:
+    parsed = urlparse(url)
+    db = int(parsed.path.lstrip("/") or 0)
+    password = unquote(parsed.password) if parsed.password else None
+    return parsed.hostname or "localhost", parsed.port or 6379, password, db
+
+
+class RedisConnection:
+    """One open connection; commands on it are sent one at a time."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, *args: Any) -> Any:
+        self.writer.write(encode_command(*args))
+        await self.writer.drain()
+        return await read_reply(self.reader)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Backend speaking the Redis protocol (RESP) to Redis or a compatible
+    server, over a small pool of lazily opened connections.
+
+    Connection failures are treated as cache misses so an unavailable cache
+    never fails a request.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "wta",
+        timeout: float = 1.0,
+        pool_size: int = 4,
+    ):
+        self.host, self.port, self.password, self.db = parse_url(url)
+        self.prefix = prefix
+        self.timeout = timeout
+        # Idle connections, reused most recently returned first
+        self._idle: List[RedisConnection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    async def _connect(self) -> RedisConnection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        conn = RedisConnection(reader, writer)
+        try:
+            if self.password:
+                await conn.send("AUTH", self.password)
+            if self.db:
+                await conn.send("SELECT", self.db)
+        except BaseException:
+            # Never hand out a connection left half authenticated
+            conn.close()
+            raise
+        return conn
+
+    async def _execute_on(self, conn: Optional[RedisConnection], *args: Any) -> Any:
+        """Send one command, reconnecting once if the connection dropped."""
+        for attempt in range(2):
+            try:
+                if conn is None:
+                    conn = await asyncio.wait_for(self._connect(), self.timeout)
+                reply = await asyncio.wait_for(conn.send(*args), self.timeout)
+            except RedisError:
+                # An error reply leaves the connection usable
+                if conn is not None:
+                    self._idle.append(conn)
+                raise
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                if conn is not None:
+                    conn.close()
+                    conn = None
+                if attempt:
+                    raise
+            except BaseException:
+                if conn is not None:
+                    conn.close()
+                raise
+            else:
+                self._idle.append(conn)
+                return reply
+
+    async def execute(self, *args: Any) -> Any:
+        """Send one command on a pooled connection and return its reply."""
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else None
+            return await self._execute_on(conn, *args)
+
+    async def get(self, namespace: str, key: str) -> Any:
+        try:
+            raw = await self.execute("GET", self._key(namespace, key))
+        except (
+            OSError,
+            asyncio.IncompleteReadError,
+            asyncio.TimeoutError,
+            RedisError,
+        ) as e:
+            print(f"Cache backend unavailable: {e}")
+            return MISSING
+        return MISSING if raw is None else loads(raw)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        args: List[Any] = ["SET", self._key(namespace, key), dumps(value)]
+        args += ["PX", max(1, int(ttl * 1000))]
+        try:
+            await self.execute(*args)
+        except (
+            OSError,
+            asyncio.IncompleteReadError,
+            asyncio.TimeoutError,
+            RedisError,
+        ) as e:
+            print(f"Cache backend unavailable: {e}")
+
+    async def delete(self, namespace: str, key: str) -> None:
+        try:
+            await self.execute("DEL", self._key(namespace, key))
+        except (
+            OSError,
+            asyncio.IncompleteReadError,
+            asyncio.TimeoutError,
+            RedisError,
+        ) as e:
+            print(f"Cache backend unavailable: {e}")
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
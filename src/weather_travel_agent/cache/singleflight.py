@@ -0,0 +1,109 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one in-flight task.
+
+    Callers that arrive while a task for their key is running await that task
+    instead of starting their own. A caller being cancelled does not cancel
+    the shared task for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+
+class SharedStream(Generic[T]):
+    """
+    Run an async iterator in its own task and replay its items to any number
+    of subscribers, each from a chosen offset, as they are produced.
+
+    Subscribers leaving do not stop the source while others remain; once the
+    last one leaves before the source is exhausted, the source is cancelled.
+    Errors from the source are raised to every subscriber.
+    """
+
+    def __init__(self, source: AsyncIterator[T]):
+        self.items: List[T] = []
+        self._changed = asyncio.Event()
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._subscribers = 0
+        self.closing = False
+        self.task = asyncio.ensure_future(self._pump(source))
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    async def _pump(self, source: AsyncIterator[T]) -> None:
+        try:
+            async for item in source:
+                self.items.append(item)
+                self._notify()
+        except asyncio.CancelledError:
+            self._error = RuntimeError("shared stream was cancelled")
+            raise
+        except Exception as e:
+            self._error = e
+        finally:
+            self._done = True
+            self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def subscribe(self, start: int = 0) -> AsyncIterator[T]:
+        """Iterate items from `start` on; counts as a subscriber right away."""
+        self._subscribers += 1
+        return self._iterate(start)
+
+    async def _iterate(self, start: int) -> AsyncIterator[T]:
+        i = start
+        try:
+            while True:
+                changed = self._changed
+                if i < len(self.items):
+                    i += 1
+                    yield self.items[i - 1]
+                    continue
+                if self._done:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                await changed.wait()
+        finally:
+            self._subscribers -= 1
+            if self._subscribers == 0 and not self._done:
+                self.closing = True
+                self.task.cancel()
@@ -0,0 +1,127 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Protocol
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache, optionally broken down by tier."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    tiers: Counter = field(default_factory=Counter)
+
+    def hit(self, tier: Optional[str] = None) -> None:
+        self.hits += 1
+        if tier:
+            self.tiers[tier] += 1
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+        if self.tiers:
+            out["tiers"] = dict(self.tiers)
+        return out
+
+
+@dataclass
+class PrefetchStats:
+    """Counters for speculative fetches: used by a later stage, or wasted."""
+
+    started: int = 0
+    used: int = 0
+    wasted: int = 0
+    # Wasted fetches that had already completed (the upstream call was spent)
+    wasted_completed: int = 0
+
+    @property
+    def waste_rate(self) -> float:
+        total = self.used + self.wasted
+        return self.wasted / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "started": self.started,
+            "used": self.used,
+            "wasted": self.wasted,
+            "wasted_completed": self.wasted_completed,
+            "waste_rate": round(self.waste_rate, 4),
+        }
+
+
+@dataclass
+class SchedulerStats:
+    """Counters for batched upstream fetches: merged requests and rate limiting."""
+
+    requests: int = 0
+    merged: int = 0
+    fetches: int = 0
+    windows: int = 0
+    # Fetches that waited on the rate budget, and for how long in total
+    throttled: int = 0
+    throttle_wait_s: float = 0.0
+
+    @property
+    def merge_rate(self) -> float:
+        return self.merged / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "merged": self.merged,
+            "fetches": self.fetches,
+            "windows": self.windows,
+            "throttled": self.throttled,
+            "throttle_wait_s": round(self.throttle_wait_s, 3),
+            "merge_rate": round(self.merge_rate, 4),
+        }
+
+
+class _Stats(Protocol):
+    def as_dict(self) -> Dict[str, Any]: ...
+
+
+_registry: Dict[str, _Stats] = {}
+
+
+def cache_stats(name: str) -> CacheStats:
+    """Get (or create) the process-wide stats for the named cache."""
+    return _registry.setdefault(name, CacheStats())
+
+
+def prefetch_stats(name: str) -> PrefetchStats:
+    """Get (or create) the process-wide stats for the named prefetcher."""
+    return _registry.setdefault(name, PrefetchStats())
+
+
+def scheduler_stats(name: str) -> SchedulerStats:
+    """Get (or create) the process-wide stats for the named scheduler."""
+    return _registry.setdefault(name, SchedulerStats())
+
+
+def register_stats(name: str, stats: _Stats) -> None:
+    """Expose any object with an `as_dict` under `name` in the snapshot."""
+    _registry[name] = stats
+
+
+def registered() -> Dict[str, _Stats]:
+    """Every registered stats object by name."""
+    return dict(_registry)
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Current stats of every registered cache."""
+    return {name: stats.as_dict() for name, stats in sorted(_registry.items())}
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from weather_travel_agent.cache.stats import scheduler_stats
+from weather_travel_agent.geo.grid import quantize
+
+Cell = Tuple[float, float]
+
+
+class RateBudget:
+    """Token bucket allowing `rate` calls per second on average, in bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        # Waiters are served in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Take one call from the budget, waiting if needed. Returns the seconds waited."""
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self.tokens < 1:
+                waited = (1 - self.tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self.tokens -= 1
+            return waited
+
+
+class ForecastScheduler:
+    """
+    Central queue for upstream forecast fetches from every in-flight trip.
+
+    Requests arriving within `window` seconds of each other are collected,
+    merged per grid cell, and fetched once per cell; every caller for the
+    cell gets the same result. Cells already being fetched are joined
+    rather than queued again. With a `budget`, fetches start no faster than
+    it allows, the cells most callers are waiting on first.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[float, float], Awaitable[Any]],
+        window: float,
+        grid_deg: float,
+        budget: Optional[RateBudget] = None,
+        name: str = "forecast_scheduler",
+    ):
+        self.fetch = fetch
+        self.window = window
+        self.grid_deg = grid_deg
+        self.budget = budget
+        self.stats = scheduler_stats(name)
+        self._queued: Dict[Cell, asyncio.Future] = {}
+        self._waiters: Counter = Counter()
+        self._inflight: Dict[Cell, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, lat: float, lon: float) -> Any:
+        """The forecast for the cell around (lat, lon), fetched with the rest of the window."""
+        cell = quantize(lat, lon, self.grid_deg)
+        self.stats.requests += 1
+
+        future = self._queued.get(cell) or self._inflight.get(cell)
+        if future is not None:
+            self.stats.merged += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = self._queued[cell] = loop.create_future()
+            # Errors nobody is left to await are not reported as unretrieved
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        if cell in self._queued:
+            self._waiters[cell] += 1
+
+        # A caller giving up does not cancel the fetch for the others
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Start one fetch per cell collected in the window, most awaited first."""
+        self._flush_handle = None
+        batch, waiters = self._queued, self._waiters
+        self._queued, self._waiters = {}, Counter()
+        self.stats.windows += 1
+
+        for cell in sorted(batch, key=lambda c: -waiters[c]):
+            self._inflight[cell] = batch[cell]
+            task = asyncio.ensure_future(self._run(cell, batch[cell]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, cell: Cell, future: asyncio.Future) -> None:
+        try:
+            if self.budget is not None:
+                waited = await self.budget.acquire()
+                if waited:
+                    self.stats.throttled += 1
+                    self.stats.throttle_wait_s += waited
+            self.stats.fetches += 1
+            result = await self.fetch(*cell)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            self._inflight.pop(cell, None)
+
+    async def close(self) -> None:
+        """Cancel queued and running fetches."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for future in self._queued.values():
+            future.cancel()
+        self._queued, self._waiters = {}, Counter()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,24 @@
+from typing import Optional
+
+import googlemaps
+from requests.adapters import HTTPAdapter
+
+from weather_travel_agent.models.config import settings
+
+
+def create_gmaps_client(
+    pool_size: int = 10, timeout: Optional[float] = None
+) -> googlemaps.Client:
+    """
+    Create a Google Maps client whose connection pool can serve `pool_size`
+    concurrent calls from worker threads without discarding connections.
+    """
+    client = googlemaps.Client(
+        key=settings.google_maps_api_key,
+        timeout=timeout,
+        base_url=settings.google_maps_base_url,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    client.session.mount("https://", adapter)
+    client.session.mount("http://", adapter)
+    return client
@@ -0,0 +1,88 @@
+import asyncio
+import random
+from typing import Any, Optional
+
+import httpx
+
+from weather_travel_agent.models.config import settings
+
+# Responses worth retrying: rate limiting and transient upstream failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def create_async_client(
+    timeout: Optional[float] = None,
+    max_connections: Optional[int] = None,
+    max_keepalive: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+) -> httpx.AsyncClient:
+    """Create a long-lived pooled HTTP client, defaulting to the configured limits."""
+    if max_connections is None:
+        max_connections = settings.http_max_connections
+    if max_keepalive is None:
+        max_keepalive = settings.http_max_keepalive
+    if keepalive_expiry is None:
+        keepalive_expiry = settings.http_keepalive_expiry_s
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        timeout=settings.http_timeout_s if timeout is None else timeout,
+        limits=limits,
+        http2=settings.http2 if http2 is None else http2,
+    )
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff for the given (zero-based) retry attempt."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def _retry_after(response: httpx.Response, cap: float) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return min(cap, max(0.0, float(value))) if value else None
+    except ValueError:
+        return None
+
+
+async def request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    retries: Optional[int] = None,
+    backoff_base: Optional[float] = None,
+    backoff_max: Optional[float] = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Send a request, retrying transport errors and 429/5xx responses with
+    jittered exponential backoff (or the server's Retry-After, if sent).
+
+    The last response is returned as-is once retries are exhausted, so callers
+    still decide how to handle error statuses.
+    """
+    retries = settings.http_retries if retries is None else retries
+    base = settings.http_backoff_base_s if backoff_base is None else backoff_base
+    cap = settings.http_backoff_max_s if backoff_max is None else backoff_max
+
+    for attempt in range(retries + 1):
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt, base, cap)
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+            delay = _retry_after(response, cap)
+            if delay is None:
+                delay = backoff_delay(attempt, base, cap)
+
+        await asyncio.sleep(delay)
+
+    raise AssertionError("unreachable")
@@ -0,0 +1,133 @@
+import asyncio
+import weakref
+from typing import Any, Callable, Optional
+
+import openai
+
+from weather_travel_agent.clients.http import backoff_delay
+from weather_travel_agent.models.config import settings
+from weather_travel_agent.telemetry import external_call
+
+# Failures worth retrying: rate limiting and transient upstream errors
+API_RETRY_ERRORS = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+# One semaphore per event loop (normally just the server's)
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def llm_limiter() -> asyncio.Semaphore:
+    """
+    Process-wide cap on OpenAI calls in flight, shared by every node that
+    talks to the LLM so one busy stage cannot starve the others of quota.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(settings.llm_concurrency)
+    return limiter
+
+
+async def ainvoke_with_retry(
+    llm: Any,
+    messages: Any,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+    backoff_base: Optional[float] = None,
+    backoff_max: Optional[float] = None,
+) -> Any:
+    """
+    Call `llm.ainvoke` under the shared limiter, with a per-attempt timeout and
+    jittered exponential backoff between retries of transient failures.
+
+    The limiter is released while backing off, so waiting retries do not hold
+    a slot. The last error is raised once retries are exhausted.
+    """
+    timeout = settings.llm_timeout_s if timeout is None else timeout
+    retries = settings.llm_retries if retries is None else retries
+    base = settings.http_backoff_base_s if backoff_base is None else backoff_base
+    cap = settings.http_backoff_max_s if backoff_max is None else backoff_max
+
+    for attempt in range(retries + 1):
+        try:
+            async with llm_limiter():
+                with external_call("openai", "invoke"):
+                    return await asyncio.wait_for(llm.ainvoke(messages), timeout)
+        except (asyncio.TimeoutError, *API_RETRY_ERRORS):
+            if attempt == retries:
+                raise
+        await asyncio.sleep(backoff_delay(attempt, base, cap))
+
+    raise AssertionError("unreachable")
+
+
+async def astream_with_retry(
+    llm: Any,
+    messages: Any,
+    on_text: Callable[[str], None],
+    chunk_timeout: float,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+    backoff_base: Optional[float] = None,
+    backoff_max: Optional[float] = None,
+) -> None:
+    """
+    Stream `llm.astream` under the shared limiter, passing each text chunk to
+    `on_text`. Every chunk, including the first, must arrive within
+    `chunk_timeout`, and the whole call (retries included) must finish within
+    `timeout` if given, otherwise asyncio.TimeoutError is raised.
+
+    Connection, 429 and 5xx errors are retried with backoff only before the
+    first chunk, so streamed text is never repeated.
+    """
+    retries = settings.llm_retries if retries is None else retries
+    base = settings.http_backoff_base_s if backoff_base is None else backoff_base
+    cap = settings.http_backoff_max_s if backoff_max is None else backoff_max
+
+    async with asyncio.timeout(timeout):
+        await _astream(llm, messages, on_text, chunk_timeout, retries, base, cap)
+
+
+async def _astream(
+    llm: Any,
+    messages: Any,
+    on_text: Callable[[str], None],
+    chunk_timeout: float,
+    retries: int,
+    base: float,
+    cap: float,
+) -> None:
+    for attempt in range(retries + 1):
+        streamed = False
+        try:
+            async with llm_limiter():
+                with external_call("openai", "stream"):
+                    stream = llm.astream(messages)
+                    try:
+                        while True:
+                            try:
+                                chunk = await asyncio.wait_for(
+                                    anext(stream), chunk_timeout
+                                )
+                            except StopAsyncIteration:
+                                return
+
+                            text = (
+                                chunk.content if isinstance(chunk.content, str) else ""
+                            )
+                            if text:
+                                streamed = True
+                                on_text(text)
+                    finally:
+                        await stream.aclose()
+        except API_RETRY_ERRORS:
+            if streamed or attempt == retries:
+                raise
+        await asyncio.sleep(backoff_delay(attempt, base, cap))
+
+    raise AssertionError("unreachable")
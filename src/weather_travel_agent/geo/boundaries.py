@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from weather_travel_agent.geo.geocoder import Place
+
+# Lower rank wins when a point falls inside several boundaries, mirroring the
+# Google path which prefers the county over the locality.
+KIND_RANK = {"county": 0, "locality": 1}
+
+
+class OfflineReverseGeocoder:
+    """
+    Reverse geocoder answering from administrative boundary polygons in a
+    local GeoJSON file, indexed with an STRtree at startup.
+
+    Each feature needs a Polygon/MultiPolygon geometry and these properties:
+    `name` (county or locality name), `state` (short admin1 code), `country`
+    (short country code) and optionally `kind` (`county` or `locality`).
+
+    Requires the optional `shapely` dependency (`pip install .[offline]`).
+    """
+
+    def __init__(self, path: str):
+        try:
+            import shapely
+            from shapely.geometry import shape
+        except ImportError as e:
+            raise ImportError(
+                "Offline reverse geocoding requires shapely; install with `pip install .[offline]`"
+            ) from e
+
+        self._shapely = shapely
+
+        with Path(path).open(encoding="utf-8") as f:
+            collection = json.load(f)
+
+        geoms = []
+        self.places: List[Place] = []
+        self.ranks: List[tuple[int, float]] = []
+        for feature in collection.get("features", []):
+            props = feature.get("properties") or {}
+            if not feature.get("geometry") or not props.get("name"):
+                continue
+
+            geom = shape(feature["geometry"])
+            geoms.append(geom)
+            self.places.append(
+                Place(
+                    name=props["name"],
+                    state=props.get("state"),
+                    country=props.get("country"),
+                )
+            )
+            self.ranks.append(
+                (KIND_RANK.get(props.get("kind", "county"), 2), geom.area)
+            )
+
+        self.geoms = np.array(geoms, dtype=object)
+        shapely.prepare(self.geoms)
+        self.tree = shapely.STRtree(self.geoms)
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def lookup(self, lat: float, lon: float) -> Optional[Place]:
+        """Find the boundary containing the point, or None if it lies outside them all."""
+        candidates = self.tree.query(self._shapely.Point(lon, lat))
+        if len(candidates) == 0:
+            return None
+
+        hits = candidates[self._shapely.intersects_xy(self.geoms[candidates], lon, lat)]
+        if len(hits) == 0:
+            return None
+
+        best = min(hits, key=lambda i: self.ranks[i])
+        return self.places[best]
+
+    async def reverse(self, lat: float, lon: float) -> Optional[Place]:
+        return self.lookup(lat, lon)
@@ -0,0 +1,106 @@
+import asyncio
+from dataclasses import asdict
+from typing import Any, Optional
+
+from weather_travel_agent.cache.backends import CacheBackend
+from weather_travel_agent.cache.memory import MISSING, TTLCache
+from weather_travel_agent.cache.stats import cache_stats
+from weather_travel_agent.geo import geohash
+from weather_travel_agent.geo.geocoder import (
+    Place,
+    ReverseGeocoder,
+    shutdown_geocoder,
+)
+
+NAMESPACE = "reverse_geocode"
+
+
+class CachedReverseGeocoder:
+    """
+    Reverse geocoder that answers from a geohash-keyed cache before asking the
+    wrapped geocoder.
+
+    Lookups go through an in-process LRU tier, then an optional shared
+    backend tier (SQLite, Redis, ...).
+    On a miss, a point whose cached neighbouring cells all agree on the same
+    county (at least `min_neighbours` of the 8) is answered from those cells
+    without an API call.
+    """
+
+    def __init__(
+        self,
+        geocoder: ReverseGeocoder,
+        precision: int = 5,
+        ttl: float = 30 * 24 * 3600,
+        maxsize: int = 10_000,
+        backend: Optional[CacheBackend] = None,
+        min_neighbours: int = 6,
+    ):
+        self.geocoder = geocoder
+        self.precision = precision
+        self.ttl = ttl
+        self.stats = cache_stats(NAMESPACE)
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl, stats=self.stats)
+        self.backend = backend
+        self.min_neighbours = min_neighbours
+
+    async def _lookup(self, cell: str) -> Any:
+        """Cached Place (or None for 'no result') for a cell, MISSING if unknown."""
+        value = self.memory.get(cell)
+        if value is not MISSING or self.backend is None:
+            return value
+
+        stored = await self.backend.get(NAMESPACE, cell)
+        if stored is MISSING:
+            return MISSING
+
+        value = Place(**stored) if stored else None
+        self.memory.set(cell, value)
+        return value
+
+    async def _infer_from_neighbours(self, cell: str) -> Optional[Place]:
+        if self.min_neighbours <= 0:
+            return None
+
+        found = await asyncio.gather(
+            *(self._lookup(n) for n in geohash.neighbours(cell))
+        )
+        places = [p for p in found if p is not MISSING]
+        if len(places) < self.min_neighbours or None in places:
+            return None
+
+        keys = {p.dedupe_key for p in places}
+        return places[0] if len(keys) == 1 else None
+
+    async def _store(self, cell: str, place: Optional[Place]) -> None:
+        self.memory.set(cell, place)
+        if self.backend is not None:
+            await self.backend.set(
+                NAMESPACE, cell, asdict(place) if place else None, self.ttl
+            )
+
+    async def reverse(self, lat: float, lon: float) -> Optional[Place]:
+        cell = geohash.encode(lat, lon, self.precision)
+
+        in_memory = self.memory.get(cell)
+        if in_memory is not MISSING:
+            self.stats.hit("memory")
+            return in_memory
+
+        cached = await self._lookup(cell)
+        if cached is not MISSING:
+            self.stats.hit("shared")
+            return cached
+
+        inferred = await self._infer_from_neighbours(cell)
+        if inferred is not None:
+            self.stats.hit("neighbour")
+            return inferred
+
+        self.stats.miss()
+        place = await self.geocoder.reverse(lat, lon)
+        await self._store(cell, place)
+        return place
+
+    async def shutdown(self) -> None:
+        await shutdown_geocoder(self.geocoder)
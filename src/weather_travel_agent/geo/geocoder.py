@@ -0,0 +1,187 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, AsyncIterator, List, Optional, Protocol, Sequence, Tuple
+
+from weather_travel_agent.telemetry import external_call
+
+REVERSE_GEOCODE_RESULT_TYPES = (
+    "administrative_area_level_2|locality|administrative_area_level_3|sublocality"
+)
+
+
+@dataclass(frozen=True)
+class Place:
+    """County (or locality) resolved for a point, with short state/country codes."""
+
+    name: str
+    state: Optional[str] = None
+    country: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return ", ".join(p for p in (self.name, self.state, self.country) if p)
+
+    @property
+    def dedupe_key(self) -> Tuple[str, Optional[str]]:
+        return (self.name, self.state)
+
+
+class ReverseGeocoder(Protocol):
+    """Anything that can resolve a coordinate into a Place."""
+
+    async def reverse(self, lat: float, lon: float) -> Optional[Place]: ...
+
+
+def place_from_google(results: List[dict[str, Any]]) -> Optional[Place]:
+    """Pick the county (or locality) with state/country from a reverse geocode response."""
+    if not results:
+        return None
+
+    comp = results[0].get("address_components", [])
+
+    def find(kind: str) -> Optional[dict[str, Any]]:
+        return next((c for c in comp if kind in c.get("types", [])), None)
+
+    primary = find("administrative_area_level_2") or find("locality")
+    if not primary or not primary.get("long_name"):
+        return None
+
+    return Place(
+        name=primary["long_name"],
+        state=(find("administrative_area_level_1") or {}).get("short_name"),
+        country=(find("country") or {}).get("short_name"),
+    )
+
+
+class GoogleReverseGeocoder:
+    """
+    Reverse geocoder backed by the (blocking) googlemaps client. Calls are
+    offloaded to a bounded thread pool so they never block the event loop.
+    """
+
+    def __init__(self, gmaps_client, max_workers: int = 10):
+        self.gmaps_client = gmaps_client
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="reverse-geocode"
+        )
+
+    async def reverse(self, lat: float, lon: float) -> Optional[Place]:
+        loop = asyncio.get_running_loop()
+        with external_call("google", "reverse_geocode"):
+            results = await loop.run_in_executor(
+                self.executor,
+                partial(
+                    self.gmaps_client.reverse_geocode,
+                    (lat, lon),
+                    result_type=REVERSE_GEOCODE_RESULT_TYPES,
+                ),
+            )
+        return place_from_google(results or [])
+
+    async def shutdown(self) -> None:
+        """Stop the worker threads; lookups still queued are dropped."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class FallbackReverseGeocoder:
+    """Ask the primary geocoder first and the fallback only when it has no answer."""
+
+    def __init__(self, primary: ReverseGeocoder, fallback: ReverseGeocoder):
+        self.primary = primary
+        self.fallback = fallback
+
+    async def reverse(self, lat: float, lon: float) -> Optional[Place]:
+        place = await self.primary.reverse(lat, lon)
+        if place is not None:
+            return place
+        return await self.fallback.reverse(lat, lon)
+
+    async def shutdown(self) -> None:
+        await shutdown_geocoder(self.primary)
+        await shutdown_geocoder(self.fallback)
+
+
+async def shutdown_geocoder(geocoder: ReverseGeocoder) -> None:
+    """Release the resources of a geocoder that holds any (thread pools, ...)."""
+    if hasattr(geocoder, "shutdown"):
+        await geocoder.shutdown()
+
+
+async def reverse_geocode_each(
+    geocoder: ReverseGeocoder,
+    coords: Sequence[Tuple[float, float]],
+    concurrency: int,
+    timeout: float,
+) -> AsyncIterator[Tuple[int, Optional[Place]]]:
+    """
+    Reverse geocode all points concurrently, at most `concurrency` at a time,
+    yielding (index, place) pairs as each lookup finishes.
+
+    Failed or timed out lookups yield None for their place.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int, lat: float, lon: float) -> Tuple[int, Optional[Place]]:
+        async with semaphore:
+            try:
+                return i, await asyncio.wait_for(geocoder.reverse(lat, lon), timeout)
+            except asyncio.TimeoutError:
+                print(f"Reverse geocode timed out for ({lat}, {lon})")
+            except Exception as e:
+                print(f"Error reverse geocoding ({lat}, {lon}): {e}")
+            return i, None
+
+    tasks = [
+        asyncio.ensure_future(one(i, lat, lon)) for i, (lat, lon) in enumerate(coords)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Consumer stopped early: don't leave lookups running
+        for task in tasks:
+            task.cancel()
+
+
+async def reverse_geocode_all(
+    geocoder: ReverseGeocoder,
+    coords: Sequence[Tuple[float, float]],
+    concurrency: int,
+    timeout: float,
+) -> List[Optional[Place]]:
+    """
+    Reverse geocode all points concurrently, at most `concurrency` at a time.
+
+    Results are returned in the same order as `coords`; failed or timed out
+    lookups come back as None.
+    """
+    places: List[Optional[Place]] = [None] * len(coords)
+    async for i, place in reverse_geocode_each(geocoder, coords, concurrency, timeout):
+        places[i] = place
+    return places
+
+
+def first_per_place(
+    coords: Sequence[Tuple[float, float]],
+    places: Sequence[Optional[Place]],
+    max_stops: int,
+) -> List[dict[str, Any]]:
+    """
+    Keep the first point per place, walking in route order so dedupe and the
+    `max_stops` cutoff stay deterministic. Points without a place are skipped.
+    """
+    stops: List[dict[str, Any]] = []
+    seen = set()
+    for (lat, lon), place in zip(coords, places, strict=True):
+        if place is None or place.dedupe_key in seen:
+            continue
+
+        seen.add(place.dedupe_key)
+        stops.append({"name": place.label, "lat": lat, "lon": lon})
+
+        if len(stops) >= max_stops:
+            break
+
+    return stops
@@ -0,0 +1,9 @@
+from typing import Tuple
+
+
+def quantize(lat: float, lon: float, step: float) -> Tuple[float, float]:
+    """Snap a coordinate to the nearest node of a `step`-degree grid."""
+    return (
+        round(round(lat / step) * step, 6),
+        round(round(lon / step) * step, 6),
+    )
@@ -0,0 +1,184 @@
+from typing import List, Literal, Sequence, Tuple
+
+import geopy.distance
+import numpy as np
+
+DistanceMode = Literal["haversine", "ellipsoidal", "geodesic"]
+
+# Mean earth radius (IUGG) used by the spherical model
+EARTH_RADIUS_KM = 6371.0088
+
+# WGS-84 ellipsoid used by the ellipsoidal model
+WGS84_A_KM = 6378.137
+WGS84_F = 1 / 298.257223563
+
+
+def decode_polyline(encoded: str, precision: int = 5) -> np.ndarray:
+    """
+    Decode a Google encoded polyline into an (n, 2) array of (lat, lon).
+
+    Same values as googlemaps.convert.decode_polyline, but the chunks of
+    every value are decoded at once instead of character by character.
+    """
+    chunks = np.frombuffer(encoded.encode("ascii"), dtype=np.uint8) - np.uint8(63)
+    if len(chunks) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+
+    # A value ends at the first chunk without the continuation bit
+    last = (chunks & 0x20) == 0
+    if not last[-1] or np.count_nonzero(last) % 2:
+        raise ValueError("Truncated polyline")
+    ends = np.flatnonzero(last).astype(np.int32)
+    starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int32)
+
+    # Bit offset of every chunk within its value (narrow dtypes keep the peak low)
+    shift = np.arange(len(chunks), dtype=np.int32)
+    shift -= np.repeat(starts, ends - starts + 1)
+    shift *= 5
+
+    values = np.add.reduceat((chunks & 0x1F).astype(np.int64) << shift, starts)
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+    return np.cumsum(deltas.reshape(-1, 2), axis=0) * 10.0**-precision
+
+
+def as_array(coords: Sequence[Tuple[float, float]]) -> np.ndarray:
+    """Convert a sequence of (lat, lon) pairs into an (n, 2) float array."""
+    return np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+
+
+def _central_angle(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Haversine central angle in radians between paired points (radians in)."""
+    h = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+def haversine_segments(pts: np.ndarray) -> np.ndarray:
+    """Length in km of each segment of the route on a spherical earth."""
+    rad = np.radians(pts)
+    lat, lon = rad[:, 0], rad[:, 1]
+    return EARTH_RADIUS_KM * _central_angle(lat[:-1], lon[:-1], lat[1:], lon[1:])
+
+
+def ellipsoidal_segments(pts: np.ndarray) -> np.ndarray:
+    """
+    Length in km of each segment of the route on the WGS-84 ellipsoid.
+
+    Uses Lambert's formula for long lines, which stays within a few metres of
+    the exact geodesic for segment lengths found in route polylines.
+    """
+    rad = np.radians(pts)
+    beta = np.arctan((1 - WGS84_F) * np.tan(rad[:, 0]))
+    lon = rad[:, 1]
+    b1, b2 = beta[:-1], beta[1:]
+
+    sigma = _central_angle(b1, lon[:-1], b2, lon[1:])
+    p = (b1 + b2) / 2
+    q = (b2 - b1) / 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = (
+            (sigma - np.sin(sigma))
+            * (np.sin(p) * np.cos(q)) ** 2
+            / np.cos(sigma / 2) ** 2
+        )
+        y = (
+            (sigma + np.sin(sigma))
+            * (np.cos(p) * np.sin(q)) ** 2
+            / np.sin(sigma / 2) ** 2
+        )
+
+    correction = np.where(sigma > 0, x + y, 0.0)
+    return WGS84_A_KM * (sigma - WGS84_F / 2 * correction)
+
+
+def geodesic_segments(pts: np.ndarray) -> np.ndarray:
+    """Exact geodesic segment lengths in km (geopy/Karney, one call per segment)."""
+    return np.fromiter(
+        (
+            geopy.distance.distance(tuple(a), tuple(b)).km
+            for a, b in zip(pts[:-1], pts[1:], strict=False)
+        ),
+        dtype=np.float64,
+        count=max(len(pts) - 1, 0),
+    )
+
+
+_SEGMENT_FUNCS = {
+    "haversine": haversine_segments,
+    "ellipsoidal": ellipsoidal_segments,
+    "geodesic": geodesic_segments,
+}
+
+
+def cumulative_distances(
+    coords: Sequence[Tuple[float, float]] | np.ndarray,
+    mode: DistanceMode = "ellipsoidal",
+) -> np.ndarray:
+    """Cumulative distance in km from the first point to every point of the route."""
+    pts = as_array(coords)
+    cumulative = np.zeros(len(pts), dtype=np.float64)
+    if len(pts) > 1:
+        try:
+            segments = _SEGMENT_FUNCS[mode](pts)
+        except KeyError:
+            raise ValueError(f"Unknown distance mode: {mode}") from None
+        np.cumsum(segments, out=cumulative[1:])
+    return cumulative
+
+
+def sample_along(
+    coords: Sequence[Tuple[float, float]] | np.ndarray,
+    km_interval: float,
+    max_stops: int,
+    mode: DistanceMode = "ellipsoidal",
+) -> np.ndarray:
+    """
+    Spread up to `max_stops` points evenly along the route, roughly every
+    `km_interval` km, always including both ends.
+
+    Sample points are linearly interpolated between the two polyline vertices
+    that bracket each target distance. Returns an (n, 2) array of (lat, lon).
+    """
+    pts = as_array(coords)
+    if len(pts) == 0:
+        return pts
+
+    cumulative = cumulative_distances(pts, mode)
+    total_dist = cumulative[-1]
+    if total_dist == 0:
+        return pts[:1].copy()
+
+    num_stops = min(max_stops, max(2, int(total_dist // km_interval) + 1))
+    targets = np.linspace(0.0, total_dist, num_stops)
+
+    # Index of the first vertex at or beyond each target, as the end of its segment
+    hi = np.clip(np.searchsorted(cumulative, targets, side="left"), 1, len(pts) - 1)
+    lo = hi - 1
+
+    seg_len = cumulative[hi] - cumulative[lo]
+    frac = np.divide(
+        targets - cumulative[lo],
+        seg_len,
+        out=np.zeros_like(targets),
+        where=seg_len > 0,
+    )
+    frac = np.clip(frac, 0.0, 1.0)
+
+    start, end = pts[lo], pts[hi]
+    delta = end - start
+    # Interpolate across the antimeridian the short way round
+    delta[:, 1] = (delta[:, 1] + 180.0) % 360.0 - 180.0
+
+    sampled = start + delta * frac[:, None]
+    sampled[:, 1] = (sampled[:, 1] + 180.0) % 360.0 - 180.0
+    return sampled
+
+
+def to_tuples(pts: np.ndarray) -> List[Tuple[float, float]]:
+    """Convert an (n, 2) array back into a list of (lat, lon) tuples."""
+    return [(lat, lon) for lat, lon in pts.tolist()]
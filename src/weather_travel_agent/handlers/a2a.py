@@ -1,64 +1,315 @@
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import InMemoryQueueManager
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.tasks import (
+    DatabaseTaskStore,
+    InMemoryTaskStore,
+    TaskStore,
+    TaskUpdater,
+)
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
     AgentProvider,
     AgentSkill,
     DataPart,
+    Part,
+    TaskState,
     TextPart,
 )
-from a2a.utils.message import new_agent_parts_message, new_agent_text_message
+from a2a.utils.message import new_agent_text_message
+from a2a.utils.task import new_task
+from pydantic import ValidationError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
 
+from weather_travel_agent.agent.planner import TripPlanner
+from weather_travel_agent.agent.trips import trip_key
 from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.cache.singleflight import SharedStream
+from weather_travel_agent.handlers.batch import stream_batch
+from weather_travel_agent.models.batch import BatchTripsIn
 from weather_travel_agent.models.chat import ChatIn, ChatOut
+from weather_travel_agent.models.config import settings
+
+UpdateCallback = Callable[[str, TripState, TripState], Awaitable[None]]
+EventCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def trip_data(state: dict[str, Any]) -> dict[str, Any]:
+    """Structured trip details shared with clients to render the map."""
+    return {
+        "origin": state.get("origin"),
+        "destination": state.get("destination"),
+        "stops": state.get("stops"),
+        "forecasts": state.get("forecasts"),
+    }
+
+
+def batch_request(message) -> Optional[BatchTripsIn]:
+    """The structured batch carried by a data part of `message`, if any."""
+    for part in (message.parts if message else None) or []:
+        if isinstance(part.root, DataPart) and "trips" in part.root.data:
+            try:
+                return BatchTripsIn.model_validate(part.root.data)
+            except ValidationError:
+                return None
+    return None
+
+
+class TripProgress:
+    """Turns graph node updates and custom stream events into A2A task events."""
+
+    def __init__(self, updater: TaskUpdater):
+        self.updater = updater
+        self.forecasts_id = f"{updater.task_id}-forecasts"
+        self.forecast_chunks = 0
+        self.summary_id = f"{updater.task_id}-summary"
+        self.summary_chunks = 0
+        self.summary_text = ""
+
+    async def _status(
+        self, text: str, metadata: Optional[dict[str, Any]] = None
+    ) -> None:
+        await self.updater.update_status(
+            TaskState.working,
+            message=self.updater.new_agent_message(
+                [Part(root=TextPart(text=text))], metadata=metadata
+            ),
+        )
+
+    async def _forecast_chunk(self, data: dict[str, Any], last: bool = False) -> None:
+        await self.updater.add_artifact(
+            [Part(root=DataPart(data=data))],
+            artifact_id=self.forecasts_id,
+            name="forecasts",
+            append=self.forecast_chunks > 0,
+            last_chunk=last,
+        )
+        self.forecast_chunks += 1
+
+    async def _summary_chunk(
+        self, text: str, last: bool = False, replace: bool = False
+    ) -> None:
+        await self.updater.add_artifact(
+            [Part(root=TextPart(text=text))],
+            artifact_id=self.summary_id,
+            name="summary",
+            append=self.summary_chunks > 0 and not replace,
+            last_chunk=last,
+        )
+        self.summary_chunks += 1
+        self.summary_text = text if replace else self.summary_text + text
+
+    async def _stops(self, stops: list[dict[str, Any]]) -> None:
+        await self.updater.add_artifact(
+            [Part(root=DataPart(data={"stops": stops}))], name="stops"
+        )
+        await self._status(
+            f"Found {len(stops)} stops along the route, checking the weather."
+        )
+
+    async def on_event(self, event: dict[str, Any]) -> None:
+        """Forward stops, single stop forecasts and summary tokens as soon as they arrive."""
+        if event.get("type") == "stops":
+            await self._stops(event["stops"])
+        elif event.get("type") == "forecast":
+            await self._forecast_chunk(
+                {"index": event["index"], "forecast": event["forecast"]}
+            )
+        elif event.get("type") == "summary_token":
+            await self._summary_chunk(event["text"])
+
+    async def on_update(self, node: str, update: TripState, state: TripState) -> None:
+        """Publish a status or artifact event as soon as a graph node finishes."""
+        if update.get("need"):
+            return
+
+        if node == "gather_trip":
+            # Which extraction path answered (rule, cache, llm or state)
+            path = update.get("gather_path")
+            await self._status(
+                f"Planning a trip from {state.get('origin')} to {state.get('destination')}.",
+                metadata={"gather_path": path} if path else None,
+            )
+        elif node == "get_directions":
+            leg = (update.get("route", {}).get("legs") or [{}])[0]
+            distance = leg.get("distance", {}).get("text")
+            duration = leg.get("duration", {}).get("text")
+            details = ", ".join(d for d in (distance, duration) if d)
+            await self._status(f"Found a route{f' ({details})' if details else ''}.")
+        elif node == "hot_route":
+            if update.get("hot_route") and update.get("reply"):
+                # Fully precomputed: publish everything the later nodes would have
+                await self._stops(update.get("stops") or [])
+                await self._forecast_chunk(
+                    {"forecasts": update.get("forecasts") or []}, last=True
+                )
+                await self.updater.add_artifact(
+                    [Part(root=DataPart(data=trip_data(state)))], name="trip"
+                )
+                await self._summary_chunk(update["reply"], last=True)
+        elif node == "extract_cities":
+            await self._stops(update.get("stops", []))
+        elif node in ("get_weather", "route_weather"):
+            # Close the forecasts artifact with the full list in stop order
+            await self._forecast_chunk(
+                {"forecasts": update.get("forecasts", [])}, last=True
+            )
+            # Structured trip goes out before the summary so the map can render
+            await self.updater.add_artifact(
+                [Part(root=DataPart(data=trip_data(state)))], name="trip"
+            )
+            await self._status("Forecasts are in, writing up a summary.")
+        elif node == "share_forecast":
+            reply = update.get("reply")
+            if self.summary_chunks and reply == self.summary_text.strip():
+                await self._summary_chunk("", last=True)
+            elif reply:
+                # Nothing was streamed, or a cut-off stream fell back to the
+                # itinerary: send the reply whole, replacing any partial text
+                await self._summary_chunk(reply, last=True, replace=True)
 
 
 class WeatherTravelExecutor(AgentExecutor):
     """Agent executor for weather travel planning using LangGraph."""
 
-    def __init__(self, graph):
+    def __init__(
+        self,
+        graph,
+        coalesce: Optional[bool] = None,
+        planner: Optional[TripPlanner] = None,
+    ):
         self.graph = graph
+        # Plans structured batches without the graph's gather step
+        self.planner = planner
+        self.coalesce = settings.trip_coalescing if coalesce is None else coalesce
+        # Trip key -> (graph run, offset of its first event after gather)
+        self.flights: Dict[str, Tuple[SharedStream, int]] = {}
 
     async def execute(self, context: RequestContext, event_queue):
         text = context.get_user_input() or "no input"
-        payload = ChatIn(message=text)
-        result = await self._process_chat(payload)
 
-        parts = []
+        task = context.current_task or new_task(context.message)
+        if not context.current_task:
+            await event_queue.enqueue_event(task)
 
-        # Optional: early return if you're prompting for more info
-        if getattr(result, "need", None):
-            parts.append(TextPart(text=result.need))
-            await event_queue.enqueue_event(
-                new_agent_parts_message(
-                    parts,
-                    context_id=context.context_id,
-                    task_id=context.task_id,
+        updater = TaskUpdater(event_queue, task.id, task.context_id)
+        await updater.start_work()
+
+        try:
+            await self._respond(context, text, task.context_id, updater)
+        except Exception as e:
+            # Never leave the task stuck in `working`
+            await updater.failed(
+                message=updater.new_agent_message(
+                    [Part(root=TextPart(text=f"Sorry, planning this trip failed: {e}"))]
                 )
             )
+
+    async def _respond(
+        self, context: RequestContext, text: str, thread_id: str, updater: TaskUpdater
+    ) -> None:
+        batch = batch_request(context.message) if self.planner is not None else None
+        if batch is not None:
+            await self._process_batch(batch, updater)
+            return
+
+        progress = TripProgress(updater)
+        payload = ChatIn(message=text)
+        # Turns of one conversation share checkpointed graph state
+        result = await self._process_chat(
+            payload,
+            on_update=progress.on_update,
+            on_event=progress.on_event,
+            thread_id=thread_id,
+        )
+
+        # Prompting for more info ends the task waiting on the user
+        if getattr(result, "need", None):
+            await updater.requires_input(
+                message=updater.new_agent_message(
+                    [Part(root=TextPart(text=result.need))]
+                ),
+                final=True,
+            )
             return
 
+        parts = []
         if result.reply:
-            parts.append(TextPart(text=result.reply))
+            parts.append(Part(root=TextPart(text=result.reply)))
 
-        structured = {
-            "origin": result.origin,
-            "destination": result.destination,
-            "stops": result.stops,
-            "forecasts": result.forecasts,
-        }
+        structured = trip_data(result.model_dump())
         if any(v is not None for v in structured.values()):
-            parts.append(DataPart(data=structured))
+            parts.append(Part(root=DataPart(data=structured)))
 
-        # Enqueue a single message with multiple parts
-        await event_queue.enqueue_event(
-            new_agent_parts_message(
-                parts,
-                context_id=context.context_id,
-                task_id=context.task_id,
+        # Final message with the summary and the structured trip data
+        await updater.complete(message=updater.new_agent_message(parts))
+
+    async def _process_batch(self, batch: BatchTripsIn, updater: TaskUpdater) -> None:
+        """
+        Plan a structured batch of trips, adding each result to the "trips"
+        artifact as soon as its trip completes.
+        """
+        if len(batch.trips) > settings.batch_max_trips:
+            await updater.failed(
+                message=updater.new_agent_message(
+                    [
+                        Part(
+                            root=TextPart(
+                                text=f"At most {settings.batch_max_trips} trips per batch."
+                            )
+                        )
+                    ]
+                )
+            )
+            return
+
+        artifact_id = f"{updater.task_id}-trips"
+        # Counts are per requested trip; duplicates share one distinct trip
+        planned = failed = distinct = 0
+        async for results in stream_batch(self.planner, batch.trips, batch.summarize):
+            planned += len(results)
+            failed += sum(r.error is not None for r in results)
+            await updater.add_artifact(
+                [
+                    Part(root=DataPart(data=r.model_dump(exclude_none=True)))
+                    for r in results
+                ],
+                artifact_id=artifact_id,
+                name="trips",
+                append=distinct > 0,
+            )
+            distinct += 1
+
+        # Closing chunk tells the client the batch is complete
+        total = len(batch.trips)
+        done = {
+            "done": True,
+            "trips": total,
+            "planned": planned,
+            "failed": failed,
+            "distinct_trips": distinct,
+        }
+        await updater.add_artifact(
+            [Part(root=DataPart(data=done))],
+            artifact_id=artifact_id,
+            name="trips",
+            append=distinct > 0,
+            last_chunk=True,
+        )
+        await updater.complete(
+            message=updater.new_agent_message(
+                [
+                    Part(
+                        root=TextPart(
+                            text=f"Planned {total - failed} of {total} trips."
+                        )
+                    )
+                ]
             )
         )
 
@@ -73,14 +324,101 @@ class WeatherTravelExecutor(AgentExecutor):
             )
         )
 
-    async def _process_chat(self, body: ChatIn) -> ChatOut:
-        """Process chat input through the LangGraph workflow."""
+    def _join_flight(
+        self, update: TripState, run: SharedStream, offset: int
+    ) -> Optional[AsyncIterator[Any]]:
+        """
+        After gather, either register `run` as the flight for its trip, or
+        return a subscription to the flight already planning the same trip.
+        Follow-ups and incomplete trips are never shared.
+        """
+        if (
+            not self.coalesce
+            or update.get("need")
+            or update.get("gather_path") == "state"
+        ):
+            return None
+        if not update.get("origin") or not update.get("destination"):
+            return None
+
+        key = trip_key(update["origin"], update["destination"])
+        flight = self.flights.get(key)
+        if flight is not None and not flight[0].done and not flight[0].closing:
+            leader, start = flight
+            return leader.subscribe(start)
+
+        self.flights[key] = (run, offset)
+
+        def land(_: Any) -> None:
+            if self.flights.get(key, (None, 0))[0] is run:
+                del self.flights[key]
+
+        run.task.add_done_callback(land)
+        return None
+
+    async def _process_chat(
+        self,
+        body: ChatIn,
+        on_update: Optional[UpdateCallback] = None,
+        on_event: Optional[EventCallback] = None,
+        thread_id: Optional[str] = None,
+    ) -> ChatOut:
+        """
+        Process chat input through the LangGraph workflow, streaming each
+        node's update to `on_update` as soon as the node finishes, and custom
+        events written by nodes (e.g. single forecasts) to `on_event`.
+
+        With a checkpointer, `thread_id` picks the conversation whose stored
+        trip the graph resumes from.
+        """
         state: TripState = {
             "user_input": body.message or "",
         }
+        config = {"configurable": {"thread_id": thread_id}} if thread_id else None
+
+        # The run lives in its own task so other requests can share it
+        run = SharedStream(
+            self.graph.astream(state, config=config, stream_mode=["updates", "custom"])
+        )
+        events = run.subscribe()
+        consumed = 0
+        joined = False
+
+        # Run the graph, folding node updates into the final state
+        result: TripState = dict(state)
+        try:
+            while True:
+                try:
+                    mode, chunk = await anext(events)
+                except StopAsyncIteration:
+                    break
 
-        # Run the graph
-        result: TripState = await self.graph.ainvoke(state)
+                consumed += 1
+                if mode == "custom":
+                    if on_event is not None:
+                        await on_event(chunk)
+                    continue
+
+                for node, update in chunk.items():
+                    result.update(update or {})
+                    if on_update is not None:
+                        await on_update(node, update or {}, result)
+
+                if "gather_trip" in chunk and not joined:
+                    leader = self._join_flight(
+                        chunk["gather_trip"] or {}, run, consumed
+                    )
+                    if leader is not None:
+                        # Same trip already being planned: follow its events instead
+                        await events.aclose()
+                        events = leader
+                        joined = True
+        finally:
+            await events.aclose()
+
+        if joined and thread_id and getattr(self.graph, "checkpointer", None):
+            # Our own run stopped after gather; store the shared outcome as ours
+            await self.graph.aupdate_state(config, result, as_node="share_forecast")
 
         # If gather asked for more info, return need message directly
         if result.get("need"):
@@ -102,7 +440,7 @@ def build_agent_card(base_url: str = "http://localhost:8000") -> AgentCard:
         version="1.0.0",
         description="Plans driving itineraries and summarizes weather along the route",
         url=f"{base_url}/a2a",
-        default_input_modes=["text/plain"],
+        default_input_modes=["text/plain", "application/json"],
         default_output_modes=["text/plain"],
         provider=AgentProvider(
             organization="WeatherTravelCo",
@@ -116,18 +454,59 @@ def build_agent_card(base_url: str = "http://localhost:8000") -> AgentCard:
                 input_modes=["text/plain"],
                 output_modes=["text/plain", "application/json"],
                 tags=["weather", "travel"],
-            )
+            ),
+            AgentSkill(
+                id="itinerary.batch",
+                name="Plan a batch of itineraries",
+                description='Given a data part {"trips": [{"origin", "destination"}, ...]}, plan every trip and stream each result as it completes',
+                input_modes=["application/json"],
+                output_modes=["application/json"],
+                tags=["weather", "travel", "batch"],
+            ),
         ],
         capabilities=AgentCapabilities(streaming=True),
     )
 
 
-def create_request_handler(graph) -> DefaultRequestHandler:
+def create_task_store() -> TaskStore:
+    """Build the task store selected by settings.task_store."""
+    if settings.task_store == "memory":
+        return InMemoryTaskStore()
+
+    path = settings.task_store_path
+    if path != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    # Workers on the host share the file: wait on each other's write locks
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 30.0}
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _wal(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+    return DatabaseTaskStore(engine)
+
+
+async def close_task_store(task_store: TaskStore) -> None:
+    if isinstance(task_store, DatabaseTaskStore):
+        await task_store.engine.dispose()
+
+
+def create_request_handler(
+    graph,
+    task_store: Optional[TaskStore] = None,
+    planner: Optional[TripPlanner] = None,
+) -> DefaultRequestHandler:
     """Create a request handler with the weather travel executor."""
     # Create the executor
-    executor = WeatherTravelExecutor(graph)
+    executor = WeatherTravelExecutor(graph, planner=planner)
 
-    task_store = InMemoryTaskStore()
+    task_store = task_store or InMemoryTaskStore()
+    # Live event streams stay per worker; task state is in the task store
     queue_manager = InMemoryQueueManager()
 
     # Build the handler
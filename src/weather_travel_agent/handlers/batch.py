@@ -0,0 +1,86 @@
+import json
+from typing import Any, AsyncIterator, List, Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from weather_travel_agent.agent.planner import TripPlanner, plan_batch
+from weather_travel_agent.models.batch import BatchTrip, BatchTripOut, BatchTripsIn
+from weather_travel_agent.models.config import settings
+
+
+def batch_results(
+    trips: List[BatchTrip], indices: List[int], outcome: Any
+) -> List[BatchTripOut]:
+    """One result per requested trip that shared the planned `outcome`."""
+    results = []
+    for i in indices:
+        trip = trips[i]
+        out = BatchTripOut(
+            index=i, id=trip.id, origin=trip.origin, destination=trip.destination
+        )
+        if isinstance(outcome, Exception):
+            out.error = str(outcome) or type(outcome).__name__
+        else:
+            out.stops = outcome.get("stops")
+            out.forecasts = outcome.get("forecasts")
+            out.reply = outcome.get("reply")
+        results.append(out)
+    return results
+
+
+async def stream_batch(
+    planner: TripPlanner,
+    trips: List[BatchTrip],
+    summarize: bool = False,
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[List[BatchTripOut]]:
+    """Plan the trips, yielding the results of each distinct trip as it completes."""
+    pairs = [(t.origin, t.destination) for t in trips]
+    async for indices, outcome in plan_batch(
+        planner,
+        pairs,
+        concurrency=concurrency or settings.batch_concurrency,
+        summarize=summarize,
+    ):
+        yield batch_results(trips, indices, outcome)
+
+
+def create_batch_router(planner: TripPlanner) -> APIRouter:
+    """Batch trip planning from structured places, streamed back as NDJSON."""
+    router = APIRouter()
+
+    @router.post("/trips/batch")
+    async def plan_trips(body: BatchTripsIn) -> StreamingResponse:
+        if len(body.trips) > settings.batch_max_trips:
+            raise HTTPException(
+                status_code=413,
+                detail=f"At most {settings.batch_max_trips} trips per batch",
+            )
+
+        async def lines() -> AsyncIterator[str]:
+            # Counts are per requested trip; duplicates share one distinct trip
+            planned = failed = distinct = 0
+            async for results in stream_batch(planner, body.trips, body.summarize):
+                distinct += 1
+                planned += len(results)
+                for result in results:
+                    failed += result.error is not None
+                    yield result.model_dump_json(exclude_none=True) + "\n"
+            # Closing line tells the caller the batch is complete
+            yield (
+                json.dumps(
+                    {
+                        "done": True,
+                        "trips": len(body.trips),
+                        "planned": planned,
+                        "failed": failed,
+                        "distinct_trips": distinct,
+                    }
+                )
+                + "\n"
+            )
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return router
@@ -1,23 +1,46 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
 import uvicorn
 from a2a.server.apps.jsonrpc import A2AFastAPIApplication
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from langgraph.graph import END, StateGraph
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from weather_travel_agent.agent.checkpoint import close_checkpointer, open_checkpointer
 from weather_travel_agent.agent.conditions import (
     cont_after_directions,
+    cont_after_hot_route,
     should_continue_after_gather,
 )
+from weather_travel_agent.agent.hot_routes import (
+    HotRouteIndex,
+    HotRouteRefresher,
+    load_hot_routes,
+)
 from weather_travel_agent.agent.nodes.extract_cities import ExtractCitiesNode
 from weather_travel_agent.agent.nodes.gather_trip import GatherTripNode
 from weather_travel_agent.agent.nodes.get_directions import GetDirectionsNode
 from weather_travel_agent.agent.nodes.get_weather import GetWeatherNode
+from weather_travel_agent.agent.nodes.hot_route import HotRouteNode
+from weather_travel_agent.agent.nodes.route_weather import RouteWeatherNode
 from weather_travel_agent.agent.nodes.share_forecast import ShareForecastNode
+from weather_travel_agent.agent.planner import TripPlanner
 from weather_travel_agent.agent.types import TripState
-from weather_travel_agent.handlers.a2a import build_agent_card, create_request_handler
+from weather_travel_agent.cache.backends import close_cache_backend
+from weather_travel_agent.cache.stats import snapshot as cache_snapshot
+from weather_travel_agent.handlers.a2a import (
+    build_agent_card,
+    close_task_store,
+    create_request_handler,
+    create_task_store,
+)
+from weather_travel_agent.handlers.batch import create_batch_router
 from weather_travel_agent.models.config import settings
+from weather_travel_agent.telemetry import instrument_node
 
 # Load and validate config settings
 try:
@@ -26,9 +49,31 @@ except ValueError as e:
     print(f"Configuration error: {e}")
     raise SystemExit(1)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open long-lived clients owned by graph nodes, and close them on shutdown
+    for node in nodes.values():
+        if hasattr(node, "startup"):
+            await node.startup()
+    # Conversation state per A2A context, shared by workers through the sqlite file
+    graph.checkpointer = await open_checkpointer()
+    try:
+        yield
+    finally:
+        for node in nodes.values():
+            if hasattr(node, "shutdown"):
+                await node.shutdown()
+        await close_cache_backend()
+        await close_checkpointer(graph.checkpointer)
+        graph.checkpointer = None
+        await close_task_store(task_store)
+
+
 app = FastAPI(
     title="LangGraph Weather Travel Agent (A2A)",
     description="Agent example app for a travel agent that provides weather details with an A2A interface.",
+    lifespan=lifespan,
 )
 
 
@@ -37,44 +82,125 @@ def health():
     return {"ok": True}
 
 
-def build_graph():
-    builder = StateGraph(TripState)
+@app.get("/cache/stats")
+def cache_stats():
+    return cache_snapshot()
 
-    gather_trip_node = GatherTripNode()
-    get_directions_node = GetDirectionsNode()
-    extract_cities_node = ExtractCitiesNode()
-    get_weather_node = GetWeatherNode()
-    share_forecast_node = ShareForecastNode()
 
-    builder.add_node("gather_trip", gather_trip_node)
-    builder.add_node("get_directions", get_directions_node)
-    builder.add_node("extract_cities", extract_cities_node)
-    builder.add_node("get_weather", get_weather_node)
-    builder.add_node("share_forecast", share_forecast_node)
+@app.get("/metrics")
+def metrics():
+    # Node and external call latencies, plus the /cache/stats counters
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
-    builder.set_entry_point("gather_trip")
 
-    builder.add_conditional_edges(
-        "gather_trip",
-        should_continue_after_gather,
-        {"get_directions": "get_directions", END: END},
-    )
-    builder.add_conditional_edges(
-        "get_directions",
-        cont_after_directions,
-        {"extract_cities": "extract_cities", END: END},
+# Nodes that plan a trip once origin and destination are known, in order
+PLANNER_STAGES = ("get_directions", "extract_cities", "get_weather", "route_weather")
+
+
+def build_planner(nodes: Dict[str, Any]) -> TripPlanner:
+    """Plan trips with the graph's own nodes, skipping gather."""
+    return TripPlanner(
+        [nodes[name] for name in PLANNER_STAGES if name in nodes],
+        summarize=nodes.get("share_forecast"),
     )
 
-    builder.add_edge("extract_cities", "get_weather")
-    builder.add_edge("get_weather", "share_forecast")
+
+def build_nodes() -> Dict[str, Any]:
+    if settings.route_pipeline:
+        # Stops and forecasts overlap in one stage
+        stages = {
+            "route_weather": RouteWeatherNode(ExtractCitiesNode(), GetWeatherNode()),
+        }
+    else:
+        weather = GetWeatherNode()
+        stages = {
+            "extract_cities": ExtractCitiesNode(
+                prefetcher=weather.prefetcher if settings.weather_prefetch else None
+            ),
+            "get_weather": weather,
+        }
+
+    trip_nodes = {
+        "get_directions": GetDirectionsNode(),
+        **stages,
+        "share_forecast": ShareForecastNode(),
+    }
+
+    hot: Dict[str, Any] = {}
+    if settings.hot_routes_path:
+        # Started before (and stopped before) the nodes whose clients it uses
+        index = HotRouteIndex(max_age=settings.hot_routes_max_age_s)
+        for origin, destination in load_hot_routes(settings.hot_routes_path):
+            index.add(origin, destination)
+        refresher = HotRouteRefresher(
+            index,
+            build_planner(trip_nodes),
+            interval=settings.hot_routes_refresh_s,
+            concurrency=settings.hot_routes_concurrency,
+            summarize=settings.hot_routes_summary,
+        )
+        hot = {"hot_route": HotRouteNode(index, refresher)}
+
+    return {"gather_trip": GatherTripNode(), **hot, **trip_nodes}
+
+
+def build_graph(nodes: Optional[Dict[str, Any]] = None, checkpointer=None):
+    builder = StateGraph(TripState)
+    nodes = nodes or build_nodes()
+
+    for name, node in nodes.items():
+        builder.add_node(name, instrument_node(name, node))
+
+    builder.set_entry_point("gather_trip")
+
+    if "hot_route" in nodes:
+        # Precomputed corridors are looked up before any external call
+        builder.add_conditional_edges(
+            "gather_trip",
+            should_continue_after_gather,
+            {"get_directions": "hot_route", END: END},
+        )
+        builder.add_conditional_edges(
+            "hot_route",
+            cont_after_hot_route,
+            {"get_directions": "get_directions", END: END},
+        )
+    else:
+        builder.add_conditional_edges(
+            "gather_trip",
+            should_continue_after_gather,
+            {"get_directions": "get_directions", END: END},
+        )
+    if "route_weather" in nodes:
+        builder.add_conditional_edges(
+            "get_directions",
+            cont_after_directions,
+            {"extract_cities": "route_weather", END: END},
+        )
+        builder.add_edge("route_weather", "share_forecast")
+    else:
+        builder.add_conditional_edges(
+            "get_directions",
+            cont_after_directions,
+            {"extract_cities": "extract_cities", END: END},
+        )
+        builder.add_edge("extract_cities", "get_weather")
+        builder.add_edge("get_weather", "share_forecast")
+
     builder.add_edge("share_forecast", END)
 
-    return builder.compile()
+    return builder.compile(checkpointer=checkpointer)
 
 
-graph = build_graph()
+nodes = build_nodes()
+graph = build_graph(nodes)
+task_store = create_task_store()
 agent_card = build_agent_card()
-handler = create_request_handler(graph)
+planner = build_planner(nodes)
+handler = create_request_handler(graph, task_store=task_store, planner=planner)
+
+# Structured batches skip gather and stream NDJSON results
+app.include_router(create_batch_router(planner))
 
 a2a_app = A2AFastAPIApplication(agent_card=agent_card, http_handler=handler).build()
 app.mount("/a2a", a2a_app)
@@ -0,0 +1,29 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BatchTrip(BaseModel):
+    origin: str = Field(..., min_length=1)
+    destination: str = Field(..., min_length=1)
+    id: Optional[str] = Field(
+        None, description="Caller's reference, echoed back in the result"
+    )
+
+
+class BatchTripsIn(BaseModel):
+    trips: List[BatchTrip] = Field(..., min_length=1)
+    summarize: bool = Field(
+        False, description="Also write the LLM summary for every trip"
+    )
+
+
+class BatchTripOut(BaseModel):
+    index: int
+    id: Optional[str] = None
+    origin: str
+    destination: str
+    stops: Optional[List[Dict[str, Any]]] = None
+    forecasts: Optional[List[Dict[str, Any]]] = None
+    reply: Optional[str] = None
+    error: Optional[str] = None
@@ -15,6 +15,12 @@ class Settings(BaseSettings):
         alias="GOOGLE_MAPS_API_KEY",
     )
 
+    google_maps_base_url: str = Field(
+        default="https://maps.googleapis.com",
+        description="Base URL of the Google Maps APIs",
+        alias="GOOGLE_MAPS_BASE_URL",
+    )
+
     openweather_api_key: str = Field(
         default="",
         description="OpenWeather API key for weather data",
@@ -49,15 +55,480 @@ class Settings(BaseSettings):
         le=50,
     )
 
+    distance_mode: Literal["haversine", "ellipsoidal", "geodesic"] = Field(
+        default="ellipsoidal",
+        description="Distance model for route sampling: haversine (fastest), ellipsoidal (WGS-84, vectorized) or geodesic (exact, slow)",
+        alias="DISTANCE_MODE",
+    )
+
+    directions_concurrency: int = Field(
+        default=8,
+        description="Maximum number of Directions API calls in flight at once",
+        alias="DIRECTIONS_CONCURRENCY",
+        ge=1,
+    )
+
+    directions_timeout_s: float = Field(
+        default=15.0,
+        description="Timeout in seconds for a Directions API call",
+        alias="DIRECTIONS_TIMEOUT_S",
+        gt=0,
+    )
+
+    directions_cache_enabled: bool = Field(
+        default=True,
+        description="Cache directions by normalized (origin, destination, mode)",
+        alias="DIRECTIONS_CACHE_ENABLED",
+    )
+
+    directions_cache_ttl_s: int = Field(
+        default=6 * 3600,
+        description="Time to live in seconds for cached directions",
+        alias="DIRECTIONS_CACHE_TTL_S",
+        gt=0,
+    )
+
+    directions_cache_size: int = Field(
+        default=1_000,
+        description="Maximum number of routes kept in the in-process directions cache",
+        alias="DIRECTIONS_CACHE_SIZE",
+        ge=1,
+    )
+
+    directions_cache_shared: bool = Field(
+        default=True,
+        description="Also keep directions in the shared cache backend",
+        alias="DIRECTIONS_CACHE_SHARED",
+    )
+
+    geocode_concurrency: int = Field(
+        default=10,
+        description="Maximum number of reverse geocode calls in flight per request",
+        alias="GEOCODE_CONCURRENCY",
+        ge=1,
+        le=50,
+    )
+
+    geocode_timeout_s: float = Field(
+        default=10.0,
+        description="Timeout in seconds for a single reverse geocode call",
+        alias="GEOCODE_TIMEOUT_S",
+        gt=0,
+    )
+
+    cache_backend: Literal["memory", "sqlite", "redis"] = Field(
+        default="sqlite",
+        description="Shared cache backend for external lookups",
+        alias="CACHE_BACKEND",
+    )
+
+    cache_sqlite_path: str = Field(
+        default=".cache/cache.sqlite3",
+        description="SQLite file used by the sqlite cache backend",
+        alias="CACHE_SQLITE_PATH",
+    )
+
+    cache_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="URL of the Redis-compatible server used by the redis cache backend",
+        alias="CACHE_REDIS_URL",
+    )
+
+    cache_redis_pool_size: int = Field(
+        default=4,
+        description="Maximum open connections to the redis cache backend",
+        alias="CACHE_REDIS_POOL_SIZE",
+        ge=1,
+    )
+
+    cache_key_prefix: str = Field(
+        default="wta",
+        description="Prefix for keys in the redis cache backend",
+        alias="CACHE_KEY_PREFIX",
+    )
+
+    cache_memory_size: int = Field(
+        default=10_000,
+        description="Maximum number of entries held by the memory cache backend",
+        alias="CACHE_MEMORY_SIZE",
+        ge=1,
+    )
+
+    task_store: Literal["memory", "sqlite"] = Field(
+        default="sqlite",
+        description="Where A2A tasks are kept; sqlite is shared by all workers on the host",
+        alias="TASK_STORE",
+    )
+
+    task_store_path: str = Field(
+        default=".cache/tasks.sqlite3",
+        description="SQLite file used by the sqlite task store",
+        alias="TASK_STORE_PATH",
+    )
+
+    checkpointer: Literal["none", "memory", "sqlite"] = Field(
+        default="sqlite",
+        description="LangGraph checkpointer keeping conversation state per A2A context",
+        alias="CHECKPOINTER",
+    )
+
+    checkpoint_path: str = Field(
+        default=".cache/checkpoints.sqlite3",
+        description="SQLite file used by the sqlite checkpointer",
+        alias="CHECKPOINT_PATH",
+    )
+
+    trip_coalescing: bool = Field(
+        default=True,
+        description="Let concurrent requests for the same trip share one graph run after gather",
+        alias="TRIP_COALESCING",
+    )
+
+    hot_routes_path: Optional[str] = Field(
+        default=None,
+        description='JSON list of {"origin", "destination"} corridors to precompute in the background',
+        alias="HOT_ROUTES_PATH",
+    )
+
+    hot_routes_refresh_s: float = Field(
+        default=600.0,
+        description="Seconds between background refreshes of the hot routes",
+        alias="HOT_ROUTES_REFRESH_S",
+        gt=0,
+    )
+
+    hot_routes_max_age_s: float = Field(
+        default=1800.0,
+        description="Oldest precomputed hot route (in seconds) still served to requests",
+        alias="HOT_ROUTES_MAX_AGE_S",
+        gt=0,
+    )
+
+    hot_routes_concurrency: int = Field(
+        default=2,
+        description="Hot routes refreshed at the same time",
+        alias="HOT_ROUTES_CONCURRENCY",
+        ge=1,
+    )
+
+    hot_routes_summary: bool = Field(
+        default=False,
+        description="Also precompute the LLM summary, so hot routes need no inline work at all",
+        alias="HOT_ROUTES_SUMMARY",
+    )
+
+    batch_concurrency: int = Field(
+        default=8,
+        description="Distinct trips of a batch request planned at the same time",
+        alias="BATCH_CONCURRENCY",
+        ge=1,
+    )
+
+    batch_max_trips: int = Field(
+        default=5000,
+        description="Most trips accepted in one batch request",
+        alias="BATCH_MAX_TRIPS",
+        ge=1,
+    )
+
+    geocoder: Literal["google", "offline", "offline_fallback"] = Field(
+        default="google",
+        description="Reverse geocoder: Google, offline boundary index, or offline with Google fallback",
+        alias="GEOCODER",
+    )
+
+    boundaries_path: Optional[str] = Field(
+        default=None,
+        description="GeoJSON file of administrative boundaries for the offline geocoder",
+        alias="BOUNDARIES_PATH",
+    )
+
+    geocode_cache_enabled: bool = Field(
+        default=True,
+        description="Cache reverse geocodes by geohash cell",
+        alias="GEOCODE_CACHE_ENABLED",
+    )
+
+    geocode_cache_precision: int = Field(
+        default=5,
+        description="Geohash precision of reverse geocode cache cells (5 is roughly 5km)",
+        alias="GEOCODE_CACHE_PRECISION",
+        ge=1,
+        le=9,
+    )
+
+    geocode_cache_ttl_s: int = Field(
+        default=30 * 24 * 3600,
+        description="Time to live in seconds for cached reverse geocodes",
+        alias="GEOCODE_CACHE_TTL_S",
+        gt=0,
+    )
+
+    geocode_cache_size: int = Field(
+        default=10_000,
+        description="Maximum number of cells kept in the in-process reverse geocode cache",
+        alias="GEOCODE_CACHE_SIZE",
+        ge=1,
+    )
+
+    geocode_cache_shared: bool = Field(
+        default=True,
+        description="Also keep reverse geocodes in the shared cache backend",
+        alias="GEOCODE_CACHE_SHARED",
+    )
+
+    geocode_cache_neighbours: int = Field(
+        default=6,
+        description="Agreeing neighbour cells (of 8) needed to answer a miss without an API call; 0 disables",
+        alias="GEOCODE_CACHE_NEIGHBOURS",
+        ge=0,
+        le=8,
+    )
+
+    openweather_base_url: str = Field(
+        default="https://api.openweathermap.org",
+        description="Base URL of the OpenWeather API",
+        alias="OPENWEATHER_BASE_URL",
+    )
+
+    weather_concurrency: int = Field(
+        default=10,
+        description="Maximum number of OpenWeather requests in flight at once",
+        alias="WEATHER_CONCURRENCY",
+        ge=1,
+    )
+
+    weather_stop_deadline_s: Optional[float] = Field(
+        default=10.0,
+        description="Seconds to wait for stop forecasts before reporting the rest as pending; unset waits for all",
+        alias="WEATHER_STOP_DEADLINE_S",
+        gt=0,
+    )
+
+    route_pipeline: bool = Field(
+        default=False,
+        description="Fetch each stop's forecast as soon as it is geocoded instead of after all stops resolve",
+        alias="ROUTE_PIPELINE",
+    )
+
+    weather_prefetch: bool = Field(
+        default=False,
+        description="Start forecast fetches for sampled points while they are still being reverse geocoded",
+        alias="WEATHER_PREFETCH",
+    )
+
+    forecast_scheduler: bool = Field(
+        default=False,
+        description="Collect forecast fetches from all trips over a short window and fetch each grid cell once",
+        alias="FORECAST_SCHEDULER",
+    )
+
+    forecast_batch_window_ms: float = Field(
+        default=5.0,
+        description="Milliseconds the forecast scheduler collects requests before fetching",
+        alias="FORECAST_BATCH_WINDOW_MS",
+        ge=0,
+    )
+
+    forecast_rate_per_s: Optional[float] = Field(
+        default=None,
+        description="Upstream forecast fetches per second allowed by the scheduler (per worker); unset is unlimited",
+        alias="FORECAST_RATE_PER_S",
+        gt=0,
+    )
+
+    forecast_rate_burst: int = Field(
+        default=10,
+        description="Forecast fetches the scheduler may start at once before the rate applies",
+        alias="FORECAST_RATE_BURST",
+        ge=1,
+    )
+
+    forecast_cache_enabled: bool = Field(
+        default=True,
+        description="Cache OpenWeather forecasts by quantized coordinates",
+        alias="FORECAST_CACHE_ENABLED",
+    )
+
+    forecast_cache_grid_deg: float = Field(
+        default=0.05,
+        description="Grid size in degrees that forecast coordinates are snapped to",
+        alias="FORECAST_CACHE_GRID_DEG",
+        gt=0,
+        le=1,
+    )
+
+    forecast_cache_ttl_s: int = Field(
+        default=600,
+        description="Time to live in seconds for cached forecasts",
+        alias="FORECAST_CACHE_TTL_S",
+        gt=0,
+    )
+
+    forecast_cache_size: int = Field(
+        default=5_000,
+        description="Maximum number of forecast cells kept in memory",
+        alias="FORECAST_CACHE_SIZE",
+        ge=1,
+    )
+
+    forecast_cache_shared: bool = Field(
+        default=True,
+        description="Also keep forecasts in the shared cache backend",
+        alias="FORECAST_CACHE_SHARED",
+    )
+
+    http_timeout_s: float = Field(
+        default=20.0,
+        description="Timeout in seconds for outbound HTTP requests",
+        alias="HTTP_TIMEOUT_S",
+        gt=0,
+    )
+
+    http_max_connections: int = Field(
+        default=100,
+        description="Maximum connections in the shared HTTP client pool",
+        alias="HTTP_MAX_CONNECTIONS",
+        ge=1,
+    )
+
+    http_max_keepalive: int = Field(
+        default=20,
+        description="Maximum idle keep-alive connections kept in the pool",
+        alias="HTTP_MAX_KEEPALIVE",
+        ge=0,
+    )
+
+    http_keepalive_expiry_s: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection is kept open",
+        alias="HTTP_KEEPALIVE_EXPIRY_S",
+        gt=0,
+    )
+
+    http2: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 for outbound requests when the server supports it",
+        alias="HTTP2",
+    )
+
+    http_retries: int = Field(
+        default=3,
+        description="Retries for outbound requests failing with 429/5xx or a transport error",
+        alias="HTTP_RETRIES",
+        ge=0,
+    )
+
+    http_backoff_base_s: float = Field(
+        default=0.25,
+        description="Base delay in seconds for jittered exponential backoff",
+        alias="HTTP_BACKOFF_BASE_S",
+        gt=0,
+    )
+
+    http_backoff_max_s: float = Field(
+        default=5.0,
+        description="Maximum backoff delay in seconds between retries",
+        alias="HTTP_BACKOFF_MAX_S",
+        gt=0,
+    )
+
     mock_weather: bool = False
     mock_seed: Optional[int] = None
 
+    openai_base_url: Optional[str] = Field(
+        default=None,
+        description="Base URL of an OpenAI-compatible API; unset uses OpenAI",
+        alias="OPENAI_BASE_URL",
+    )
+
     openai_model: str = Field(
         default="gpt-4o-mini",
         description="OpenAI model to use for LLM extraction fallback",
         alias="OPENAI_MODEL",
     )
 
+    gather_cache_enabled: bool = Field(
+        default=True,
+        description="Cache LLM origin/destination extraction by normalized message text",
+        alias="GATHER_CACHE_ENABLED",
+    )
+
+    gather_cache_ttl_s: int = Field(
+        default=24 * 3600,
+        description="Time to live in seconds for cached extractions",
+        alias="GATHER_CACHE_TTL_S",
+        gt=0,
+    )
+
+    gather_cache_size: int = Field(
+        default=1_000,
+        description="Maximum number of messages kept in the extraction cache",
+        alias="GATHER_CACHE_SIZE",
+        ge=1,
+    )
+
+    gather_cache_shared: bool = Field(
+        default=True,
+        description="Also keep extractions in the shared cache backend (exact messages only)",
+        alias="GATHER_CACHE_SHARED",
+    )
+
+    gather_cache_semantic_threshold: Optional[float] = Field(
+        default=None,
+        description="Cosine similarity above which a similar cached message is reused (e.g. 0.9); unset disables",
+        alias="GATHER_CACHE_SEMANTIC_THRESHOLD",
+        gt=0,
+        le=1,
+    )
+
+    gather_rules_enabled: bool = Field(
+        default=True,
+        description="Parse plain 'X to Y' messages with rules before calling the LLM",
+        alias="GATHER_RULES_ENABLED",
+    )
+
+    gazetteer_path: Optional[str] = Field(
+        default=None,
+        description="Optional file of known place names (one per line) the rule parser must match",
+        alias="GAZETTEER_PATH",
+    )
+
+    llm_concurrency: int = Field(
+        default=8,
+        description="Maximum OpenAI calls in flight per worker, shared by all graph nodes",
+        alias="LLM_CONCURRENCY",
+        ge=1,
+    )
+
+    llm_timeout_s: float = Field(
+        default=10.0,
+        description="Seconds to wait for a single (non-streaming) OpenAI call before retrying",
+        alias="LLM_TIMEOUT_S",
+        gt=0,
+    )
+
+    llm_retries: int = Field(
+        default=2,
+        description="Retries for OpenAI calls failing with a timeout, 429/5xx or a connection error",
+        alias="LLM_RETRIES",
+        ge=0,
+    )
+
+    summary_timeout_s: float = Field(
+        default=15.0,
+        description="Seconds to wait for the LLM trip summary before replying with the plain itinerary",
+        alias="SUMMARY_TIMEOUT_S",
+        gt=0,
+    )
+
+    summary_chunk_timeout_s: float = Field(
+        default=5.0,
+        description="Seconds to wait for each streamed summary chunk before treating the stream as stalled",
+        alias="SUMMARY_CHUNK_TIMEOUT_S",
+        gt=0,
+    )
+
     host: str = Field(
         default="0.0.0.0", description="Host address for the FastAPI server"
     )
@@ -70,6 +541,8 @@ class Settings(BaseSettings):
 
     def validate_required_keys(self) -> None:
         """Validate that required API keys are provided."""
+        if self.geocoder != "google" and not self.boundaries_path:
+            raise ValueError("BOUNDARIES_PATH is required for the offline geocoder")
         if not self.google_maps_api_key:
             raise ValueError("GOOGLE_MAPS_API_KEY is required")
         if not self.openweather_api_key:
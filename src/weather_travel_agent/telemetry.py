@@ -0,0 +1,153 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Sequence
+
+from opentelemetry import trace
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.cache.stats import CacheStats, registered
+
+tracer = trace.get_tracer("weather_travel_agent")
+
+# Upstream calls range from cached-connection milliseconds to LLM summaries
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+NODE_SECONDS = Histogram(
+    "weather_agent_node_duration_seconds",
+    "Time spent in each graph node",
+    ["node"],
+    buckets=LATENCY_BUCKETS,
+)
+NODE_ERRORS = Counter(
+    "weather_agent_node_errors_total",
+    "Graph node calls that raised",
+    ["node"],
+)
+NODE_IN_PROGRESS = Gauge(
+    "weather_agent_node_in_progress",
+    "Graph node calls currently running",
+    ["node"],
+)
+
+EXTERNAL_SECONDS = Histogram(
+    "weather_agent_external_call_duration_seconds",
+    "Time spent in calls to external services, including retries",
+    ["service", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+EXTERNAL_ERRORS = Counter(
+    "weather_agent_external_call_errors_total",
+    "External service calls that failed",
+    ["service", "operation"],
+)
+EXTERNAL_IN_PROGRESS = Gauge(
+    "weather_agent_external_call_in_progress",
+    "External service calls currently in flight",
+    ["service", "operation"],
+)
+
+
+@contextmanager
+def _observe(
+    seconds: Histogram,
+    errors: Counter,
+    in_progress: Gauge,
+    labels: Sequence[str],
+    span: str,
+    attributes: dict[str, Any],
+) -> Iterator[None]:
+    in_progress.labels(*labels).inc()
+    start = time.perf_counter()
+    with tracer.start_as_current_span(span, attributes=attributes):
+        try:
+            yield
+        except Exception:
+            errors.labels(*labels).inc()
+            raise
+        finally:
+            seconds.labels(*labels).observe(time.perf_counter() - start)
+            in_progress.labels(*labels).dec()
+
+
+@contextmanager
+def external_call(service: str, operation: str) -> Iterator[None]:
+    """Time a call to an external service, in metrics and as an OpenTelemetry span."""
+    with _observe(
+        EXTERNAL_SECONDS,
+        EXTERNAL_ERRORS,
+        EXTERNAL_IN_PROGRESS,
+        (service, operation),
+        f"{service}.{operation}",
+        {"peer.service": service, "operation": operation},
+    ):
+        yield
+
+
+def instrument_node(
+    name: str, node: Callable[[TripState], Awaitable[TripState]]
+) -> Callable[[TripState], Awaitable[TripState]]:
+    """Wrap a graph node so every call is timed and traced under its name."""
+
+    async def run(state: TripState) -> TripState:
+        with _observe(
+            NODE_SECONDS,
+            NODE_ERRORS,
+            NODE_IN_PROGRESS,
+            (name,),
+            f"node.{name}",
+            {"graph.node": name},
+        ):
+            return await node(state)
+
+    return run
+
+
+class StatsCollector:
+    """Exposes the cache and component stats registry as Prometheus metrics."""
+
+    def collect(self):
+        hits = CounterMetricFamily(
+            "weather_agent_cache_hits", "Cache hits", labels=["cache"]
+        )
+        tiers = CounterMetricFamily(
+            "weather_agent_cache_tier_lookups",
+            "Lookups answered by each cache tier (memory, coalesced, shared)",
+            labels=["cache", "tier"],
+        )
+        misses = CounterMetricFamily(
+            "weather_agent_cache_misses", "Cache misses", labels=["cache"]
+        )
+        evictions = CounterMetricFamily(
+            "weather_agent_cache_evictions", "Cache evictions", labels=["cache"]
+        )
+        hit_ratio = GaugeMetricFamily(
+            "weather_agent_cache_hit_ratio",
+            "Hits over lookups since start",
+            labels=["cache"],
+        )
+        other = GaugeMetricFamily(
+            "weather_agent_stat",
+            "Numeric stats of other components (prefetcher, scheduler, hot routes)",
+            labels=["component", "stat"],
+        )
+
+        for name, stats in sorted(registered().items()):
+            if isinstance(stats, CacheStats):
+                hits.add_metric([name], stats.hits)
+                for tier, count in stats.tiers.items():
+                    tiers.add_metric([name, tier], count)
+                misses.add_metric([name], stats.misses)
+                evictions.add_metric([name], stats.evictions)
+                hit_ratio.add_metric([name], stats.hit_rate)
+                continue
+
+            for stat, value in stats.as_dict().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    other.add_metric([name, stat], value)
+
+        yield from (hits, tiers, misses, evictions, hit_ratio, other)
+
+
+REGISTRY.register(StatsCollector())
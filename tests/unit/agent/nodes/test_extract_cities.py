@@ -0,0 +1,140 @@
+# tests/unit/agent/nodes/test_extract_cities.py
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from weather_travel_agent.agent.nodes.extract_cities import ExtractCitiesNode
+from weather_travel_agent.geo.geocoder import GoogleReverseGeocoder, Place
+
+
+def google_result(county, state="TN", country="US"):
+    return [
+        {
+            "address_components": [
+                {"long_name": county, "types": ["administrative_area_level_2"]},
+                {"short_name": state, "types": ["administrative_area_level_1"]},
+                {"short_name": country, "types": ["country"]},
+            ]
+        }
+    ]
+
+
+class FakeGmapsClient:
+    """Blocking stand-in for googlemaps.Client that tracks overlapping calls."""
+
+    def __init__(self, counties, delay=0.05):
+        self.counties = counties
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def reverse_geocode(self, latlng, result_type=None):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return google_result(self.counties[latlng])
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class FakeGeocoder:
+    """Async geocoder with random latency that tracks peak concurrency."""
+
+    def __init__(self, places, fail=()):
+        self.places = places
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def reverse(self, lat, lon):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(random.uniform(0.0, 0.02))
+            if (lat, lon) in self.fail:
+                raise RuntimeError("boom")
+            return self.places[(lat, lon)]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def coords():
+    return [(36.0, -86.0 + i * 0.1) for i in range(8)]
+
+
+@pytest.mark.asyncio
+async def test_resolve_stops_dedupes_in_route_order(coords, monkeypatch):
+    counties = ["A", "A", "B", "C", "B", "C", "D", "D"]
+    geocoder = FakeGeocoder({c: Place(n, "TN", "US") for c, n in zip(coords, counties, strict=True)})
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.extract_cities.settings.geocode_concurrency", 3)
+    node = ExtractCitiesNode(geocoder=geocoder)
+
+    stops = await node.resolve_stops(coords)
+
+    assert [s["name"] for s in stops] == ["A, TN, US", "B, TN, US", "C, TN, US", "D, TN, US"]
+    assert [(s["lat"], s["lon"]) for s in stops] == [coords[0], coords[2], coords[3], coords[6]]
+    assert geocoder.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_stops_skips_failures_and_applies_cutoff(coords, monkeypatch):
+    geocoder = FakeGeocoder(
+        {c: Place(str(i)) for i, c in enumerate(coords)}, fail=[coords[1]]
+    )
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.extract_cities.settings.max_stops", 3)
+    node = ExtractCitiesNode(geocoder=geocoder)
+
+    stops = await node.resolve_stops(coords)
+
+    assert [s["name"] for s in stops] == ["0", "2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_google_geocoder_runs_calls_concurrently(coords, monkeypatch):
+    client = FakeGmapsClient({c: f"County {i}" for i, c in enumerate(coords)}, delay=0.1)
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.extract_cities.settings.geocode_concurrency", 8)
+    geocoder = GoogleReverseGeocoder(client, max_workers=8)
+    node = ExtractCitiesNode(geocoder=geocoder)
+
+    stops = await node.resolve_stops(coords)
+    await node.shutdown()
+
+    assert client.calls == len(coords)
+    assert len(stops) == len(coords)
+    assert 1 < client.peak <= 8
+    with pytest.raises(RuntimeError):
+        geocoder.executor.submit(time.sleep, 0)
+
+
+@pytest.mark.asyncio
+async def test_prefetch_keeps_only_forecasts_for_deduped_stops(coords, monkeypatch):
+    from googlemaps import convert
+
+    from weather_travel_agent.agent.prefetch import WeatherPrefetcher
+
+    async def fetch(lat, lon):
+        return {"summary": "Clear"}
+
+    counties = ["A", "A", "B", "B", "C", "C", "D", "D"]
+    geocoder = FakeGeocoder({c: Place(n) for c, n in zip(coords, counties, strict=True)})
+    prefetcher = WeatherPrefetcher(fetch, name="test_extract_cities_prefetch")
+    wasted = prefetcher.stats.wasted
+    node = ExtractCitiesNode(geocoder=geocoder, prefetcher=prefetcher)
+    monkeypatch.setattr(node, "sample_evenly", lambda *args, **kwargs: coords)
+
+    out = await node({"route": {"overview_polyline": {"points": convert.encode_polyline(coords)}}})
+
+    kept = [(s["lat"], s["lon"]) for s in out["stops"]]
+    assert kept == coords[::2]
+    assert sorted(prefetcher._tasks) == sorted(kept)
+    assert prefetcher.stats.wasted - wasted == 4
@@ -0,0 +1,121 @@
+# tests/unit/agent/nodes/test_gather_trip.py
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from weather_travel_agent.agent.nodes.gather_trip import GatherTripNode
+from weather_travel_agent.cache.backends import MemoryBackend
+
+
+def tool_call_response(origin, destination):
+    resp = MagicMock()
+    resp.tool_calls = [{"name": "extract_places", "args": {"origin": origin, "destination": destination}}]
+    resp.content = ""
+    return resp
+
+
+@pytest.mark.asyncio
+async def test_repeated_messages_skip_the_llm():
+    with patch("weather_travel_agent.agent.nodes.gather_trip.settings") as mock_settings, \
+         patch("weather_travel_agent.agent.nodes.gather_trip.ChatOpenAI") as mock_llm_cls:
+        mock_settings.openai_api_key = "fake-key"
+        mock_settings.gather_cache_enabled = True
+        mock_settings.gather_cache_size = 10
+        mock_settings.gather_cache_ttl_s = 60
+        mock_settings.gather_cache_semantic_threshold = None
+        mock_settings.gather_cache_shared = False
+        mock_settings.gather_rules_enabled = False
+
+        mock_llm = mock_llm_cls.return_value.bind_tools.return_value
+        mock_llm.ainvoke = AsyncMock(return_value=tool_call_response("Chicago", "Nashville"))
+
+        node = GatherTripNode()
+        first = await node({"user_input": "from Chicago to Nashville"})
+        second = await node({"user_input": "From Chicago to Nashville."})
+
+        assert first == {"origin": "Chicago", "destination": "Nashville", "gather_path": "llm"}
+        assert second == {"origin": "Chicago", "destination": "Nashville", "gather_path": "cache"}
+        mock_llm.ainvoke.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_extractions_are_shared_between_nodes_through_the_backend():
+    shared = MemoryBackend()
+    prefix = "weather_travel_agent.agent.nodes.gather_trip"
+    with patch(f"{prefix}.settings") as mock_settings, \
+         patch(f"{prefix}.get_cache_backend", return_value=shared):
+        mock_settings.gather_cache_enabled = True
+        mock_settings.gather_cache_size = 10
+        mock_settings.gather_cache_ttl_s = 60
+        mock_settings.gather_cache_semantic_threshold = None
+        mock_settings.gather_cache_shared = True
+        mock_settings.gather_rules_enabled = False
+
+        # Two workers, each with its own node and in-process cache
+        first_llm, second_llm = MagicMock(), MagicMock()
+        first_llm.ainvoke = AsyncMock(return_value=tool_call_response("Chicago", "Nashville"))
+        second_llm.ainvoke = AsyncMock(return_value=tool_call_response("Denver", "Boise"))
+        first, second = GatherTripNode(llm=first_llm), GatherTripNode(llm=second_llm)
+
+        await first({"user_input": "from Chicago to Nashville"})
+        out = await second({"user_input": "From Chicago to Nashville."})
+
+        assert out == {"origin": "Chicago", "destination": "Nashville", "gather_path": "cache"}
+        second_llm.ainvoke.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_simple_messages_take_the_rule_path():
+    with patch("weather_travel_agent.agent.nodes.gather_trip.settings") as mock_settings:
+        mock_settings.gather_cache_enabled = False
+        mock_settings.gather_rules_enabled = True
+        mock_settings.gazetteer_path = None
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=tool_call_response("Chicago", "Nashville"))
+        node = GatherTripNode(llm=llm)
+
+        assert await node({"user_input": "Chicago to Nashville"}) == {
+            "origin": "Chicago", "destination": "Nashville", "gather_path": "rule"
+        }
+        llm.ainvoke.assert_not_awaited()
+
+        out = await node({"user_input": "What's the weather like between Chicago and Nashville?"})
+        assert out["gather_path"] == "llm"
+        llm.ainvoke.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_llm_failure_asks_for_places():
+    with patch("weather_travel_agent.agent.nodes.gather_trip.settings") as mock_settings:
+        mock_settings.gather_cache_enabled = False
+        mock_settings.gather_rules_enabled = False
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(side_effect=RuntimeError("boom"))
+
+        out = await GatherTripNode(llm=llm)({"user_input": "somewhere nice"})
+        assert out["need"] == "Could you please provide both an origin and destination?"
+
+
+@pytest.mark.asyncio
+async def test_follow_ups_keep_the_stored_trip():
+    with patch("weather_travel_agent.agent.nodes.gather_trip.settings") as mock_settings:
+        mock_settings.gather_cache_enabled = False
+        mock_settings.gather_rules_enabled = True
+        mock_settings.gazetteer_path = None
+
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=tool_call_response(None, None))
+        node = GatherTripNode(llm=llm)
+        stored = {
+            "origin": "Chicago", "destination": "Nashville",
+            "route": {"legs": []}, "stops": [], "forecasts": [],
+        }
+
+        follow_up = await node({**stored, "user_input": "what about tomorrow?"})
+        assert follow_up == {"origin": "Chicago", "destination": "Nashville", "gather_path": "state"}
+
+        new_trip = await node({**stored, "user_input": "Denver to Boise"})
+        assert new_trip["origin"] == "Denver" and new_trip["gather_path"] == "rule"
+        assert new_trip["route"] is new_trip["stops"] is new_trip["forecasts"] is None
@@ -0,0 +1,97 @@
+# tests/unit/agent/nodes/test_get_directions.py
+import asyncio
+import time
+
+import googlemaps
+import pytest
+
+from weather_travel_agent.agent.nodes.get_directions import GetDirectionsNode
+
+
+class FakeGmapsClient:
+    def __init__(self, delay=0.0, error=None, routes=True):
+        self.delay = delay
+        self.error = error
+        self.routes = routes
+        self.calls = []
+
+    def directions(self, origin, destination, mode=None):
+        self.calls.append((origin, destination, mode))
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        if not self.routes:
+            return []
+        return [{"summary": f"{origin} to {destination}", "overview_polyline": {"points": "abc"}}]
+
+
+@pytest.fixture(autouse=True)
+def directions_settings(monkeypatch):
+    prefix = "weather_travel_agent.agent.nodes.get_directions.settings"
+    monkeypatch.setattr(f"{prefix}.directions_cache_enabled", True)
+    monkeypatch.setattr(f"{prefix}.directions_cache_shared", False)
+    monkeypatch.setattr(f"{prefix}.directions_timeout_s", 1.0)
+
+
+@pytest.mark.asyncio
+async def test_routes_are_cached_by_normalized_city_pair():
+    client = FakeGmapsClient()
+    node = GetDirectionsNode(gmaps_client=client)
+
+    first = await node({"origin": "Chicago, IL", "destination": "Nashville"})
+    second = await node({"origin": "  chicago,IL ", "destination": "NASHVILLE!"})
+
+    assert first == second
+    assert len(client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_directions_are_not_cached():
+    client = FakeGmapsClient(routes=False)
+    node = GetDirectionsNode(gmaps_client=client)
+
+    first = await node({"origin": "Chicago", "destination": "Nashville"})
+    client.routes = True
+    second = await node({"origin": "Chicago", "destination": "Nashville"})
+
+    assert "need" in first
+    assert second["route"]["summary"] == "Chicago to Nashville"
+    assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_directions_do_not_block_the_event_loop():
+    node = GetDirectionsNode(gmaps_client=FakeGmapsClient(delay=0.2))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await node({"origin": "A", "destination": "B"})
+    task.cancel()
+
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_api_errors_ask_user(monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.get_directions.settings.directions_timeout_s", 0.05)
+    slow = GetDirectionsNode(gmaps_client=FakeGmapsClient(delay=0.2))
+    broken = GetDirectionsNode(gmaps_client=FakeGmapsClient(error=googlemaps.exceptions.ApiError("NOT_FOUND")))
+
+    assert "too long" in (await slow({"origin": "A", "destination": "B"}))["need"]
+    assert "unable to find the route" in (await broken({"origin": "A", "destination": "B"}))["need"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_the_executor():
+    node = GetDirectionsNode(gmaps_client=FakeGmapsClient())
+
+    await node.shutdown()
+
+    with pytest.raises(RuntimeError):
+        node.executor.submit(time.sleep, 0)
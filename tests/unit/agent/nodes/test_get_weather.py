@@ -0,0 +1,116 @@
+# tests/unit/agent/nodes/test_get_weather.py
+import asyncio
+
+import httpx
+import pytest
+
+from weather_travel_agent.agent.nodes.get_weather import GetWeatherNode
+
+
+def onecall_transport(calls, delay=0.0):
+    async def handler(request):
+        calls.append(dict(request.url.params))
+        await asyncio.sleep(delay)
+        return httpx.Response(
+            200,
+            json={"daily": [{"temp": {"min": 50, "max": 70}, "weather": [{"main": "Clear"}]}]},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def weather_settings(monkeypatch):
+    prefix = "weather_travel_agent.agent.nodes.get_weather.settings"
+    monkeypatch.setattr(f"{prefix}.mock_weather", False)
+    monkeypatch.setattr(f"{prefix}.forecast_cache_enabled", True)
+    monkeypatch.setattr(f"{prefix}.forecast_cache_grid_deg", 0.05)
+    monkeypatch.setattr(f"{prefix}.forecast_cache_shared", False)
+
+
+@pytest.mark.asyncio
+async def test_nearby_stops_share_one_forecast_fetch(weather_settings):
+    calls = []
+    node = GetWeatherNode(client=httpx.AsyncClient(transport=onecall_transport(calls, delay=0.01)))
+    state = {
+        "stops": [
+            {"name": "A", "lat": 36.1001, "lon": -86.7001},
+            {"name": "B", "lat": 36.1102, "lon": -86.7103},
+            {"name": "C", "lat": 37.0, "lon": -87.0},
+        ]
+    }
+
+    result = await node(state)
+    again = await node(state)
+
+    assert len(calls) == 2
+    assert [f["summary"] for f in result["forecasts"]] == ["Clear (min 50°, max 70°)"] * 3
+    assert again["forecasts"] == result["forecasts"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_are_reported_per_stop(weather_settings, monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.get_weather.settings.http_retries", 0)
+    node = GetWeatherNode(client=httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(401))))
+
+    result = await node({"stops": [{"name": "A", "lat": 30.0, "lon": -90.0}]})
+
+    assert result["forecasts"][0]["summary"].startswith("weather error:")
+
+
+@pytest.mark.asyncio
+async def test_stream_forecasts_yields_as_completed_and_marks_stragglers(weather_settings):
+    node = GetWeatherNode()
+    delays = {30.0: 0.0, 31.0: 0.03, 32.0: 1.0}
+
+    async def fake_fetch(lat, lon):
+        await asyncio.sleep(delays[lat])
+        return {"summary": f"sunny at {lat}"}
+
+    node.fetch_weather_one = fake_fetch
+    stops = [{"name": str(lat), "lat": lat, "lon": -90.0} for lat in (32.0, 31.0, 30.0)]
+    seen = []
+
+    results = await node.stream_forecasts(
+        stops, on_forecast=lambda i, f: seen.append(i), deadline=0.2
+    )
+
+    assert seen == [2, 1]
+    assert [r["summary"] for r in results] == ["pending", "sunny at 31.0", "sunny at 30.0"]
+    assert results[0]["pending"] is True
+
+
+@pytest.mark.asyncio
+async def test_prefetched_forecasts_are_claimed_not_refetched(weather_settings, monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.get_weather.settings.forecast_cache_enabled", False)
+    calls = []
+    node = GetWeatherNode(client=httpx.AsyncClient(transport=onecall_transport(calls, delay=0.01)))
+    stop = {"name": "A", "lat": 36.1, "lon": -86.7}
+
+    node.prefetcher.start([(stop["lat"], stop["lon"])])
+    result = await node({"stops": [stop]})
+
+    assert len(calls) == 1
+    assert result["forecasts"][0]["summary"] == "Clear (min 50°, max 70°)"
+    assert len(node.prefetcher) == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_merges_cells_across_concurrent_trips(weather_settings, monkeypatch):
+    prefix = "weather_travel_agent.agent.nodes.get_weather.settings"
+    monkeypatch.setattr(f"{prefix}.forecast_cache_enabled", False)
+    monkeypatch.setattr(f"{prefix}.forecast_scheduler", True)
+    monkeypatch.setattr(f"{prefix}.forecast_batch_window_ms", 5.0)
+    monkeypatch.setattr(f"{prefix}.forecast_rate_per_s", None)
+    calls = []
+    node = GetWeatherNode(client=httpx.AsyncClient(transport=onecall_transport(calls, delay=0.01)))
+    shared = {"name": "Nashville", "lat": 36.1627, "lon": -86.7816}
+
+    results = await asyncio.gather(
+        node({"stops": [{"name": "A", "lat": 33.7, "lon": -84.4}, shared]}),
+        node({"stops": [shared, {"name": "B", "lat": 38.2, "lon": -85.7}]}),
+    )
+    await node.shutdown()
+
+    assert len(calls) == 3
+    assert results[0]["forecasts"][1]["summary"] == results[1]["forecasts"][0]["summary"]
@@ -0,0 +1,134 @@
+# tests/unit/agent/nodes/test_route_weather.py
+import asyncio
+import time
+
+import pytest
+
+from weather_travel_agent.agent.nodes.extract_cities import ExtractCitiesNode
+from weather_travel_agent.agent.nodes.route_weather import RouteWeatherNode
+from weather_travel_agent.geo.geocoder import Place
+
+SETTINGS = "weather_travel_agent.agent.nodes.route_weather.settings"
+
+
+class DelayedGeocoder:
+    """Resolves each point after its own delay."""
+
+    def __init__(self, places, delays):
+        self.places = places
+        self.delays = delays
+
+    async def reverse(self, lat, lon):
+        await asyncio.sleep(self.delays[(lat, lon)])
+        return self.places[(lat, lon)]
+
+
+class FakeWeather:
+    def __init__(self, delay=0.0, delays=None):
+        self.delay = delay
+        self.delays = delays or {}
+
+    async def forecast_stop(self, stop):
+        await asyncio.sleep(self.delays.get(stop["name"], self.delay))
+        return {**stop, "summary": f"Clear at {stop['lon']}"}
+
+
+@pytest.fixture
+def coords():
+    return [(36.0, -86.0 + i * 0.1) for i in range(6)]
+
+
+@pytest.fixture(autouse=True)
+def fast_settings(monkeypatch):
+    monkeypatch.setattr(f"{SETTINGS}.geocode_concurrency", 10)
+    monkeypatch.setattr(f"{SETTINGS}.geocode_timeout_s", 1.0)
+    monkeypatch.setattr(f"{SETTINGS}.max_stops", 30)
+
+
+@pytest.mark.asyncio
+async def test_matches_sequential_dedupe_when_later_points_resolve_first(coords):
+    counties = ["A", "A", "B", "B", "C", "A"]
+    # Later points of a county resolve before the first one
+    delays = [0.03, 0.0, 0.02, 0.0, 0.01, 0.0]
+    geocoder = DelayedGeocoder(
+        {c: Place(n, "TN") for c, n in zip(coords, counties, strict=True)},
+        dict(zip(coords, delays, strict=True)),
+    )
+    weather = FakeWeather()
+    emitted = {}
+    node = RouteWeatherNode(ExtractCitiesNode(geocoder=geocoder), weather)
+
+    stops, forecasts = await node.resolve_forecasts(
+        coords, on_forecast=lambda i, f: emitted.setdefault(i, f)
+    )
+
+    assert [(s["name"], s["lon"]) for s in stops] == [
+        ("A, TN", coords[0][1]),
+        ("B, TN", coords[2][1]),
+        ("C, TN", coords[4][1]),
+    ]
+    assert [f["summary"] for f in forecasts] == [f"Clear at {s['lon']}" for s in stops]
+    assert emitted == dict(enumerate(forecasts))
+
+
+@pytest.mark.asyncio
+async def test_stops_are_reported_before_any_forecast(coords):
+    counties = ["A", "A", "B", "B", "C", "C"]
+    # The last point is slow, so early forecasts finish before the stop list
+    delays = [0.0, 0.0, 0.0, 0.0, 0.0, 0.05]
+    geocoder = DelayedGeocoder(
+        {c: Place(n, "TN") for c, n in zip(coords, counties, strict=True)},
+        dict(zip(coords, delays, strict=True)),
+    )
+    events = []
+    node = RouteWeatherNode(ExtractCitiesNode(geocoder=geocoder), FakeWeather())
+
+    await node.resolve_forecasts(
+        coords,
+        on_stops=lambda s: events.append("stops"),
+        on_forecast=lambda i, f: events.append(i),
+    )
+
+    assert events == ["stops", 0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_geocode_and_weather_latency_overlap(coords):
+    # The first stop is slow to geocode, the others are slow to forecast
+    geocoder = DelayedGeocoder(
+        {c: Place(str(i)) for i, c in enumerate(coords)},
+        {c: 0.1 if i == 0 else 0.0 for i, c in enumerate(coords)},
+    )
+    weather = FakeWeather(delay=0.1, delays={"0": 0.0})
+    node = RouteWeatherNode(ExtractCitiesNode(geocoder=geocoder), weather)
+
+    start = time.perf_counter()
+    stops, forecasts = await node.resolve_forecasts(coords)
+    elapsed = time.perf_counter() - start
+
+    assert len(forecasts) == len(stops) == len(coords)
+    # Strict stages take max(geocode) + max(weather) = 0.2s; pipelined ~0.1s
+    assert elapsed < 0.17
+
+
+@pytest.mark.asyncio
+async def test_slow_forecasts_are_pending_after_deadline(coords):
+    geocoder = DelayedGeocoder(
+        {c: Place(str(i), "TN") for i, c in enumerate(coords)}, dict.fromkeys(coords, 0.0)
+    )
+    node = RouteWeatherNode(ExtractCitiesNode(geocoder=geocoder), FakeWeather(delay=1))
+    seen_stops = []
+
+    stops, forecasts = await node.resolve_forecasts(
+        coords, on_stops=seen_stops.append, deadline=0.02
+    )
+
+    assert seen_stops == [stops]
+    assert all(f["pending"] for f in forecasts)
+
+
+@pytest.mark.asyncio
+async def test_missing_polyline_asks_for_route():
+    node = RouteWeatherNode(ExtractCitiesNode(geocoder=DelayedGeocoder({}, {})), FakeWeather())
+    out = await node({"route": {}})
+    assert out == {"need": "Route polyline missing; cannot extract stops."}
@@ -1,12 +1,21 @@
 # tests/unit/test_share_forecast.py
-import sys
-import types
+import asyncio
+from unittest.mock import MagicMock, patch
+
 import pytest
-from unittest.mock import patch, MagicMock
 
 from weather_travel_agent.agent.nodes.share_forecast import ShareForecastNode
 
 
+def streaming(*tokens, delay=0.0):
+    async def astream(messages):
+        for token in tokens:
+            await asyncio.sleep(delay)
+            yield MagicMock(content=token)
+
+    return astream
+
+
 @pytest.fixture
 def fake_state():
     return {
@@ -20,49 +29,129 @@ def fake_state():
     }
 
 
-def test_create_response_returns_llm_output(fake_state):
-    node = ShareForecastNode()
-
+@pytest.mark.asyncio
+async def test_create_response_returns_llm_output(fake_state):
     with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings, \
          patch("weather_travel_agent.agent.nodes.share_forecast.ChatOpenAI") as mock_llm_cls:
 
         mock_settings.openai_api_key = "fake-key"
         mock_settings.openai_model = "gpt-test"
+        mock_settings.summary_timeout_s = 5
+        mock_settings.summary_chunk_timeout_s = 5
 
         mock_llm = MagicMock()
-        mock_llm.invoke.return_value.content = "Your trip looks good!"
+        mock_llm.astream = streaming("Your trip ", "looks good!")
         mock_llm_cls.return_value = mock_llm
 
-        result = node(fake_state)
+        node = ShareForecastNode()
+        result = await node(fake_state)
 
         assert "reply" in result
         assert result["reply"] == "Your trip looks good!"
-        mock_llm.invoke.assert_called_once()
-
 
-def test_create_response_falls_back_to_itinerary_on_empty_llm(fake_state):
-    node = ShareForecastNode()
 
+@pytest.mark.asyncio
+async def test_create_response_falls_back_to_itinerary_on_empty_llm(fake_state):
     with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings, \
          patch("weather_travel_agent.agent.nodes.share_forecast.ChatOpenAI") as mock_llm_cls:
 
         mock_settings.openai_api_key = "fake-key"
         mock_settings.openai_model = "gpt-test"
+        mock_settings.summary_timeout_s = 5
+        mock_settings.summary_chunk_timeout_s = 5
 
         mock_llm = MagicMock()
-        mock_llm.invoke.return_value.content = ""
+        mock_llm.astream = streaming("")
         mock_llm_cls.return_value = mock_llm
 
-        result = node(fake_state)
+        node = ShareForecastNode()
+        result = await node(fake_state)
         assert "Trip from Atlanta, GA to Nashville, TN:" in result["reply"]
 
 
-def test_create_response_falls_back_when_no_api_key(fake_state):
-    node = ShareForecastNode()
-
+@pytest.mark.asyncio
+async def test_create_response_falls_back_when_no_api_key(fake_state):
     with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings:
         mock_settings.openai_api_key = None
         mock_settings.openai_model = "gpt-test"
 
-        result = node(fake_state)
+        node = ShareForecastNode()
+        result = await node(fake_state)
         assert "Trip from Atlanta, GA to Nashville, TN:" in result["reply"]
+
+
+@pytest.mark.asyncio
+async def test_create_response_falls_back_when_llm_is_too_slow(fake_state):
+    with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings:
+        mock_settings.summary_timeout_s = 0.05
+        mock_settings.summary_chunk_timeout_s = 0.05
+
+        mock_llm = MagicMock()
+        mock_llm.astream = streaming("Too late", delay=1)
+
+        node = ShareForecastNode(llm=mock_llm)
+        result = await node(fake_state)
+        assert "Trip from Atlanta, GA to Nashville, TN:" in result["reply"]
+
+
+def test_llm_client_is_created_once():
+    with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings, \
+         patch("weather_travel_agent.agent.nodes.share_forecast.ChatOpenAI") as mock_llm_cls:
+        mock_settings.openai_api_key = "fake-key"
+        mock_settings.summary_timeout_s = 5
+        mock_settings.summary_chunk_timeout_s = 5
+        mock_llm_cls.return_value.astream = streaming("ok")
+
+        node = ShareForecastNode()
+        asyncio.run(node.create_response("Trip"))
+        asyncio.run(node.create_response("Trip"))
+
+        mock_llm_cls.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_response_streams_tokens():
+    with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings:
+        mock_settings.summary_timeout_s = 5
+        mock_settings.summary_chunk_timeout_s = 5
+
+        mock_llm = MagicMock()
+        mock_llm.astream = streaming("Sunny ", "all ", "the way")
+        tokens = []
+
+        reply = await ShareForecastNode(llm=mock_llm).create_response("Trip", on_token=tokens.append)
+
+        assert tokens == ["Sunny ", "all ", "the way"]
+        assert reply == "Sunny all the way"
+
+
+@pytest.mark.asyncio
+async def test_create_response_drops_partial_text_when_llm_stalls():
+    async def stalling(messages):
+        yield MagicMock(content="Sunny start")
+        await asyncio.sleep(1)
+        yield MagicMock(content=" never arrives")
+
+    with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings:
+        mock_settings.summary_timeout_s = 5
+        mock_settings.summary_chunk_timeout_s = 0.05
+
+        mock_llm = MagicMock()
+        mock_llm.astream = stalling
+
+        assert await ShareForecastNode(llm=mock_llm).create_response("Trip") is None
+
+
+@pytest.mark.asyncio
+async def test_trickling_summary_falls_back_to_itinerary_at_deadline(fake_state):
+    with patch("weather_travel_agent.agent.nodes.share_forecast.settings") as mock_settings:
+        # Every chunk beats the stall check, but the whole summary misses the deadline
+        mock_settings.summary_timeout_s = 0.1
+        mock_settings.summary_chunk_timeout_s = 0.05
+
+        mock_llm = MagicMock()
+        mock_llm.astream = streaming(*["word "] * 20, delay=0.02)
+
+        result = await ShareForecastNode(llm=mock_llm)(fake_state)
+
+        assert result["reply"].startswith("Trip from Atlanta, GA to Nashville, TN:")
@@ -0,0 +1,110 @@
+# tests/unit/agent/test_checkpoint.py
+import asyncio
+import time
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from weather_travel_agent.agent.checkpoint import close_checkpointer, open_checkpointer
+from weather_travel_agent.agent.nodes.get_weather import reusable_forecasts
+from weather_travel_agent.agent.types import TripState
+from weather_travel_agent.handlers.a2a import WeatherTravelExecutor
+from weather_travel_agent.models.chat import ChatIn
+
+
+class Gather:
+    async def __call__(self, state):
+        if " to " in state["user_input"]:
+            origin, destination = state["user_input"].split(" to ")
+            return {"origin": origin, "destination": destination}
+        return {"gather_path": "state"}
+
+
+class CountingDirections:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self, state):
+        if state.get("route"):
+            return {"route": state["route"]}
+        await asyncio.sleep(self.delay)
+        # Count completed lookups; a coalesced follower's run is cancelled before this
+        self.calls += 1
+        return {"route": {"summary": f"{state['origin']} -> {state['destination']}"}}
+
+
+class Reply:
+    async def __call__(self, state):
+        return {"reply": f"{state['route']['summary']} ({state['user_input']})"}
+
+
+def mini_graph(directions, checkpointer):
+    builder = StateGraph(TripState)
+    builder.add_node("gather_trip", Gather())
+    builder.add_node("get_directions", directions)
+    builder.add_node("share_forecast", Reply())
+    builder.set_entry_point("gather_trip")
+    builder.add_edge("gather_trip", "get_directions")
+    builder.add_edge("get_directions", "share_forecast")
+    builder.add_edge("share_forecast", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest.mark.asyncio
+async def test_follow_up_turns_reuse_the_stored_route(tmp_path, monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.agent.checkpoint.settings.checkpointer", "sqlite")
+    monkeypatch.setattr(
+        "weather_travel_agent.agent.checkpoint.settings.checkpoint_path",
+        str(tmp_path / "state" / "checkpoints.sqlite3"),
+    )
+    checkpointer = await open_checkpointer()
+    directions = CountingDirections()
+    executor = WeatherTravelExecutor(mini_graph(directions, checkpointer))
+
+    try:
+        first = await executor._process_chat(ChatIn(message="Chicago to Nashville"), thread_id="c1")
+        follow_up = await executor._process_chat(ChatIn(message="what about tomorrow?"), thread_id="c1")
+        other = await executor._process_chat(ChatIn(message="Denver to Boise"), thread_id="c2")
+    finally:
+        await close_checkpointer(checkpointer)
+
+    assert first.reply == "Chicago -> Nashville (Chicago to Nashville)"
+    assert follow_up.reply == "Chicago -> Nashville (what about tomorrow?)"
+    assert other.reply == "Denver -> Boise (Denver to Boise)"
+    assert directions.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_followers_store_the_shared_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.agent.checkpoint.settings.checkpointer", "sqlite")
+    monkeypatch.setattr(
+        "weather_travel_agent.agent.checkpoint.settings.checkpoint_path", str(tmp_path / "cp.sqlite3")
+    )
+    checkpointer = await open_checkpointer()
+    directions = CountingDirections(delay=0.05)
+    executor = WeatherTravelExecutor(mini_graph(directions, checkpointer), coalesce=True)
+
+    try:
+        await asyncio.gather(
+            executor._process_chat(ChatIn(message="Chicago to Nashville"), thread_id="c1"),
+            executor._process_chat(ChatIn(message="Chicago to Nashville"), thread_id="c2"),
+        )
+        follow_up = await executor._process_chat(ChatIn(message="and Sunday?"), thread_id="c2")
+    finally:
+        await close_checkpointer(checkpointer)
+
+    assert directions.calls == 1
+    assert follow_up.reply == "Chicago -> Nashville (and Sunday?)"
+
+
+def test_only_fresh_complete_forecasts_are_reused(monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.agent.nodes.get_weather.settings.forecast_cache_ttl_s", 600)
+    forecasts = [{"name": "A", "summary": "Clear"}]
+
+    assert reusable_forecasts({"forecasts": forecasts, "forecasts_at": time.time()}) == forecasts
+    assert reusable_forecasts({"forecasts": forecasts, "forecasts_at": time.time() - 601}) is None
+    assert reusable_forecasts({"forecasts": forecasts}) is None
+    assert reusable_forecasts(
+        {"forecasts": [{"name": "A", "pending": True}], "forecasts_at": time.time()}
+    ) is None
@@ -0,0 +1,77 @@
+import pytest
+
+from weather_travel_agent.agent.extraction_cache import ExtractionCache, embed
+from weather_travel_agent.cache.backends import MemoryBackend
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_ignores_case_and_punctuation():
+    cache = ExtractionCache()
+    await cache.set("From Chicago to Nashville", ("Chicago", "Nashville", ""))
+
+    assert await cache.get("  from chicago to NASHVILLE!! ") == ("Chicago", "Nashville", "")
+    assert await cache.get("from chicago to memphis") is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_requires_places_in_message():
+    cache = ExtractionCache(semantic_threshold=0.7)
+    await cache.set("I'd like to drive from Chicago to Nashville", ("Chicago", "Nashville", ""))
+
+    assert await cache.get("i would like to drive from chicago to nashville please") == (
+        "Chicago",
+        "Nashville",
+        "",
+    )
+    assert await cache.get("I'd like to drive from Chicago to Memphis") is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_rejects_reversed_trip():
+    cache = ExtractionCache(semantic_threshold=0.7)
+    await cache.set("I'd like to drive from Chicago to Nashville", ("Chicago", "Nashville", ""))
+
+    assert await cache.get("I'd like to drive from Nashville to Chicago") is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_lookup_keeps_lru_order():
+    cache = ExtractionCache(maxsize=2, semantic_threshold=0.7)
+    await cache.set("drive from Chicago to Nashville", ("Chicago", "Nashville", ""))
+    await cache.set("drive from Denver to Boise", ("Denver", "Boise", ""))
+
+    # A semantic miss must not refresh Chicago, so it is still evicted first
+    assert await cache.get("drive from Chicago to Memphis") is None
+    await cache.set("drive from Tulsa to Wichita", ("Tulsa", "Wichita", ""))
+
+    assert await cache.get("drive from Chicago to Nashville") is None
+    assert await cache.get("drive from Denver to Boise") == ("Denver", "Boise", "")
+
+
+@pytest.mark.asyncio
+async def test_hit_rate_is_tracked():
+    cache = ExtractionCache()
+    before = cache.stats.hits, cache.stats.misses
+    await cache.get("hi")
+    await cache.set("hi", (None, None, "Where to?"))
+    await cache.get("Hi!")
+
+    assert (cache.stats.hits - before[0], cache.stats.misses - before[1]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_exact_hits_are_shared_through_the_backend():
+    shared = MemoryBackend()
+    first = ExtractionCache(backend=shared)
+    second = ExtractionCache(backend=shared, semantic_threshold=0.7)
+    await first.set("from Chicago to Nashville", ("Chicago", "Nashville", ""))
+
+    assert await second.get("From Chicago to Nashville!") == ("Chicago", "Nashville", "")
+    assert second.stats.tiers["shared"] >= 1
+    # Only exact keys are looked up in the backend
+    assert await ExtractionCache(backend=shared).get("from chicago to nashville today") is None
+
+
+def test_embed_is_normalized():
+    vec = embed("from chicago to nashville")
+    assert abs(float(vec @ vec) - 1.0) < 1e-6
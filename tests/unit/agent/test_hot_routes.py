@@ -0,0 +1,111 @@
+# tests/unit/agent/test_hot_routes.py
+import asyncio
+import json
+
+import pytest
+
+from weather_travel_agent.agent.conditions import cont_after_hot_route
+from weather_travel_agent.agent.hot_routes import (
+    HotRouteIndex,
+    HotRouteRefresher,
+    load_hot_routes,
+)
+from weather_travel_agent.agent.nodes.hot_route import HotRouteNode
+from weather_travel_agent.agent.planner import TripPlanner
+
+
+class Stage:
+    def __init__(self, key, value, fail=False):
+        self.key = key
+        self.value = value
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self, state):
+        self.calls += 1
+        if self.fail:
+            return {"need": "No route found."}
+        return {self.key: self.value}
+
+
+def stages(fail=False):
+    return [
+        Stage("route", {"legs": []}, fail=fail),
+        Stage("stops", [{"name": "A", "lat": 1.0, "lon": 2.0}]),
+        Stage("forecasts", [{"name": "A", "lat": 1.0, "lon": 2.0, "summary": "Clear"}]),
+    ]
+
+
+def test_load_hot_routes(tmp_path):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps([{"origin": "Chicago", "destination": "Nashville"}]))
+    assert load_hot_routes(str(path)) == [("Chicago", "Nashville")]
+
+
+@pytest.mark.asyncio
+async def test_refreshed_routes_are_served_until_stale():
+    index = HotRouteIndex(max_age=60)
+    entry = index.add("Chicago", "Nashville")
+    node = HotRouteNode(index, HotRouteRefresher(index, TripPlanner(stages()), interval=60))
+
+    assert await node({"origin": "chicago", "destination": "Nashville"}) == {"hot_route": False}
+    assert index.stale == 1
+
+    await node.refresher.refresh_all()
+    hit = await node({"origin": "chicago", "destination": "Nashville"})
+    assert hit["hot_route"] and hit["stops"][0]["name"] == "A"
+    assert cont_after_hot_route(hit) == "get_directions"
+
+    entry.refreshed_at -= 61
+    assert (await node({"origin": "Chicago", "destination": "Nashville"}))["hot_route"] is False
+
+    stats = index.as_dict()
+    assert (stats["hits"], stats["stale"], stats["routes"]) == (1, 2, 1)
+    assert stats["by_route"]["chicago|nashville|driving"]["refreshes"] == 1
+    assert stats["max_age_s"] >= 61
+
+
+@pytest.mark.asyncio
+async def test_precomputed_summary_skips_everything_but_follow_ups():
+    index = HotRouteIndex(max_age=60)
+    index.add("Chicago", "Nashville")
+    summary = Stage("reply", "Sunny all the way")
+    await HotRouteRefresher(
+        index, TripPlanner(stages(), summarize=summary), interval=60, summarize=True
+    ).refresh_all()
+    node = HotRouteNode(index)
+
+    fresh = await node({"origin": "Chicago", "destination": "Nashville", "gather_path": "rule"})
+    follow_up = await node({"origin": "Chicago", "destination": "Nashville", "gather_path": "state"})
+
+    assert fresh["reply"] == "Sunny all the way" and cont_after_hot_route(fresh) == "__end__"
+    assert follow_up["reply"] is None and cont_after_hot_route(follow_up) == "get_directions"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_results():
+    index = HotRouteIndex(max_age=60)
+    entry = index.add("Chicago", "Nashville")
+    await HotRouteRefresher(index, TripPlanner(stages()), interval=60).refresh_all()
+    refreshed_at = entry.refreshed_at
+
+    await HotRouteRefresher(index, TripPlanner(stages(fail=True)), interval=60).refresh_all()
+
+    assert entry.refreshed_at == refreshed_at and entry.stops
+    assert entry.failures == 1 and entry.last_error == "No route found."
+
+
+@pytest.mark.asyncio
+async def test_scheduler_refreshes_periodically_until_stopped():
+    index = HotRouteIndex(max_age=60)
+    entry = index.add("Chicago", "Nashville")
+    refresher = HotRouteRefresher(index, TripPlanner(stages()), interval=0.01)
+
+    refresher.start()
+    await asyncio.sleep(0.05)
+    await refresher.stop()
+    count = entry.refreshes
+    await asyncio.sleep(0.03)
+
+    assert count >= 2
+    assert entry.refreshes == count
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from weather_travel_agent.agent.planner import (
+    TripPlanner,
+    TripPlanningError,
+    plan_batch,
+)
+
+
+class CountingStages:
+    """Directions and weather stages that count calls and overlapping trips."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.directions = 0
+        self.running = 0
+        self.peak = 0
+
+    async def get_directions(self, state):
+        self.directions += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if state["destination"] == "Nowhere":
+            return {"need": "No route found"}
+        return {"route": {"legs": []}}
+
+    async def get_weather(self, state):
+        return {"stops": [{"name": state["origin"]}], "forecasts": [{"summary": "Clear"}]}
+
+
+@pytest.mark.asyncio
+async def test_plan_runs_stages_and_optional_summary():
+    stages = CountingStages()
+
+    async def summarize(state):
+        return {"reply": f"Clear from {state['origin']}"}
+
+    planner = TripPlanner([stages.get_directions, stages.get_weather], summarize=summarize)
+
+    plain = await planner.plan("Atlanta", "Nashville")
+    summarized = await planner.plan("Atlanta", "Nashville", summarize=True)
+
+    assert plain["forecasts"] == [{"summary": "Clear"}] and "reply" not in plain
+    assert summarized["reply"] == "Clear from Atlanta"
+
+    with pytest.raises(TripPlanningError, match="No route found"):
+        await planner.plan("Atlanta", "Nowhere")
+
+
+@pytest.mark.asyncio
+async def test_plan_batch_dedupes_trips_and_bounds_concurrency():
+    stages = CountingStages()
+    planner = TripPlanner([stages.get_directions, stages.get_weather])
+    trips = [
+        ("Atlanta", "Nashville"),
+        ("Denver", "Boise"),
+        ("atlanta", "Nashville!"),
+        ("Atlanta", "Nowhere"),
+        ("Reno", "Fresno"),
+    ]
+
+    results = [r async for r in plan_batch(planner, trips, concurrency=2)]
+
+    assert sorted(i for indices, _ in results for i in indices) == [0, 1, 2, 3, 4]
+    assert stages.directions == 4 and stages.peak == 2
+    shared = next(outcome for indices, outcome in results if indices == [0, 2])
+    assert shared["stops"] == [{"name": "Atlanta"}]
+    failed = next(outcome for indices, outcome in results if indices == [3])
+    assert isinstance(failed, TripPlanningError)
+
+
+@pytest.mark.asyncio
+async def test_plan_batch_cancels_remaining_trips_when_closed():
+    stages = CountingStages(delay=0.05)
+    planner = TripPlanner([stages.get_directions, stages.get_weather])
+    trips = [(f"City {i}", "Boise") for i in range(6)]
+
+    batch = plan_batch(planner, trips, concurrency=2)
+    await anext(batch)
+    await batch.aclose()
+    await asyncio.sleep(0.1)
+
+    # Two more trips had started before the close; none after it
+    assert stages.directions <= 4
@@ -0,0 +1,61 @@
+# tests/unit/agent/test_prefetch.py
+import asyncio
+
+import pytest
+
+from weather_travel_agent.agent.prefetch import WeatherPrefetcher
+
+
+class CountingFetch:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, lat, lon):
+        self.calls.append((lat, lon))
+        await asyncio.sleep(self.delay)
+        return {"summary": f"Clear at {lat}"}
+
+
+@pytest.mark.asyncio
+async def test_taken_prefetches_are_reused_and_counted():
+    fetch = CountingFetch()
+    prefetcher = WeatherPrefetcher(fetch, name="test_prefetch_take")
+    used = prefetcher.stats.used
+
+    prefetcher.start([(1.0, 2.0), (3.0, 4.0)])
+    prefetcher.start([(1.0, 2.0)])
+
+    assert await prefetcher.take(1.0, 2.0) == {"summary": "Clear at 1.0"}
+    assert prefetcher.take(1.0, 2.0) is None
+    assert len(fetch.calls) == 2
+    assert prefetcher.stats.used - used == 1
+
+
+@pytest.mark.asyncio
+async def test_discarded_prefetches_count_as_waste():
+    prefetcher = WeatherPrefetcher(CountingFetch(delay=1), name="test_prefetch_discard")
+    before = prefetcher.stats.as_dict()
+
+    prefetcher.start([(1.0, 2.0), (3.0, 4.0)])
+    task = prefetcher._tasks[(3.0, 4.0)]
+    prefetcher.discard([(3.0, 4.0), (5.0, 6.0)])
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert len(prefetcher) == 1
+    assert prefetcher.stats.wasted - before["wasted"] == 1
+    assert prefetcher.stats.wasted_completed - before["wasted_completed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unclaimed_prefetches_expire():
+    prefetcher = WeatherPrefetcher(CountingFetch(), ttl=0.01, name="test_prefetch_expire")
+    wasted = prefetcher.stats.wasted
+
+    prefetcher.start([(1.0, 2.0)])
+    await asyncio.sleep(0.05)
+
+    assert len(prefetcher) == 0
+    assert prefetcher.stats.wasted - wasted == 1
+    assert prefetcher.stats.wasted_completed >= 1
@@ -0,0 +1,55 @@
+# tests/unit/agent/test_trip_parser.py
+import pytest
+
+from weather_travel_agent.agent.trip_parser import TripParser, load_gazetteer
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Chicago to Nashville", ("Chicago", "Nashville")),
+        ("from Chicago to Nashville", ("Chicago", "Nashville")),
+        ("Atlanta, GA -> Nashville, TN", ("Atlanta, GA", "Nashville, TN")),
+        ("Denver → Salt Lake City", ("Denver", "Salt Lake City")),
+        ("I'd like to drive from St. Louis to Kansas City please.", ("St. Louis", "Kansas City")),
+        ("plan a trip from Denver to Boise", ("Denver", "Boise")),
+        ("Newcastle upon Tyne to Leeds", ("Newcastle upon Tyne", "Leeds")),
+    ],
+)
+def test_parses_simple_trips(text, expected):
+    assert TripParser().parse(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Hi",
+        "",
+        "What's the weather from Chicago to Nashville tomorrow?",
+        "from Chicago to Toledo to Nashville",
+        "how far is it to Nashville",
+        "I want to go to Nashville",
+        "Chicago to 123",
+        "Chicago to Nashville next week",
+        "Chicago to Nashville on Friday",
+        "Chicago to Nashville in March",
+        "NYC to Boston this Saturday",
+        "Seattle to Portland by car",
+        "Chicago to Nashville, leaving at 8am",
+        "Chicago to Nashville avoiding tolls",
+        "Chicago to Nashville then Atlanta",
+        "Back to Nashville",
+        "Ship to shore",
+    ],
+)
+def test_ambiguous_messages_fall_through(text):
+    assert TripParser().parse(text) is None
+
+
+def test_gazetteer_restricts_to_known_places(tmp_path):
+    path = tmp_path / "places.txt"
+    path.write_text("# known places\nChicago\nNashville, TN\n")
+    parser = TripParser(load_gazetteer(str(path)))
+
+    assert parser.parse("Chicago to Nashville, TN") == ("Chicago", "Nashville, TN")
+    assert parser.parse("Chicago to Springfield") is None
@@ -0,0 +1,170 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from weather_travel_agent.cache.backends import MemoryBackend, SQLiteBackend
+from weather_travel_agent.cache.coalescing import CoalescingCache
+from weather_travel_agent.cache.memory import MISSING
+from weather_travel_agent.cache.redis import RedisBackend, read_reply
+
+
+class FakeRedisServer:
+    """Minimal local stand-in for a Redis server: GET, SET [PX], DEL, SELECT."""
+
+    def __init__(self):
+        self.data = {}
+        self.server = None
+        self.commands = []
+        self.connections = 0
+        self.select_reply = b"+OK\r\n"
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                args = [a.decode() for a in await read_reply(reader)]
+                self.commands.append(args)
+                writer.write(self.execute(args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    def execute(self, args):
+        cmd = args[0].upper()
+        if cmd == "SELECT":
+            return self.select_reply
+        if cmd == "SET":
+            expires = time.monotonic() + int(args[4]) / 1000 if len(args) > 3 else None
+            self.data[args[1]] = (args[2], expires)
+            return b"+OK\r\n"
+        if cmd == "GET":
+            value, expires = self.data.get(args[1], (None, None))
+            if value is None or (expires is not None and expires <= time.monotonic()):
+                return b"$-1\r\n"
+            data = value.encode()
+            return b"$%d\r\n%s\r\n" % (len(data), data)
+        if cmd == "DEL":
+            return b":%d\r\n" % (self.data.pop(args[1], None) is not None)
+        return b"-ERR unknown command\r\n"
+
+
+async def start_redis_backend(pool_size=4):
+    server = FakeRedisServer()
+    port = await server.start()
+    backend = RedisBackend(f"redis://127.0.0.1:{port}/2", prefix="test", pool_size=pool_size)
+    backend.server = server
+    return backend
+
+
+@pytest_asyncio.fixture
+async def redis_backend():
+    backend = await start_redis_backend()
+    yield backend
+    await backend.close()
+    backend.server.server.close()
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "redis"])
+async def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryBackend()
+    elif request.param == "sqlite":
+        b = SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+        yield b
+        await b.close()
+    else:
+        b = await start_redis_backend()
+        yield b
+        await b.close()
+        b.server.server.close()
+
+
+@pytest.mark.asyncio
+async def test_round_trip_and_namespacing(backend):
+    value = {"name": "Davidson County", "stops": [1.5, 2], "ok": True}
+    await backend.set("geocode", "k", value, ttl=60)
+
+    assert await backend.get("geocode", "k") == value
+    assert await backend.get("forecast", "k") is MISSING
+
+    await backend.delete("geocode", "k")
+    assert await backend.get("geocode", "k") is MISSING
+
+
+@pytest.mark.asyncio
+async def test_expired_values_are_missing(backend):
+    await backend.set("ns", "k", 1, ttl=0.01)
+    await asyncio.sleep(0.05)
+
+    assert await backend.get("ns", "k") is MISSING
+
+
+@pytest.mark.asyncio
+async def test_rejects_values_that_are_not_plain_data(backend):
+    with pytest.raises(TypeError):
+        await backend.set("ns", "k", object(), ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_uses_prefixed_keys_and_selects_db(redis_backend):
+    await redis_backend.set("directions", "a|b", [1], ttl=60)
+
+    assert ["SELECT", "2"] in redis_backend.server.commands
+    assert "test:directions:a|b" in redis_backend.server.data
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_pools_connections():
+    backend = await start_redis_backend(pool_size=2)
+
+    await asyncio.gather(*(backend.get("ns", str(i)) for i in range(10)))
+    await backend.get("ns", "again")
+
+    assert backend.server.connections == 2
+    await backend.close()
+    backend.server.server.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_drops_connection_when_select_fails(redis_backend):
+    redis_backend.server.select_reply = b"-ERR invalid DB index\r\n"
+
+    assert await redis_backend.get("ns", "k") is MISSING
+    assert redis_backend._idle == []
+
+    redis_backend.server.select_reply = b"+OK\r\n"
+    await redis_backend.set("ns", "k", 1, ttl=60)
+    assert await redis_backend.get("ns", "k") == 1
+    assert redis_backend.server.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_unavailable_is_a_miss():
+    backend = RedisBackend("redis://127.0.0.1:1/0", timeout=0.2)
+
+    assert await backend.get("ns", "k") is MISSING
+    await backend.set("ns", "k", 1, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_coalescing_cache_reads_through_shared_backend():
+    shared = MemoryBackend()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"v": calls}
+
+    first = CoalescingCache("test_shared", maxsize=10, ttl=60, backend=shared)
+    second = CoalescingCache("test_shared", maxsize=10, ttl=60, backend=shared)
+
+    assert await first.get_or_fetch("k", fetch) == {"v": 1}
+    assert await second.get_or_fetch("k", fetch) == {"v": 1}
+    assert calls == 1
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from weather_travel_agent.cache.coalescing import CoalescingCache
+from weather_travel_agent.cache.memory import MISSING, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is MISSING
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch():
+    cache = CoalescingCache("test_coalesce", maxsize=10, ttl=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"n": calls}
+
+    results = await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(5)))
+    again = await cache.get_or_fetch("k", fetch)
+
+    assert calls == 1
+    assert all(r == {"n": 1} for r in results) and again == {"n": 1}
+    assert cache.stats.misses == 1
+    assert cache.stats.tiers == {"coalesced": 4, "memory": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = CoalescingCache("test_coalesce_error", maxsize=10, ttl=60)
+
+    async def boom():
+        raise RuntimeError("upstream down")
+
+    async def ok():
+        return 1
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("k", boom)
+    assert await cache.get_or_fetch("k", ok) == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_stream_replays_to_late_subscribers():
+    from weather_travel_agent.cache.singleflight import SharedStream
+
+    async def source():
+        for i in range(4):
+            await asyncio.sleep(0.01)
+            yield i
+
+    stream = SharedStream(source())
+    early = stream.subscribe()
+    assert await anext(early) == 0
+
+    late = [i async for i in stream.subscribe(start=2)]
+    rest = [i async for i in early]
+
+    assert late == [2, 3]
+    assert rest == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_shared_stream_cancels_source_when_everyone_leaves():
+    from weather_travel_agent.cache.singleflight import SharedStream
+
+    async def source():
+        yield 1
+        await asyncio.sleep(10)
+        yield 2
+
+    stream = SharedStream(source())
+    sub = stream.subscribe()
+    assert await anext(sub) == 1
+    await sub.aclose()
+    await asyncio.sleep(0)
+
+    assert stream.closing and stream.task.cancelled()
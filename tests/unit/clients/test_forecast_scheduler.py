@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+
+from weather_travel_agent.clients.forecast_scheduler import (
+    ForecastScheduler,
+    RateBudget,
+)
+
+
+class Upstream:
+    def __init__(self, delay=0.01, fail=()):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+
+    async def fetch(self, lat, lon):
+        self.calls.append((lat, lon))
+        await asyncio.sleep(self.delay)
+        if lat in self.fail:
+            raise RuntimeError(f"upstream down at {lat}")
+        return {"lat": lat, "lon": lon}
+
+
+@pytest.mark.asyncio
+async def test_requests_in_one_window_are_fetched_once_per_cell():
+    upstream = Upstream()
+    scheduler = ForecastScheduler(upstream.fetch, window=0.005, grid_deg=0.05, name="test_merge")
+
+    results = await asyncio.gather(
+        scheduler.submit(36.1001, -86.7001),
+        scheduler.submit(36.1102, -86.7103),
+        scheduler.submit(37.0, -87.0),
+        scheduler.submit(36.0999, -86.6999),
+    )
+
+    assert sorted(upstream.calls) == [(36.1, -86.7), (37.0, -87.0)]
+    assert results[0] is results[1] is results[3]
+    assert scheduler.stats.merged == 2 and scheduler.stats.windows == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_join_a_fetch_already_in_flight():
+    upstream = Upstream(delay=0.05)
+    scheduler = ForecastScheduler(upstream.fetch, window=0.001, grid_deg=0.05, name="test_join")
+
+    first = asyncio.ensure_future(scheduler.submit(36.1, -86.7))
+    await asyncio.sleep(0.02)
+    second = await scheduler.submit(36.1, -86.7)
+
+    assert second is await first
+    assert len(upstream.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_of_the_cell():
+    upstream = Upstream(fail=(30.0,))
+    scheduler = ForecastScheduler(upstream.fetch, window=0.001, grid_deg=0.05, name="test_errors")
+
+    results = await asyncio.gather(
+        scheduler.submit(30.0, -90.0),
+        scheduler.submit(30.0, -90.0),
+        scheduler.submit(31.0, -90.0),
+        return_exceptions=True,
+    )
+
+    assert [type(r).__name__ for r in results] == ["RuntimeError", "RuntimeError", "dict"]
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_spaces_fetches_most_awaited_first():
+    upstream = Upstream(delay=0.0)
+    scheduler = ForecastScheduler(
+        upstream.fetch,
+        window=0.001,
+        grid_deg=0.05,
+        budget=RateBudget(rate=50, burst=1),
+        name="test_budget",
+    )
+
+    start = time.monotonic()
+    await asyncio.gather(
+        scheduler.submit(30.0, -90.0),
+        scheduler.submit(31.0, -90.0),
+        scheduler.submit(31.0, -90.0),
+        scheduler.submit(32.0, -90.0),
+    )
+
+    # One fetch from the burst, then one every 20ms
+    assert time.monotonic() - start >= 0.035
+    assert upstream.calls[0] == (31.0, -90.0)
+    assert scheduler.stats.throttled == 2
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_queued_requests():
+    upstream = Upstream()
+    scheduler = ForecastScheduler(upstream.fetch, window=1.0, grid_deg=0.05, name="test_close")
+
+    pending = asyncio.ensure_future(scheduler.submit(30.0, -90.0))
+    await asyncio.sleep(0)
+    await scheduler.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+    assert upstream.calls == []
@@ -0,0 +1,98 @@
+import httpx
+import pytest
+
+from weather_travel_agent.clients.http import (
+    backoff_delay,
+    create_async_client,
+    request_with_retry,
+)
+
+
+def client_with(responses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        item = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), calls
+
+
+@pytest.mark.asyncio
+async def test_retries_429_and_5xx_until_success():
+    client, calls = client_with(
+        [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(503), httpx.Response(200, json={"ok": True})]
+    )
+
+    r = await request_with_retry(client, "GET", "https://example.test/x", retries=3, backoff_base=0.001)
+
+    assert r.status_code == 200
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_returns_last_response_when_retries_exhausted():
+    client, calls = client_with([httpx.Response(500)])
+
+    r = await request_with_retry(client, "GET", "https://example.test/x", retries=2, backoff_base=0.001)
+
+    assert r.status_code == 500
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors():
+    client, calls = client_with([httpx.Response(401)])
+
+    r = await request_with_retry(client, "GET", "https://example.test/x", retries=3)
+
+    assert r.status_code == 401
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_transport_errors_then_raises():
+    client, calls = client_with([httpx.ConnectError("refused")])
+
+    with pytest.raises(httpx.ConnectError):
+        await request_with_retry(client, "GET", "https://example.test/x", retries=1, backoff_base=0.001)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_zero_retries_immediately(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("weather_travel_agent.clients.http.asyncio.sleep", sleep)
+    client, calls = client_with([httpx.Response(503, headers={"Retry-After": "0"}), httpx.Response(200)])
+
+    r = await request_with_retry(client, "GET", "https://example.test/x", retries=1, backoff_base=10.0)
+
+    assert r.status_code == 200
+    assert sleeps == [0.0]
+
+
+def test_create_async_client_keeps_explicit_zero_limits(monkeypatch):
+    limits = []
+    real_limits = httpx.Limits
+
+    def record(**kwargs):
+        limits.append(kwargs)
+        return real_limits(**kwargs)
+
+    monkeypatch.setattr(httpx, "Limits", record)
+
+    create_async_client(max_keepalive=0, keepalive_expiry=0.0)
+
+    assert limits[0]["max_keepalive_connections"] == 0
+    assert limits[0]["keepalive_expiry"] == 0.0
+
+
+def test_backoff_delay_is_capped():
+    assert all(0 <= backoff_delay(10, base=0.5, cap=2.0) <= 2.0 for _ in range(100))
@@ -0,0 +1,130 @@
+# tests/unit/clients/test_llm.py
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import openai
+import pytest
+
+from weather_travel_agent.clients.llm import (
+    ainvoke_with_retry,
+    astream_with_retry,
+    llm_limiter,
+)
+
+FAST = {"backoff_base": 0.001, "backoff_max": 0.001}
+
+
+def rate_limited() -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return openai.RateLimitError(
+        "slow down", response=httpx.Response(429, request=request), body=None
+    )
+
+
+class FlakyLLM:
+    def __init__(self, failures, delay=0.0):
+        self.failures = list(failures)
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                raise self.failures.pop(0)
+            return "ok"
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_retries_rate_limits_then_succeeds():
+    llm = FlakyLLM([rate_limited(), rate_limited()])
+
+    assert await ainvoke_with_retry(llm, [], retries=2, **FAST) == "ok"
+    assert llm.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_retries():
+    llm = FlakyLLM([rate_limited()] * 3)
+
+    with pytest.raises(openai.RateLimitError):
+        await ainvoke_with_retry(llm, [], retries=1, **FAST)
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_time_out_and_retry():
+    llm = FlakyLLM([], delay=1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await ainvoke_with_retry(llm, [], timeout=0.01, retries=1, **FAST)
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried():
+    llm = FlakyLLM([ValueError("bad request")])
+
+    with pytest.raises(ValueError):
+        await ainvoke_with_retry(llm, [], retries=3, **FAST)
+    assert llm.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_calls_in_flight():
+    limit = llm_limiter()._value
+    llm = FlakyLLM([], delay=0.01)
+
+    await asyncio.gather(*(ainvoke_with_retry(llm, []) for _ in range(limit * 3)))
+    assert llm.peak == limit
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_only_before_first_chunk():
+    attempts = []
+
+    def astream(messages):
+        attempts.append(1)
+
+        async def gen():
+            if len(attempts) == 1:
+                raise rate_limited()
+            yield MagicMock(content="Sunny ")
+            raise rate_limited()
+
+        return gen()
+
+    llm = MagicMock()
+    llm.astream = astream
+    tokens = []
+
+    with pytest.raises(openai.RateLimitError):
+        await astream_with_retry(llm, [], tokens.append, chunk_timeout=1, retries=3, **FAST)
+
+    assert len(attempts) == 2
+    assert tokens == ["Sunny "]
+
+
+@pytest.mark.asyncio
+async def test_stream_total_timeout_cuts_off_a_steady_trickle():
+    async def trickle(messages):
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            yield MagicMock(content="word ")
+
+    llm = MagicMock()
+    llm.astream = trickle
+    tokens = []
+
+    with pytest.raises(asyncio.TimeoutError):
+        await astream_with_retry(llm, [], tokens.append, chunk_timeout=1, timeout=0.05, **FAST)
+
+    assert 0 < len(tokens) < 50
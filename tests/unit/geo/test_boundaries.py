@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from weather_travel_agent.geo.geocoder import FallbackReverseGeocoder, Place
+
+pytest.importorskip("shapely")
+
+from weather_travel_agent.geo.boundaries import OfflineReverseGeocoder  # noqa: E402
+
+
+def square(lon, lat, size):
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+        ],
+    }
+
+
+@pytest.fixture
+def boundaries_path(tmp_path):
+    features = [
+        {"geometry": square(-87.0, 36.0, 0.5), "properties": {"name": "Davidson County", "state": "TN", "country": "US"}},
+        {"geometry": square(-86.5, 36.0, 0.5), "properties": {"name": "Wilson County", "state": "TN", "country": "US"}},
+        {"geometry": square(-86.9, 36.1, 0.1), "properties": {"name": "Nashville", "state": "TN", "country": "US", "kind": "locality"}},
+    ]
+    path = tmp_path / "boundaries.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    return str(path)
+
+
+def test_lookup_finds_containing_county(boundaries_path):
+    geocoder = OfflineReverseGeocoder(boundaries_path)
+
+    assert len(geocoder) == 3
+    assert geocoder.lookup(36.25, -86.25) == Place("Wilson County", "TN", "US")
+    assert geocoder.lookup(36.3, -86.6).name == "Davidson County"
+
+
+def test_lookup_prefers_county_over_locality(boundaries_path):
+    geocoder = OfflineReverseGeocoder(boundaries_path)
+
+    assert geocoder.lookup(36.15, -86.85).name == "Davidson County"
+
+
+def test_lookup_outside_all_boundaries(boundaries_path):
+    assert OfflineReverseGeocoder(boundaries_path).lookup(40.0, -100.0) is None
+
+
+class StaticGeocoder:
+    def __init__(self, place):
+        self.place = place
+        self.calls = 0
+
+    async def reverse(self, lat, lon):
+        self.calls += 1
+        return self.place
+
+
+@pytest.mark.asyncio
+async def test_fallback_only_used_when_offline_misses(boundaries_path):
+    google = StaticGeocoder(Place("Somewhere County", "KS", "US"))
+    geocoder = FallbackReverseGeocoder(OfflineReverseGeocoder(boundaries_path), google)
+
+    assert (await geocoder.reverse(36.25, -86.25)).name == "Wilson County"
+    assert google.calls == 0
+    assert (await geocoder.reverse(38.0, -98.0)).name == "Somewhere County"
+    assert google.calls == 1
@@ -0,0 +1,112 @@
+import pytest
+
+from weather_travel_agent.cache.backends import SQLiteBackend
+from weather_travel_agent.geo import geohash
+from weather_travel_agent.geo.geocode_cache import CachedReverseGeocoder
+from weather_travel_agent.geo.geocoder import Place
+
+
+class CountingGeocoder:
+    def __init__(self, place=Place("Davidson County", "TN", "US")):
+        self.place = place
+        self.calls = 0
+
+    async def reverse(self, lat, lon):
+        self.calls += 1
+        return self.place
+
+
+def cell_center(cell):
+    lat_lo, lat_hi, lon_lo, lon_hi = geohash.bounds(cell)
+    return (lat_lo + lat_hi) / 2, (lon_lo + lon_hi) / 2
+
+
+@pytest.mark.asyncio
+async def test_same_cell_is_served_from_memory():
+    inner = CountingGeocoder()
+    cache = CachedReverseGeocoder(inner, precision=5, min_neighbours=0)
+
+    first = await cache.reverse(36.1627, -86.7816)
+    second = await cache.reverse(36.1630, -86.7810)
+
+    assert first == second == inner.place
+    assert inner.calls == 1
+    assert cache.stats.tiers["memory"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_survives_new_process(tmp_path):
+    path = str(tmp_path / "geocode.sqlite3")
+
+    inner = CountingGeocoder()
+    await CachedReverseGeocoder(inner, backend=SQLiteBackend(path), min_neighbours=0).reverse(36.16, -86.78)
+
+    fresh = CountingGeocoder()
+    cache = CachedReverseGeocoder(fresh, backend=SQLiteBackend(path), min_neighbours=0)
+    place = await cache.reverse(36.16, -86.78)
+
+    assert place == inner.place
+    assert fresh.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_expires_entries(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "geocode.sqlite3"))
+    await backend.set("reverse_geocode", "dn6m9", {"name": "x"}, ttl=-1)
+
+    inner = CountingGeocoder()
+    cache = CachedReverseGeocoder(inner, backend=backend, min_neighbours=0)
+    lat, lon = cell_center("dn6m9")
+    place = await cache.reverse(lat, lon)
+
+    assert place == inner.place
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_neighbour_cells_in_same_county_answer_without_api_call():
+    inner = CountingGeocoder()
+    cache = CachedReverseGeocoder(inner, precision=5, min_neighbours=2)
+
+    cell = geohash.encode(36.16, -86.78, 5)
+    west, east = geohash.neighbours(cell)[3], geohash.neighbours(cell)[4]
+    await cache.reverse(*cell_center(west))
+    await cache.reverse(*cell_center(east))
+    inferred_before = cache.stats.tiers["neighbour"]
+
+    place = await cache.reverse(*cell_center(cell))
+
+    assert place == inner.place
+    assert inner.calls == 2
+    assert cache.stats.tiers["neighbour"] == inferred_before + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cached, calls", [(5, 6), (6, 6)])
+async def test_default_needs_six_agreeing_neighbours(cached, calls):
+    inner = CountingGeocoder()
+    cache = CachedReverseGeocoder(inner, precision=5)
+
+    cell = geohash.encode(36.16, -86.78, 5)
+    for n in geohash.neighbours(cell)[:cached]:
+        await cache.reverse(*cell_center(n))
+
+    await cache.reverse(*cell_center(cell))
+
+    assert inner.calls == calls
+
+
+@pytest.mark.asyncio
+async def test_disagreeing_neighbours_fall_through_to_geocoder():
+    inner = CountingGeocoder()
+    cache = CachedReverseGeocoder(inner, precision=5, min_neighbours=2)
+
+    cell = geohash.encode(36.16, -86.78, 5)
+    west, east = geohash.neighbours(cell)[3], geohash.neighbours(cell)[4]
+    await cache.reverse(*cell_center(west))
+    inner.place = Place("Wilson County", "TN", "US")
+    await cache.reverse(*cell_center(east))
+
+    await cache.reverse(*cell_center(cell))
+
+    assert inner.calls == 3
@@ -0,0 +1,21 @@
+from weather_travel_agent.geo import geohash
+
+
+def test_encode_known_value():
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_bounds_contain_point():
+    lat_lo, lat_hi, lon_lo, lon_hi = geohash.bounds(geohash.encode(36.16, -86.78, 6))
+    assert lat_lo <= 36.16 < lat_hi
+    assert lon_lo <= -86.78 < lon_hi
+
+
+def test_neighbours_surround_cell():
+    cell = geohash.encode(36.16, -86.78, 5)
+    cells = geohash.neighbours(cell)
+
+    assert len(cells) == 8
+    assert cell not in cells
+    assert all(len(c) == 5 for c in cells)
+    assert len(set(cells)) == 8
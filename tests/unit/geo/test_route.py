@@ -0,0 +1,80 @@
+import geopy.distance
+import numpy as np
+import pytest
+from googlemaps import convert
+
+from weather_travel_agent.geo.route import (
+    cumulative_distances,
+    decode_polyline,
+    sample_along,
+)
+
+
+@pytest.fixture
+def route():
+    # Atlanta -> Chattanooga -> Nashville with a few intermediate vertices
+    return [
+        (33.749, -84.388),
+        (34.2, -84.8),
+        (35.0456, -85.3097),
+        (35.6, -86.1),
+        (36.1627, -86.7816),
+    ]
+
+
+@pytest.mark.parametrize("mode,tolerance_km", [("ellipsoidal", 0.05), ("haversine", 1.5)])
+def test_cumulative_distances_match_geodesic(route, mode, tolerance_km):
+    expected = cumulative_distances(route, mode="geodesic")
+    actual = cumulative_distances(route, mode=mode)
+
+    assert actual[0] == 0.0
+    assert np.all(np.diff(actual) > 0)
+    assert np.max(np.abs(actual - expected)) < tolerance_km
+
+
+def test_sample_along_interpolates_evenly_spaced_points(route):
+    total = cumulative_distances(route)[-1]
+    sampled = sample_along(route, km_interval=50, max_stops=30)
+
+    assert len(sampled) == int(total // 50) + 1
+    assert tuple(sampled[0]) == route[0]
+    assert tuple(sampled[-1]) == pytest.approx(route[-1])
+
+    gaps = [
+        geopy.distance.distance(a, b).km
+        for a, b in zip(sampled[:-1].tolist(), sampled[1:].tolist(), strict=True)
+    ]
+    assert max(gaps) - min(gaps) < 1.0
+
+
+def test_sample_along_respects_max_stops(route):
+    assert len(sample_along(route, km_interval=1, max_stops=5)) == 5
+    assert sample_along(route, km_interval=1, max_stops=1).tolist() == [list(route[0])]
+
+
+def test_sample_along_degenerate_routes():
+    assert len(sample_along([], km_interval=5, max_stops=10)) == 0
+    assert sample_along([(1.0, 2.0), (1.0, 2.0)], km_interval=5, max_stops=10).tolist() == [
+        [1.0, 2.0]
+    ]
+
+
+def test_unknown_mode_raises(route):
+    with pytest.raises(ValueError):
+        cumulative_distances(route, mode="flat")
+
+
+def test_decode_polyline_matches_googlemaps(route):
+    rng = np.random.default_rng(3)
+    far = [tuple(p) for p in rng.uniform([-89, -179], [89, 179], size=(500, 2))]
+
+    for coords in (route, far, [(0.0, 0.0)]):
+        encoded = convert.encode_polyline(coords)
+        expected = [(p["lat"], p["lng"]) for p in convert.decode_polyline(encoded)]
+        assert decode_polyline(encoded).tolist() == [list(p) for p in expected]
+
+
+def test_decode_polyline_edge_cases():
+    assert decode_polyline("").shape == (0, 2)
+    with pytest.raises(ValueError):
+        decode_polyline(convert.encode_polyline([(38.5, -120.2)])[:-1])
@@ -0,0 +1,267 @@
+# tests/unit/handlers/test_a2a.py
+import asyncio
+
+import pytest
+from a2a.server.agent_execution import RequestContext
+from a2a.types import (
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+
+from weather_travel_agent.handlers.a2a import WeatherTravelExecutor
+from weather_travel_agent.models.chat import ChatIn
+
+
+class FakeGraph:
+    def __init__(self, updates):
+        self.updates = updates
+
+    async def astream(self, state, stream_mode=("updates", "custom"), **kwargs):
+        for update in self.updates:
+            if "custom" in update:
+                yield "custom", update["custom"]
+            else:
+                yield "updates", update
+
+
+class CollectingQueue:
+    def __init__(self):
+        self.events = []
+
+    async def enqueue_event(self, event):
+        self.events.append(event)
+
+
+def request_context(text="from Atlanta to Nashville"):
+    message = Message(
+        message_id="m1",
+        role=Role.user,
+        parts=[Part(root=TextPart(text=text))],
+    )
+    return RequestContext(request=MessageSendParams(message=message), task_id="t1", context_id="c1")
+
+
+TRIP_UPDATES = [
+    {"gather_trip": {"origin": "Atlanta", "destination": "Nashville", "gather_path": "rule"}},
+    {"get_directions": {"route": {"legs": [{"distance": {"text": "250 mi"}, "duration": {"text": "4 hours"}}]}}},
+    {"extract_cities": {"stops": [{"name": "Atlanta", "lat": 33.7, "lon": -84.4}]}},
+    {"custom": {"type": "forecast", "index": 0, "total": 1, "forecast": {"name": "Atlanta", "summary": "Clear"}}},
+    {"get_weather": {"forecasts": [{"name": "Atlanta", "lat": 33.7, "lon": -84.4, "summary": "Clear"}]}},
+    {"custom": {"type": "summary_token", "text": "Sunny "}},
+    {"custom": {"type": "summary_token", "text": "drive!"}},
+    {"share_forecast": {"reply": "Sunny drive!"}},
+]
+
+
+@pytest.mark.asyncio
+async def test_execute_streams_progress_per_node():
+    queue = CollectingQueue()
+
+    await WeatherTravelExecutor(FakeGraph(TRIP_UPDATES)).execute(request_context(), queue)
+
+    assert isinstance(queue.events[0], Task)
+    statuses = [e for e in queue.events if isinstance(e, TaskStatusUpdateEvent)]
+    artifacts = [e for e in queue.events if isinstance(e, TaskArtifactUpdateEvent)]
+
+    progress = [s.status.message.parts[0].root.text for s in statuses[1:-1]]
+    assert progress == [
+        "Planning a trip from Atlanta to Nashville.",
+        "Found a route (250 mi, 4 hours).",
+        "Found 1 stops along the route, checking the weather.",
+        "Forecasts are in, writing up a summary.",
+    ]
+    assert statuses[1].status.message.metadata == {"gather_path": "rule"}
+    assert [a.artifact.name for a in artifacts] == [
+        "stops", "forecasts", "forecasts", "trip", "summary", "summary", "summary"
+    ]
+    per_stop, closing = artifacts[1], artifacts[2]
+    assert per_stop.artifact.parts[0].root.data["forecast"]["summary"] == "Clear"
+    assert closing.append and closing.last_chunk
+    assert closing.artifact.artifact_id == per_stop.artifact.artifact_id
+
+    trip = artifacts[3].artifact.parts[0].root.data
+    assert trip["origin"] == "Atlanta" and trip["forecasts"][0]["summary"] == "Clear"
+    summary = [a.artifact.parts[0].root.text for a in artifacts[4:]]
+    assert summary == ["Sunny ", "drive!", ""]
+    assert [a.append for a in artifacts[4:]] == [False, True, True]
+    assert artifacts[-1].last_chunk
+
+    final = statuses[-1]
+    assert final.final and final.status.state == TaskState.completed
+    assert final.status.message.parts[0].root.text == "Sunny drive!"
+    assert final.status.message.parts[1].root.data["destination"] == "Nashville"
+
+
+@pytest.mark.asyncio
+async def test_execute_asks_for_input_when_trip_incomplete():
+    queue = CollectingQueue()
+    graph = FakeGraph([{"gather_trip": {"need": "Where are you headed?"}}])
+
+    await WeatherTravelExecutor(graph).execute(request_context("hi"), queue)
+
+    final = queue.events[-1]
+    assert final.final and final.status.state == TaskState.input_required
+    assert final.status.message.parts[0].root.text == "Where are you headed?"
+    assert not any(isinstance(e, TaskArtifactUpdateEvent) for e in queue.events)
+
+
+@pytest.mark.asyncio
+async def test_execute_fails_the_task_when_the_graph_raises():
+    class BrokenGraph:
+        async def astream(self, state, **kwargs):
+            raise RuntimeError("directions backend down")
+            yield
+
+    queue = CollectingQueue()
+
+    await WeatherTravelExecutor(BrokenGraph()).execute(request_context(), queue)
+
+    final = queue.events[-1]
+    assert final.final and final.status.state == TaskState.failed
+    assert "directions backend down" in final.status.message.parts[0].root.text
+
+
+@pytest.mark.asyncio
+async def test_cut_off_summary_is_replaced_by_the_fallback_reply():
+    updates = TRIP_UPDATES[:-3] + [
+        {"custom": {"type": "summary_token", "text": "Sunny "}},
+        {"share_forecast": {"reply": "Trip from Atlanta to Nashville"}},
+    ]
+    queue = CollectingQueue()
+
+    await WeatherTravelExecutor(FakeGraph(updates)).execute(request_context(), queue)
+
+    summary = [
+        e for e in queue.events
+        if isinstance(e, TaskArtifactUpdateEvent) and e.artifact.name == "summary"
+    ]
+    assert [(e.append, e.last_chunk) for e in summary] == [(False, False), (False, True)]
+    assert summary[-1].artifact.parts[0].root.text == "Trip from Atlanta to Nashville"
+
+
+@pytest.mark.asyncio
+async def test_execute_streams_pipelined_stops_and_forecasts():
+    queue = CollectingQueue()
+    stop = {"name": "Atlanta", "lat": 33.7, "lon": -84.4}
+    graph = FakeGraph([
+        {"gather_trip": {"origin": "Atlanta", "destination": "Nashville"}},
+        {"custom": {"type": "stops", "stops": [stop]}},
+        {"custom": {"type": "forecast", "index": 0, "forecast": {**stop, "summary": "Clear"}}},
+        {"route_weather": {"stops": [stop], "forecasts": [{**stop, "summary": "Clear"}]}},
+        {"share_forecast": {"reply": "Clear skies"}},
+    ])
+
+    await WeatherTravelExecutor(graph).execute(request_context(), queue)
+
+    artifacts = [e for e in queue.events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [a.artifact.name for a in artifacts] == [
+        "stops", "forecasts", "forecasts", "trip", "summary"
+    ]
+    assert artifacts[2].last_chunk
+    assert artifacts[3].artifact.parts[0].root.data["stops"] == [stop]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_task_store_persists_tasks(tmp_path, monkeypatch):
+    from weather_travel_agent.handlers.a2a import close_task_store, create_task_store
+
+    path = str(tmp_path / "tasks.sqlite3")
+    monkeypatch.setattr("weather_travel_agent.handlers.a2a.settings.task_store", "sqlite")
+    monkeypatch.setattr("weather_travel_agent.handlers.a2a.settings.task_store_path", path)
+    task = Task(
+        id="t1", context_id="c1", status=TaskStatus(state=TaskState.working), history=[]
+    )
+
+    store = create_task_store()
+    await store.save(task)
+    await close_task_store(store)
+
+    # A second store on the same file, as another worker would open it
+    other = create_task_store()
+    try:
+        loaded = await other.get("t1")
+    finally:
+        await close_task_store(other)
+
+    assert loaded.context_id == "c1" and loaded.status.state == TaskState.working
+
+
+class SlowTripGraph:
+    """Gathers the trip from the message, then slowly 'plans' it."""
+
+    def __init__(self):
+        self.plans = 0
+
+    async def astream(self, state, stream_mode=("updates", "custom"), **kwargs):
+        origin, destination = state["user_input"].split(" to ")
+        yield "updates", {"gather_trip": {"origin": origin, "destination": destination, "gather_path": "rule"}}
+        await asyncio.sleep(0.05)
+        self.plans += 1
+        yield "updates", {"get_directions": {"route": {"legs": []}}}
+        yield "custom", {"type": "summary_token", "text": f"plan {self.plans}"}
+        yield "updates", {"share_forecast": {"reply": f"plan {self.plans}"}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_for_the_same_trip_share_one_run():
+    graph = SlowTripGraph()
+    executor = WeatherTravelExecutor(graph, coalesce=True)
+    seen = {"a": [], "b": [], "c": []}
+
+    def recorder(name):
+        async def on_update(node, update, state):
+            seen[name].append(node)
+        return on_update
+
+    a, b, c = await asyncio.gather(
+        executor._process_chat(ChatIn(message="Atlanta to Nashville"), on_update=recorder("a")),
+        executor._process_chat(ChatIn(message="atlanta to Nashville"), on_update=recorder("b")),
+        executor._process_chat(ChatIn(message="Denver to Boise"), on_update=recorder("c")),
+    )
+
+    assert graph.plans == 2
+    assert a.reply == b.reply and a.reply != c.reply
+    assert b.origin == "atlanta"
+    assert seen["a"] == seen["b"] == seen["c"] == ["gather_trip", "get_directions", "share_forecast"]
+    assert executor.flights == {}
+
+
+@pytest.mark.asyncio
+async def test_follower_keeps_going_when_the_leader_leaves():
+    graph = SlowTripGraph()
+    executor = WeatherTravelExecutor(graph, coalesce=True)
+
+    leader = asyncio.create_task(executor._process_chat(ChatIn(message="Atlanta to Nashville")))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(executor._process_chat(ChatIn(message="Atlanta to Nashville")))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    result = await follower
+    assert result.reply == "plan 1"
+    assert graph.plans == 1
+
+
+@pytest.mark.asyncio
+async def test_precomputed_hot_route_publishes_the_whole_trip():
+    queue = CollectingQueue()
+    stop = {"name": "Atlanta", "lat": 33.7, "lon": -84.4, "summary": "Clear"}
+    graph = FakeGraph([
+        {"gather_trip": {"origin": "Atlanta", "destination": "Nashville"}},
+        {"hot_route": {"hot_route": True, "stops": [stop], "forecasts": [stop], "reply": "Clear skies"}},
+    ])
+
+    await WeatherTravelExecutor(graph, coalesce=False).execute(request_context(), queue)
+
+    artifacts = [e for e in queue.events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [a.artifact.name for a in artifacts] == ["stops", "forecasts", "trip", "summary"]
+    assert artifacts[-1].artifact.parts[0].root.text == "Clear skies"
+    assert queue.events[-1].status.message.parts[0].root.text == "Clear skies"
@@ -0,0 +1,165 @@
+# tests/unit/handlers/test_batch.py
+import json
+
+import httpx
+import pytest
+from a2a.server.agent_execution import RequestContext
+from a2a.types import (
+    DataPart,
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    TaskArtifactUpdateEvent,
+    TaskState,
+)
+from fastapi import FastAPI
+
+from weather_travel_agent.agent.planner import TripPlanner
+from weather_travel_agent.handlers.a2a import WeatherTravelExecutor
+from weather_travel_agent.handlers.batch import create_batch_router
+
+
+class Stages:
+    def __init__(self):
+        self.planned = []
+
+    async def get_directions(self, state):
+        self.planned.append((state["origin"], state["destination"]))
+        if state["destination"] == "Nowhere":
+            return {"need": "No route found"}
+        return {"route": {"legs": []}}
+
+    async def get_weather(self, state):
+        return {"stops": [{"name": state["origin"]}], "forecasts": [{"summary": "Clear"}]}
+
+
+async def summarize(state):
+    return {"reply": "Clear skies"}
+
+
+def app_for(planner):
+    app = FastAPI()
+    app.include_router(create_batch_router(planner))
+    return app
+
+
+async def post(app, body):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post("/trips/batch", json=body)
+
+
+TRIPS = [
+    {"origin": "Atlanta", "destination": "Nashville", "id": "truck-1"},
+    {"origin": "atlanta", "destination": "nashville", "id": "truck-2"},
+    {"origin": "Denver", "destination": "Nowhere"},
+]
+
+
+@pytest.mark.asyncio
+async def test_batch_streams_ndjson_results_per_trip():
+    stages = Stages()
+    planner = TripPlanner([stages.get_directions, stages.get_weather], summarize=summarize)
+
+    resp = await post(app_for(planner), {"trips": TRIPS})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    results = {line["index"]: line for line in lines[:-1]}
+
+    assert len(stages.planned) == 2
+    assert results[0]["id"] == "truck-1" and results[1]["id"] == "truck-2"
+    assert results[0]["forecasts"] == results[1]["forecasts"] == [{"summary": "Clear"}]
+    assert results[1]["origin"] == "atlanta"
+    assert "reply" not in results[0]
+    assert results[2]["error"] == "No route found"
+    assert lines[-1] == {
+        "done": True,
+        "trips": 3,
+        "planned": 3,
+        "failed": 1,
+        "distinct_trips": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_done_line_counts_duplicate_trips_individually():
+    stages = Stages()
+    planner = TripPlanner([stages.get_directions, stages.get_weather])
+    trips = [{"origin": "Denver", "destination": "Nowhere"}] * 10
+
+    resp = await post(app_for(planner), {"trips": trips})
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(stages.planned) == 1
+    assert len(lines) == 11
+    assert lines[-1] == {
+        "done": True,
+        "trips": 10,
+        "planned": 10,
+        "failed": 10,
+        "distinct_trips": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_summaries_are_opt_in():
+    stages = Stages()
+    planner = TripPlanner([stages.get_directions, stages.get_weather], summarize=summarize)
+
+    resp = await post(app_for(planner), {"trips": TRIPS[:1], "summarize": True})
+
+    assert json.loads(resp.text.splitlines()[0])["reply"] == "Clear skies"
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_oversized_requests(monkeypatch):
+    monkeypatch.setattr("weather_travel_agent.handlers.batch.settings.batch_max_trips", 2)
+    planner = TripPlanner([Stages().get_directions])
+
+    resp = await post(app_for(planner), {"trips": TRIPS})
+
+    assert resp.status_code == 413
+
+
+class CollectingQueue:
+    def __init__(self):
+        self.events = []
+
+    async def enqueue_event(self, event):
+        self.events.append(event)
+
+
+@pytest.mark.asyncio
+async def test_a2a_batch_streams_trip_artifacts():
+    stages = Stages()
+    planner = TripPlanner([stages.get_directions, stages.get_weather])
+    executor = WeatherTravelExecutor(graph=None, planner=planner)
+    message = Message(
+        message_id="m1",
+        role=Role.user,
+        parts=[Part(root=DataPart(data={"trips": TRIPS}))],
+    )
+    context = RequestContext(
+        request=MessageSendParams(message=message), task_id="t1", context_id="c1"
+    )
+    queue = CollectingQueue()
+
+    await executor.execute(context, queue)
+
+    artifacts = [e for e in queue.events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [a.artifact.name for a in artifacts] == ["trips", "trips", "trips"]
+    assert [a.append for a in artifacts] == [False, True, True]
+    assert artifacts[-1].last_chunk
+    assert len({a.artifact.artifact_id for a in artifacts}) == 1
+
+    results = [p.root.data for a in artifacts[:-1] for p in a.artifact.parts]
+    assert sorted(r["index"] for r in results) == [0, 1, 2]
+    done = artifacts[-1].artifact.parts[0].root.data
+    assert (done["planned"], done["failed"], done["distinct_trips"]) == (3, 1, 2)
+
+    final = queue.events[-1]
+    assert final.final and final.status.state == TaskState.completed
+    assert final.status.message.parts[0].root.text == "Planned 2 of 3 trips."
@@ -0,0 +1,56 @@
+import pytest
+from prometheus_client import REGISTRY, generate_latest
+
+from weather_travel_agent.cache.stats import cache_stats, prefetch_stats
+from weather_travel_agent.telemetry import external_call, instrument_node
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_instrumented_node_records_latency_and_errors():
+    async def ok(state):
+        return {"route": {}}
+
+    async def broken(state):
+        raise RuntimeError("boom")
+
+    before = sample("weather_agent_node_duration_seconds_count", node="test_ok")
+
+    assert await instrument_node("test_ok", ok)({}) == {"route": {}}
+    with pytest.raises(RuntimeError):
+        await instrument_node("test_broken", broken)({})
+
+    assert sample("weather_agent_node_duration_seconds_count", node="test_ok") == before + 1
+    assert sample("weather_agent_node_errors_total", node="test_broken") >= 1
+    assert sample("weather_agent_node_in_progress", node="test_ok") == 0
+
+
+def test_external_calls_are_labelled_by_service_and_operation():
+    with external_call("test_service", "lookup"):
+        assert sample(
+            "weather_agent_external_call_in_progress", service="test_service", operation="lookup"
+        ) == 1
+
+    with pytest.raises(ValueError), external_call("test_service", "lookup"):
+        raise ValueError("bad response")
+
+    labels = {"service": "test_service", "operation": "lookup"}
+    assert sample("weather_agent_external_call_duration_seconds_count", **labels) == 2
+    assert sample("weather_agent_external_call_errors_total", **labels) == 1
+
+
+def test_stats_registry_is_exported():
+    stats = cache_stats("test_metrics_cache")
+    stats.hit("memory")
+    stats.miss()
+    prefetch_stats("test_metrics_prefetch").started += 3
+
+    text = generate_latest().decode()
+
+    assert 'weather_agent_cache_hits_total{cache="test_metrics_cache"} 1.0' in text
+    assert 'weather_agent_cache_tier_lookups_total{cache="test_metrics_cache",tier="memory"} 1.0' in text
+    assert 'weather_agent_cache_hit_ratio{cache="test_metrics_cache"} 0.5' in text
+    assert 'weather_agent_stat{component="test_metrics_prefetch",stat="started"} 3.0' in text